@@ -0,0 +1,38 @@
+from time import perf_counter
+from typing import List, Dict, Any
+
+from skelet import Storage, Field
+
+
+def create_wide_class(number_of_fields: int) -> type:
+    namespace: Dict[str, Any] = {'__annotations__': {}}
+    for index in range(number_of_fields):
+        namespace['__annotations__'][f'field_{index}'] = 'List[int]' if index % 2 else int
+        namespace[f'field_{index}'] = Field(default_factory=list) if index % 2 else Field(index)
+    namespace['List'] = List
+
+    return type('WideSettings', (Storage,), namespace)
+
+
+def create_deep_class(depth: int, fields_per_class: int) -> type:
+    base: type = Storage
+    for level in range(depth):
+        namespace: Dict[str, Any] = {'__annotations__': {}}
+        for index in range(fields_per_class):
+            namespace['__annotations__'][f'field_{level}_{index}'] = int
+            namespace[f'field_{level}_{index}'] = Field(index)
+        base = type(f'Level{level}', (base,), namespace)
+
+    return base
+
+
+def measure(title: str, function: Any, *arguments: Any) -> None:
+    start = perf_counter()
+    function(*arguments)
+    print(f'{title}: {perf_counter() - start:.4f} s')
+
+
+if __name__ == '__main__':
+    measure('1000 fields in one class', create_wide_class, 1000)
+    measure('5000 fields in one class', create_wide_class, 5000)
+    measure('100 levels of inheritance, 10 fields each', create_deep_class, 100, 10)
@@ -1,11 +1,17 @@
 from simtypes import NaturalNumber as NaturalNumber, NonNegativeInt as NonNegativeInt  # noqa: F401
 
 from skelet.fields.base import Field as Field  # noqa: F401
-from skelet.storage import Storage as Storage  # noqa: F401
+from skelet.storage import Storage as Storage, refresh_all as refresh_all  # noqa: F401
+from skelet.watching import watch as watch, Change as Change  # noqa: F401
+from skelet.overlays import overlay as overlay  # noqa: F401
+from skelet.table import StorageTable as StorageTable  # noqa: F401
+from skelet.validation import validate_many as validate_many, ValidationResult as ValidationResult  # noqa: F401
+from skelet.indexes import query as query, AnyOf as AnyOf  # noqa: F401
 
 from skelet.sources.toml import TOMLSource as TOMLSource  # noqa: F401
 from skelet.sources.json import JSONSource as JSONSource  # noqa: F401
 from skelet.sources.yaml import YAMLSource as YAMLSource  # noqa: F401
 from skelet.sources.env import EnvSource as EnvSource  # noqa: F401
 from skelet.sources.memory import MemorySource as MemorySource  # noqa: F401
+from skelet.sources.cached import CachedSource as CachedSource  # noqa: F401
 from skelet.sources.getter_for_libraries import for_tool as for_tool  # noqa: F401
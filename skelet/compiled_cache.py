@@ -0,0 +1,142 @@
+from typing import List, Dict, Set, Tuple, FrozenSet, NamedTuple, Hashable, Union, Optional, Any
+from pathlib import Path
+from types import CodeType, ModuleType
+from threading import Lock
+from hashlib import sha256
+from pickle import dumps, load, HIGHEST_PROTOCOL
+from tempfile import NamedTemporaryFile
+from os import replace
+from sys import version
+
+from skelet.sources.abstract import AbstractSource
+
+
+class CacheEntry(NamedTuple):
+    key: str
+    values: Dict[str, Any]
+    positions: Dict[str, int]
+    absent: FrozenSet[str]
+
+class CompiledCache:
+    def __init__(self, directory: Union[str, Path], storage_class: type) -> None:
+        self.directory = Path(directory)
+        self.storage_class = storage_class
+        self.path = self.directory / f'{sha256(f"{storage_class.__module__}.{storage_class.__qualname__}".encode()).hexdigest()}.pickle'
+        self.lock = Lock()
+        self.entry: Optional[CacheEntry] = None
+        self.schema: Optional[Tuple[Hashable, ...]] = None
+
+    def get_key(self, instance: Any) -> Optional[str]:
+        keys_by_sources: Dict[int, Tuple[AbstractSource, List[str]]] = {}
+
+        for field in self.storage_class.__fields__.values():  # type: ignore[attr-defined]
+            if field.secret:
+                continue
+            for source in field.get_sources(instance).sources:
+                keys_by_sources.setdefault(id(source), (source, []))[1].append(field.alias)
+
+        fingerprints = []
+        for source, keys in keys_by_sources.values():
+            fingerprint = source.fingerprint(keys)
+            if fingerprint is None:
+                return None
+            fingerprints.append(fingerprint)
+
+        return sha256(dumps((self.get_schema(), fingerprints), protocol=4)).hexdigest()
+
+    def get_schema(self) -> Tuple[Hashable, ...]:
+        if self.schema is None:
+            schema: List[Hashable] = [version]
+            for field_name, field in self.storage_class.__fields__.items():  # type: ignore[attr-defined]
+                validation: Hashable
+                if isinstance(field.validation, dict):
+                    validation = tuple((message, self.get_function_fingerprint(validator)) for message, validator in field.validation.items())
+                else:
+                    validation = self.get_function_fingerprint(field.validation)
+                schema.append((field_name, field.alias, field.secret, repr(field.type_hint), self.get_function_fingerprint(field.conversion), validation))
+            self.schema = tuple(schema)
+
+        return self.schema
+
+    @classmethod
+    def get_function_fingerprint(cls, function: Any, seen: Optional[Set[int]] = None) -> Hashable:
+        code = getattr(function, '__code__', None)
+        if code is None:
+            return repr(function)
+
+        seen = set() if seen is None else seen
+        if id(code) in seen:
+            return code.co_name
+        seen.add(id(code))
+
+        closure = []
+        for cell in getattr(function, '__closure__', None) or ():
+            try:
+                closure.append(cls.get_value_fingerprint(cell.cell_contents, seen))
+            except ValueError:
+                closure.append(None)
+
+        function_globals = getattr(function, '__globals__', {})
+        referenced_globals = tuple((name, cls.get_value_fingerprint(function_globals[name], seen)) for name in sorted(cls.get_referenced_names(code)) if name in function_globals)
+
+        return cls.get_code_fingerprint(code), tuple(closure), referenced_globals
+
+    @classmethod
+    def get_value_fingerprint(cls, value: Any, seen: Set[int]) -> Hashable:
+        if isinstance(value, ModuleType):
+            return value.__name__
+        return cls.get_function_fingerprint(value, seen)
+
+    @classmethod
+    def get_referenced_names(cls, code: CodeType) -> Set[str]:
+        names = set(code.co_names)
+        for constant in code.co_consts:
+            if isinstance(constant, CodeType):
+                names.update(cls.get_referenced_names(constant))
+
+        return names
+
+    @classmethod
+    def get_code_fingerprint(cls, code: CodeType) -> Hashable:
+        constants: List[Hashable] = []
+        for constant in code.co_consts:
+            if isinstance(constant, CodeType):
+                constants.append(cls.get_code_fingerprint(constant))
+            elif isinstance(constant, frozenset):
+                constants.append(tuple(sorted(repr(item) for item in constant)))
+            else:
+                constants.append(repr(constant))
+
+        return code.co_code, code.co_names, tuple(constants)
+
+    def load(self, key: str) -> Optional[CacheEntry]:
+        with self.lock:
+            if self.entry is None or self.entry.key != key:
+                try:
+                    with open(self.path, 'rb') as file:
+                        entry = load(file)
+                except Exception:
+                    return None
+
+                if not isinstance(entry, CacheEntry) or entry.key != key:
+                    return None
+                self.entry = entry
+
+            return self.entry
+
+    def save(self, entry: CacheEntry) -> None:
+        with self.lock:
+            self.entry = entry
+
+            try:
+                content = dumps(entry, protocol=HIGHEST_PROTOCOL)
+            except Exception:
+                return
+
+            try:
+                self.directory.mkdir(parents=True, exist_ok=True)
+                with NamedTemporaryFile('wb', dir=self.directory, suffix='.tmp', delete=False) as file:
+                    file.write(content)
+                replace(file.name, self.path)
+            except OSError:
+                pass
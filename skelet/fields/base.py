@@ -1,4 +1,4 @@
-from typing import TypeVar, Type, Any, Optional, Generic, Union, Callable, Dict, List, get_type_hints, get_origin, cast
+from typing import TypeVar, Type, Any, Optional, Generic, Union, Callable, Dict, List, Set, get_type_hints, get_origin, cast
 
 try:
     from types import EllipsisType  # type: ignore[attr-defined]
@@ -6,15 +6,20 @@ except ImportError:  # pragma: no cover
     EllipsisType = type(...)  # type: ignore[misc]
 
 from threading import Lock
+from weakref import WeakKeyDictionary
 from dataclasses import MISSING, _MISSING_TYPE
 from collections.abc import Sequence
 from sys import version_info
 
 from locklib import ContextLockProtocol
-from simtypes import check
 
-from skelet.storage import Storage
-from skelet.sources.abstract import AbstractSource
+from skelet.storage import Storage, ProposedValues, RefreshGroup, LAZY_DEFAULT, call_on_change, reload_sources, instances_lock
+from skelet.overlays import get_values_owner
+from skelet.indexes import FieldIndex
+from skelet.type_checkers import TypeChecker, get_type_checker
+from skelet.watching import Change, notify_subscribers
+from skelet.fields.checks_cache import ChecksCache, LOOSE_TYPE_CHECK, STRICT_TYPE_CHECK, VALIDATION
+from skelet.sources.abstract import AbstractSource, CheckedValue
 from skelet.sources.collection import SourcesCollection
 
 
@@ -44,10 +49,23 @@ class Field(Generic[ValueType]):
         reverse_conflicts: bool = True,
         conversion: Optional[Callable[[ValueType], ValueType]] = None,
         share_mutex_with: Optional[SequenceWithStrings] = None,
+        checks_cache_size: Optional[int] = None,
+        lazy: bool = False,
+        refresh_every: Optional[float] = None,
+        indexed: bool = False,
     ) -> None:
         if default_factory is not None and default is not MISSING:
             raise ValueError('You can define a default value or a factory for default values, but not all at the same time.')
 
+        if lazy and default_factory is None:
+            raise ValueError('The lazy mode can only be used together with a factory for default values.')
+
+        if lazy and indexed:
+            raise ValueError('The lazy mode cannot be used together with indexing.')
+
+        if refresh_every is not None and refresh_every <= 0:
+            raise ValueError('The refresh interval must be a positive number.')
+
         if conversion is not None and default is not MISSING:
             self._default_before_conversion: Union[ValueType, _MISSING_TYPE] = default
             self._default: Union[ValueType, _MISSING_TYPE] = conversion(default)
@@ -56,6 +74,10 @@ class Field(Generic[ValueType]):
             self._default = default
 
         self._default_factory = default_factory
+        self.lazy = lazy
+        self.refresh_every = refresh_every
+        self.refresh_group = RefreshGroup(refresh_every, lambda instance: [self.get_sources(instance)], self.update_from_sources) if refresh_every is not None else None
+        self.index = FieldIndex() if indexed else None
         self.read_only = read_only
         self.doc = doc
         self.alias = alias
@@ -68,18 +90,22 @@ class Field(Generic[ValueType]):
         self.reverse_conflicts_on = reverse_conflicts
         self.conversion = conversion
         self.share_mutex_with = share_mutex_with
+        self.checks_cache = ChecksCache(checks_cache_size) if checks_cache_size is not None else None
 
         self.name: Optional[str] = None
         self.base_class: Optional[Type[Storage]] = None
         self.exception: Optional[BaseException] = None
         self.type_hint = Any
+        self.type_checker: TypeChecker = get_type_checker(Any)
+        self.strict_type_checker: TypeChecker = get_type_checker(Any, strict=True)
 
         self.lock: ContextLockProtocol = Lock()
+        self.collections: 'WeakKeyDictionary[SourcesCollection, SourcesCollection]' = WeakKeyDictionary()
 
         if read_lock:
             self.real_get = self.locked_get  # type: ignore[method-assign]
         else:
-            self.real_get = self.unlocked_get  # type: ignore[method-assign]
+            self.real_get = self.optimistic_get  # type: ignore[method-assign]
 
     def __set_name__(self, owner: Type[Storage], name: str) -> None:
         if name.startswith('_'):
@@ -89,7 +115,11 @@ class Field(Generic[ValueType]):
             self.name = name
             if self.alias is None:
                 self.alias = self.name
-            self.type_hint = get_type_hints(owner).get(name, Any)
+            if '__type_hints__' not in owner.__dict__:
+                owner.__type_hints__ = get_type_hints(owner)
+            self.type_hint = owner.__type_hints__.get(name, Any)
+            self.type_checker = get_type_checker(self.type_hint)
+            self.strict_type_checker = get_type_checker(self.type_hint, strict=True)
 
             if self.base_class is not None:
                 self.raise_exception_in_storage(TypeError(f'{self.get_field_name_representation()} cannot be used in {owner.__name__} because it is already used in {self.base_class.__name__}.'), raising_on=False)
@@ -121,41 +151,161 @@ class Field(Generic[ValueType]):
         with self.get_field_lock(instance):
             return self.unlocked_get(instance, instance_class)
 
+    def optimistic_get(self, instance: Storage, instance_class: Type[Storage]) -> ValueType:
+        value = instance.__values__.get(cast(str, self.name))
+        if value is LAZY_DEFAULT:
+            return self.locked_get(instance, instance_class)
+        return cast(ValueType, value)
+
+    def get_assigned_value(self, instance: Storage) -> Any:
+        value = instance.__values__.get(cast(str, self.name))
+        if value is LAZY_DEFAULT:
+            return MISSING
+        return value
+
     def unlocked_get(self, instance: Storage, instance_class: Type[Storage]) -> ValueType:
-        return cast(ValueType, instance.__values__.get(cast(str, self.name)))
+        value = instance.__values__.get(cast(str, self.name))
+        if value is LAZY_DEFAULT:
+            value = self.compute_lazy_default(instance)
+        return cast(ValueType, value)
+
+    def compute_lazy_default(self, instance: Storage) -> ValueType:
+        instance = get_values_owner(instance, cast(str, self.name))
+        value = self.call_default_factory()
+        self.check_default_conflicts(instance, value)
+        instance.__values__[cast(str, self.name)] = value
+
+        return value
+
+    def call_default_factory(self) -> ValueType:
+        value = cast(Callable[[], ValueType], self._default_factory)()
+        self.check_type_hints(cast(Type[Storage], self.base_class), cast(str, self.name), value, strict=True, raise_all=True)
+        if self.validate_default:
+            self.check_value(value, raise_all=True)
+
+        return self.convert_checked_value(value)
+
+    def check_and_convert_from_source(self, checked_value: CheckedValue) -> ValueType:
+        value = checked_value.value
+        if checked_value.hint is not self.type_hint:
+            self.check_type_hints(cast(Type[Storage], self.base_class), cast(str, self.name), value, strict=True, raise_all=True)
+        self.check_value(value, raise_all=True)
+
+        return self.convert_checked_value(value)
+
+    def convert_checked_value(self, value: ValueType) -> ValueType:
+        if self.conversion is not None:
+            converted_value = self.conversion(value)
+            if converted_value is not value:
+                value = converted_value
+                self.check_type_hints(cast(Type[Storage], self.base_class), cast(str, self.name), value, strict=True, raise_all=True)
+            if self.validate_default:
+                self.check_value(value, raise_all=True)
+
+        return value
 
     def __set__(self, instance: Storage, value: ValueType) -> None:
         if self.read_only:
             raise AttributeError(f'{self.get_field_name_representation()} is read-only.')
 
+        self.update_value(instance, self.check_and_convert(value), only_if_changed=False)
+
+    def update_value(self, instance: Storage, value: ValueType, only_if_changed: bool) -> None:
+        with self.get_field_lock(instance):
+            old_value = self.get_assigned_value(instance)
+            if only_if_changed and value == old_value:
+                return
+            self.check_conflicts(instance, old_value, value)
+            self.check_overlays_conflicts(instance, old_value, value)
+
+            instance.__values__[cast(str, self.name)] = value
+            if value == old_value:
+                return
+            if self.index is not None:
+                self.index.move(instance, old_value, value)
+            if self.change_action is not None:
+                self.change_action(old_value, value, instance)
+            notify_subscribers(instance, cast(str, self.name), old_value, value)
+
+        call_on_change(instance, [Change(cast(str, self.name), old_value, value)])
+
+    def schedule_refresh(self, instance: Storage) -> None:
+        cast(RefreshGroup, self.refresh_group).add(instance)
+
+    def refresh(self, instance: Storage) -> None:
+        reload_sources([self.get_sources(instance)])
+        self.update_from_sources(instance)
+
+    def update_from_sources(self, instance: Storage) -> None:
+        collection = self.get_sources(instance)
+        checked_value = collection.checked_get(cast(str, self.alias), self.type_hint)  # type: ignore[arg-type]
+        if checked_value is not None:
+            self.update_value(instance, self.check_and_convert_from_source(checked_value), only_if_changed=True)
+
+    def check_and_convert(self, value: ValueType) -> ValueType:
         self.check_type_hints(cast(Type[Storage], self.base_class), cast(str, self.name), value, raise_all=True)
 
         if self.conversion is not None:
-            value = self.conversion(value)
-            self.check_type_hints(cast(Type[Storage], self.base_class), cast(str, self.name), value, raise_all=True)
+            converted_value = self.conversion(value)
+            if converted_value is not value:
+                value = converted_value
+                self.check_type_hints(cast(Type[Storage], self.base_class), cast(str, self.name), value, raise_all=True)
 
         self.check_value(value, raise_all=True)
 
-        with self.get_field_lock(instance):
-            old_value = self.unlocked_get(instance, type(instance))
-            if self.conflicts is not None:
-                for other_field_name, checker in self.conflicts.items():
-                    other_field = getattr(type(instance), other_field_name)
-                    other_field_value = other_field.unlocked_get(instance, type(instance))
-                    if checker(old_value, value, other_field_value, other_field_value):
-                        raise ValueError(f'The new {self.get_value_representation(value)} value of the {self.get_field_name_representation()} conflicts with the {other_field.get_value_representation(other_field_value)} value of the {other_field.get_field_name_representation()}.')
-
-            if self.name in instance.__reverse_conflicts__:
-                for other_field_name in instance.__reverse_conflicts__[self.name]:
-                    other_field = getattr(type(instance), other_field_name)
-                    other_field_value = other_field.unlocked_get(instance, type(instance))
-                    other_field_checker = other_field.conflicts[self.name]
-                    if other_field_checker(other_field_value, other_field_value, old_value, value):
-                        raise ValueError(f'The new {self.get_value_representation(value)} value of the {self.get_field_name_representation()} conflicts with the {other_field.get_value_representation(other_field_value)} value of the {other_field.get_field_name_representation()}.')
-
-            instance.__values__[cast(str, self.name)] = value
-            if self.change_action is not None and value != old_value:
-                self.change_action(old_value, value, instance)
+        return value
+
+    def check_conflicts(self, instance: Storage, old_value: ValueType, value: ValueType, proposed: Optional[ProposedValues] = None) -> None:
+        if self.conflicts is not None:
+            for other_field_name, checker in self.conflicts.items():
+                other_field = getattr(type(instance), other_field_name)
+                other_field_value = other_field.get_proposed_value(instance, proposed)
+                if checker(old_value, value, other_field_value, other_field_value):
+                    raise ValueError(f'The new {self.get_value_representation(value)} value of the {self.get_field_name_representation()} conflicts with the {other_field.get_value_representation(other_field_value)} value of the {other_field.get_field_name_representation()}.')
+
+        if self.name in instance.__reverse_conflicts__:
+            for other_field_name in instance.__reverse_conflicts__[self.name]:
+                other_field = getattr(type(instance), other_field_name)
+                other_field_value = other_field.get_proposed_value(instance, proposed)
+                other_field_checker = other_field.conflicts[self.name]
+                if other_field_checker(other_field_value, other_field_value, old_value, value):
+                    raise ValueError(f'The new {self.get_value_representation(value)} value of the {self.get_field_name_representation()} conflicts with the {other_field.get_value_representation(other_field_value)} value of the {other_field.get_field_name_representation()}.')
+
+    def check_overlays_conflicts(self, instance: Storage, old_value: ValueType, value: ValueType, proposed: Optional[ProposedValues] = None) -> None:
+        if instance.__overlays__ is None:
+            return
+
+        with instances_lock:
+            overlays = list(instance.__overlays__)
+
+        for overlay in overlays:
+            if self.name not in overlay.__values__:
+                self.check_conflicts(overlay, old_value, value, proposed)
+                self.check_overlays_conflicts(overlay, old_value, value, proposed)
+
+    def get_proposed_value(self, instance: Storage, proposed: Optional[ProposedValues]) -> ValueType:
+        if proposed is not None:
+            owner, values = proposed
+            if self.name in values and get_values_owner(instance, cast(str, self.name)) is owner:
+                return cast(ValueType, values[cast(str, self.name)])
+
+        return self.unlocked_get(instance, type(instance))
+
+    def check_default_conflicts(self, instance: Storage, value: ValueType) -> None:
+        if self.conflicts is not None:
+            for other_field_name, checker in self.conflicts.items():
+                other_field = getattr(type(instance), other_field_name)
+                other_field_value = instance.__values__[other_field_name]
+                if other_field_value is not LAZY_DEFAULT and checker(value, value, other_field_value, other_field_value):
+                    raise ValueError(f'The {self.get_value_representation(value)} deferred default value of the {self.get_field_name_representation()} conflicts with the {other_field.get_value_representation(other_field_value)} value of the {other_field.get_field_name_representation()}.')
+
+        if self.name in instance.__reverse_conflicts__:
+            for other_field_name in instance.__reverse_conflicts__[self.name]:
+                other_field = getattr(type(instance), other_field_name)
+                other_field_value = instance.__values__[other_field_name]
+                checker = other_field.conflicts[self.name]
+                if other_field_value is not LAZY_DEFAULT and checker(other_field_value, other_field_value, value, value):
+                    raise ValueError(f'The {other_field.get_value_representation(other_field_value)} deferred default value of the {other_field.get_field_name_representation()} conflicts with the {self.get_value_representation(value)} value of the {self.get_field_name_representation()}.')
 
     def __delete__(self, instance: Any) -> None:
         raise AttributeError(f"You can't delete the {self.get_field_name_representation()} value.")
@@ -163,28 +313,36 @@ class Field(Generic[ValueType]):
     def set_field_names(self, owner: Type[Storage], name: str) -> None:
         if '__field_names__' not in owner.__dict__:
             owner.__field_names__ = []
-            known_names = set()
+            owner.__field_names_set__ = set()
+            covered_parents: Set[type] = set()
             for parent in owner.__mro__:  # pragma: no branch
-                if parent is owner:
+                if parent is owner or parent in covered_parents or '__field_names__' not in parent.__dict__:
                     continue
                 elif parent is Storage:
                     break
                 else:
+                    covered_parents.update(parent.__mro__)
                     for field_name in cast(Storage, parent).__field_names__:
-                        if field_name not in known_names:
-                            known_names.add(field_name)
+                        if field_name not in owner.__field_names_set__:
+                            owner.__field_names_set__.add(field_name)
                             owner.__field_names__.append(field_name)
-        else:
-            known_names = set(owner.__field_names__)
 
-        if name not in known_names:  # pragma: no branch
+        if name not in owner.__field_names_set__:  # pragma: no branch
+            owner.__field_names_set__.add(name)
             owner.__field_names__.append(name)
 
     def check_type_hints(self, owner: Type[Storage], name: str, value: ValueType, strict: bool = False, raise_all: bool = False) -> None:
-        if not check(value, self.type_hint, strict=strict):  # type: ignore[arg-type]
+        check_flag = STRICT_TYPE_CHECK if strict else LOOSE_TYPE_CHECK
+        if self.checks_cache is not None and self.checks_cache.passed(value, check_flag):
+            return
+
+        checker = self.strict_type_checker if strict else self.type_checker
+        if not checker(value):
             origin = get_origin(self.type_hint)
             type_hint_name = self.type_hint.__name__ if origin is None else origin.__name__ if hasattr(origin, '__name__') else repr(origin)  # type: ignore[attr-defined]
             self.raise_exception_in_storage(TypeError(f'The value {self.get_value_representation(value)} of the {self.get_field_name_representation()} does not match the type {type_hint_name}.'), raise_all)
+        elif self.checks_cache is not None:
+            self.checks_cache.remember(value, check_flag | LOOSE_TYPE_CHECK)
 
     def get_field_name_representation(self) -> str:
         if self.doc is None:
@@ -193,14 +351,23 @@ class Field(Generic[ValueType]):
 
     def check_value(self, value: ValueType, raise_all: bool = False) -> None:
         if self.validation is not None:
+            if self.checks_cache is not None and self.checks_cache.passed(value, VALIDATION):
+                return
+
+            passed = True
             if isinstance(self.validation, dict):
                 for message, validator in self.validation.items():
                     if not validator(value):
+                        passed = False
                         self.raise_exception_in_storage(ValueError(message), raise_all)
             else:
                 if not self.validation(value):
+                    passed = False
                     self.raise_exception_in_storage(ValueError(f'The value {self.get_value_representation(value)} of the {self.get_field_name_representation()} does not match the validation.'), raise_all)
 
+            if passed and self.checks_cache is not None:
+                self.checks_cache.remember(value, VALIDATION)
+
     def get_field_lock(self, instance: Storage) -> ContextLockProtocol:
         return instance.__locks__[cast(str, self.name)]
 
@@ -217,6 +384,10 @@ class Field(Generic[ValueType]):
         if self.sources is None:
             return instance.__sources__
 
+        collection = self.collections.get(instance.__sources__)
+        if collection is not None:
+            return collection
+
         result = []
         there_is_ellipsis = False
 
@@ -229,4 +400,7 @@ class Field(Generic[ValueType]):
         if there_is_ellipsis:
            result.extend(instance.__sources__.sources)
 
-        return SourcesCollection(result)
+        collection = SourcesCollection(result)
+        self.collections[instance.__sources__] = collection
+
+        return collection
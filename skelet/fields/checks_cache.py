@@ -0,0 +1,64 @@
+from typing import Hashable, Optional, Any
+from collections import OrderedDict
+from threading import Lock
+
+
+LOOSE_TYPE_CHECK = 1
+STRICT_TYPE_CHECK = 2
+VALIDATION = 4
+
+SCALAR_TYPES = (int, float, complex, str, bytes, bool, type(None))
+
+
+class ChecksCache:
+    def __init__(self, max_size: int) -> None:
+        if max_size <= 0:
+            raise ValueError('The size of the checks cache must be a positive number.')
+
+        self.max_size = max_size
+        self.data: 'OrderedDict[Hashable, int]' = OrderedDict()
+        self.lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def passed(self, value: Any, check: int) -> bool:
+        key = self.make_key(value)
+        if key is None:
+            return False
+
+        with self.lock:
+            flags = self.data.get(key)
+            if flags is None:
+                return False
+            self.data.move_to_end(key)
+            return bool(flags & check)
+
+    def remember(self, value: Any, check: int) -> None:
+        key = self.make_key(value)
+        if key is None:
+            return
+
+        with self.lock:
+            self.data[key] = self.data.get(key, 0) | check
+            self.data.move_to_end(key)
+            if len(self.data) > self.max_size:
+                self.data.popitem(last=False)
+
+    @classmethod
+    def make_key(cls, value: Any) -> Optional[Hashable]:
+        value_type = type(value)
+
+        if value_type in SCALAR_TYPES:
+            return (value_type, value)
+
+        elif value_type is tuple or value_type is frozenset:
+            keys = []
+            for item in value:
+                key = cls.make_key(item)
+                if key is None:
+                    return None
+                keys.append(key)
+            return (value_type, value_type(keys))
+
+        return None
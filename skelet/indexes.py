@@ -0,0 +1,105 @@
+from typing import List, Dict, Set, Type, TypeVar, Iterable, Hashable, Optional, Any, cast
+from threading import Lock
+from weakref import WeakSet
+
+from skelet.storage import Storage
+
+
+StorageType = TypeVar('StorageType', bound=Storage)
+MIN_PRUNING_THRESHOLD = 64
+
+class AnyOf:
+    def __init__(self, *values: Any) -> None:
+        self.values = values
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({", ".join(repr(value) for value in self.values)})'
+
+class FieldIndex:
+    def __init__(self) -> None:
+        self.lock = Lock()
+        self.buckets: 'Dict[Hashable, WeakSet[Storage]]' = {}
+        self.unhashable: 'WeakSet[Storage]' = WeakSet()
+        self.pruning_threshold = MIN_PRUNING_THRESHOLD
+
+    def add(self, instance: Storage, value: Any) -> None:
+        with self.lock:
+            self.get_or_create_bucket(value).add(instance)
+            if len(self.buckets) > self.pruning_threshold:
+                self.prune()
+
+    def move(self, instance: Storage, old_value: Any, new_value: Any) -> None:
+        with self.lock:
+            bucket = self.get_bucket(old_value)
+            if bucket is None or instance not in bucket:
+                return
+
+            bucket.discard(instance)
+            if not bucket and bucket is not self.unhashable:
+                del self.buckets[old_value]
+            self.get_or_create_bucket(new_value).add(instance)
+
+    def find(self, values: Iterable[Any]) -> Set[Storage]:
+        result: Set[Storage] = set()
+
+        with self.lock:
+            for value in values:
+                bucket = self.get_bucket(value)
+                if bucket is not None:
+                    result.update(bucket)
+                    if not bucket and bucket is not self.unhashable:
+                        del self.buckets[value]
+
+        return result
+
+    def prune(self) -> None:
+        for value in [value for value, bucket in self.buckets.items() if not bucket]:
+            del self.buckets[value]
+        self.pruning_threshold = max(MIN_PRUNING_THRESHOLD, len(self.buckets) * 2)
+
+    def get_bucket(self, value: Any) -> 'Optional[WeakSet[Storage]]':
+        try:
+            return self.buckets.get(value)
+        except TypeError:
+            return self.unhashable
+
+    def get_or_create_bucket(self, value: Any) -> 'WeakSet[Storage]':
+        bucket = self.get_bucket(value)
+        if bucket is None:
+            bucket = self.buckets[value] = WeakSet()
+
+        return bucket
+
+
+def query(storage_class: Type[StorageType], **conditions: Any) -> List[StorageType]:
+    if not conditions:
+        raise ValueError('You must specify at least one condition.')
+
+    for field_name in conditions:
+        if field_name not in storage_class.__fields__:
+            raise KeyError(f'The "{field_name}" field is not defined.')
+        if storage_class.__fields__[field_name].index is None:
+            raise ValueError(f'The {storage_class.__fields__[field_name].get_field_name_representation()} is not indexed.')
+
+    candidates: Optional[Set[Storage]] = None
+
+    for field_name, condition in conditions.items():
+        field = storage_class.__fields__[field_name]
+        found = field.index.find(condition.values if isinstance(condition, AnyOf) else (condition,))
+        candidates = found if candidates is None else candidates & found
+        if not candidates:
+            return []
+
+    return [instance for instance in cast(Set[StorageType], candidates) if isinstance(instance, storage_class) and matches(instance, conditions)]
+
+
+def matches(instance: Storage, conditions: Dict[str, Any]) -> bool:
+    for field_name, condition in conditions.items():
+        value = instance.__values__[field_name]
+        if isinstance(condition, AnyOf):
+            if value not in condition.values:
+                return False
+        elif value != condition:
+            return False
+
+    return True
@@ -0,0 +1,55 @@
+from typing import Dict, Type, TypeVar, Any, cast
+from weakref import WeakSet
+
+from skelet.storage import Storage, check_explicit_fields, instances_lock
+
+
+StorageType = TypeVar('StorageType', bound=Storage)
+
+class OverlayValues(Dict[str, Any]):
+    def __init__(self, base: Storage) -> None:
+        super().__init__()
+        self.base = base
+
+    def __missing__(self, key: str) -> Any:
+        return self.base.__values__[key]
+
+    def get(self, key: str, default: Any = None) -> Any:  # type: ignore[override]
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+
+def get_values_owner(instance: Storage, field_name: str) -> Storage:
+    values = instance.__values__
+    while isinstance(values, OverlayValues) and field_name not in values:
+        instance = values.base
+        values = instance.__values__
+
+    return instance
+
+
+def overlay(base: StorageType, **overrides: Any) -> StorageType:
+    storage_class: Type[StorageType] = type(base)
+    check_explicit_fields(storage_class, overrides)
+
+    instance = cast(StorageType, object.__new__(storage_class))
+    instance.__values__ = OverlayValues(base)
+    instance.__locks__ = base.__locks__
+    instance.__explicit_fields__ = frozenset(overrides)
+    instance.__resolved_from__ = {}
+
+    for field_name, value in overrides.items():
+        instance.__values__[field_name] = storage_class.__fields__[field_name].check_and_convert(value)
+
+    for field_name in overrides:
+        value = instance.__values__[field_name]
+        storage_class.__fields__[field_name].check_conflicts(instance, value, value)
+
+    with instances_lock:
+        if base.__overlays__ is None:
+            base.__overlays__ = WeakSet()
+        base.__overlays__.add(instance)
+
+    return instance
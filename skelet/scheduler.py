@@ -0,0 +1,46 @@
+from typing import List, Tuple, Callable, Optional
+from threading import Thread, Condition
+from heapq import heappush, heappop
+from itertools import count
+from time import monotonic
+
+
+Task = Callable[[], Optional[float]]
+
+class Scheduler:
+    def __init__(self) -> None:
+        self.heap: List[Tuple[float, int, Task]] = []
+        self.counter = count()
+        self.condition = Condition()
+        self.thread: Optional[Thread] = None
+
+    def schedule(self, delay: float, task: Task) -> None:
+        with self.condition:
+            heappush(self.heap, (monotonic() + delay, next(self.counter), task))
+            if self.thread is None:
+                self.thread = Thread(target=self.run, daemon=True)
+                self.thread.start()
+            self.condition.notify()
+
+    def run(self) -> None:
+        while True:
+            with self.condition:
+                while not self.heap:
+                    self.condition.wait()
+                due_time, _, task = self.heap[0]
+                delay = due_time - monotonic()
+                if delay > 0:
+                    self.condition.wait(delay)
+                    continue
+                heappop(self.heap)
+
+            try:
+                next_delay = task()
+            except Exception:
+                next_delay = None
+
+            if next_delay is not None:
+                self.schedule(next_delay, task)
+
+
+scheduler = Scheduler()
@@ -1,8 +1,10 @@
-from typing import Optional, Any
+from typing import List, Dict, NamedTuple, Hashable, Optional, Any
 from abc import ABC, abstractmethod
 from typing import TypeVar, Type
+from threading import Lock
+from dataclasses import MISSING
 
-from simtypes import check
+from skelet.type_checkers import get_type_checker
 
 
 class SecondNone:
@@ -12,28 +14,86 @@ SECOND_NONE = SecondNone()
 
 ExpectedType = TypeVar('ExpectedType')
 
+class CheckedValue(NamedTuple):
+    value: Any
+    hint: Any
+
 class AbstractSource(ABC):
+    generation: int = 0
+    generation_lock = Lock()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+
+        if 'lookup' in cls.__dict__:
+            cls.native_lookup = cls.__dict__['lookup']  # type: ignore[method-assign]
+        elif '__getitem__' in cls.__dict__:
+            cls.lookup = AbstractSource.lookup_by_getitem  # type: ignore[method-assign]
+
     @abstractmethod
-    def __getitem__(self, key: str) -> Any:
+    def lookup(self, key: str) -> Any:
         ...  # pragma: no cover
 
-    def get(self, key: str, default: Any = None) -> Any:
+    def native_lookup(self, key: str) -> Any:
+        ...  # pragma: no cover
+
+    def lookup_by_getitem(self, key: str) -> Any:
         try:
-            result = self[key]
+            return self[key]
         except KeyError:
+            return MISSING
+
+    def __getitem__(self, key: str) -> Any:
+        result = self.native_lookup(key)
+        if result is MISSING:
+            raise KeyError(key)
+
+        return result
+
+    def get(self, key: str, default: Any = None) -> Any:
+        result = self.lookup(key)
+        if result is MISSING:
             return default
 
         return result
 
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        result = {}
+        for key in keys:
+            value = self.lookup(key)
+            if value is not MISSING:
+                result[key] = value
+
+        return result
+
     def type_awared_get(self, key: str, hint: Type[ExpectedType], default: Any = SECOND_NONE) -> Optional[ExpectedType]:
-        result = self.get(key, default)
+        result = self.lookup(key)
 
-        if result is default:
-            if default is SECOND_NONE:
+        if result is MISSING:
+            if isinstance(default, SecondNone):
                 return None
             return default
 
-        if not check(result, hint, strict=True):
+        return self.apply_type_hint(key, result, hint)
+
+    def apply_type_hint(self, key: str, value: Any, hint: Type[ExpectedType]) -> ExpectedType:
+        if not get_type_checker(hint, strict=True)(value):
             raise TypeError(f'The value of the "{key}" field did not pass the type check.')
 
-        return result
+        return value
+
+    def verifies_type_hint(self, hint: Any) -> bool:
+        return type(self).apply_type_hint is AbstractSource.apply_type_hint
+
+    def snapshot(self) -> Optional[Dict[str, Any]]:
+        return None
+
+    def lookup_is_overridden(self, source_class: Type[Any]) -> bool:
+        return type(self).lookup is not source_class.lookup
+
+    def fingerprint(self, keys: List[str]) -> Optional[Hashable]:
+        return None
+
+    def reload(self) -> None:
+        with AbstractSource.generation_lock:
+            AbstractSource.generation += 1
@@ -0,0 +1,119 @@
+from typing import List, Dict, Set, Type, TypeVar, NamedTuple, Hashable, Optional, Any
+from collections import OrderedDict
+from threading import Lock, Thread
+from time import monotonic
+from dataclasses import MISSING
+
+from printo import descript_data_object
+
+from skelet.sources.abstract import AbstractSource
+
+
+ExpectedType = TypeVar('ExpectedType')
+
+class CachedValue(NamedTuple):
+    value: Any
+    refresh_at: float
+    expires_at: float
+
+class CachedSource(AbstractSource):
+    def __init__(self, source: AbstractSource, ttl: float, max_entries: Optional[int] = None, refresh_ahead: float = 0.2) -> None:
+        if ttl <= 0:
+            raise ValueError('The TTL must be a positive number.')
+        if max_entries is not None and max_entries <= 0:
+            raise ValueError('The maximum number of entries must be a positive number.')
+        if not 0 <= refresh_ahead < 1:
+            raise ValueError('The share of the TTL for refreshing ahead must be in the range from 0 to 1.')
+
+        self.source = source
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.refresh_ahead = refresh_ahead
+
+        self.entries: 'OrderedDict[str, CachedValue]' = OrderedDict()
+        self.refreshing: Set[str] = set()
+        self.lock = Lock()
+
+    def __repr__(self) -> str:
+        return descript_data_object(type(self).__name__, (self.source,), {'ttl': self.ttl, 'max_entries': self.max_entries, 'refresh_ahead': self.refresh_ahead}, filters={'max_entries': lambda x: x is not None, 'refresh_ahead': lambda x: x != 0.2})
+
+    def lookup(self, key: str) -> Any:
+        values = self.get_cached([key])
+        if key in values:
+            return values[key]
+
+        value = self.source.lookup(key)
+        self.remember({key: value})
+        return value
+
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        values = self.get_cached(keys)
+
+        missed_keys = [key for key in keys if key not in values]
+        if missed_keys:
+            found_values = self.source.get_many(missed_keys)
+            new_values = {key: found_values.get(key, MISSING) for key in missed_keys}
+            self.remember(new_values)
+            values.update(new_values)
+
+        return {key: value for key, value in values.items() if value is not MISSING}
+
+    def get_cached(self, keys: List[str]) -> Dict[str, Any]:
+        now = monotonic()
+        result = {}
+        keys_to_refresh = []
+
+        with self.lock:
+            for key in keys:
+                entry = self.entries.get(key)
+                if entry is None or now >= entry.expires_at:
+                    continue
+
+                self.entries.move_to_end(key)
+                result[key] = entry.value
+                if now >= entry.refresh_at and key not in self.refreshing:
+                    self.refreshing.add(key)
+                    keys_to_refresh.append(key)
+
+        if keys_to_refresh:
+            Thread(target=self.refresh, args=(keys_to_refresh,), daemon=True).start()
+
+        return result
+
+    def remember(self, values: Dict[str, Any]) -> None:
+        now = monotonic()
+        entry_refresh_at = now + self.ttl * (1 - self.refresh_ahead)
+        entry_expires_at = now + self.ttl
+
+        with self.lock:
+            for key, value in values.items():
+                self.entries[key] = CachedValue(value, entry_refresh_at, entry_expires_at)
+                self.entries.move_to_end(key)
+
+            if self.max_entries is not None:
+                while len(self.entries) > self.max_entries:
+                    self.entries.popitem(last=False)
+
+    def refresh(self, keys: List[str]) -> None:
+        try:
+            found_values = self.source.get_many(keys)
+            self.remember({key: found_values.get(key, MISSING) for key in keys})
+        except Exception:
+            pass
+        finally:
+            with self.lock:
+                self.refreshing.difference_update(keys)
+
+    def apply_type_hint(self, key: str, value: Any, hint: Type[ExpectedType]) -> ExpectedType:
+        return self.source.apply_type_hint(key, value, hint)
+
+    def verifies_type_hint(self, hint: Any) -> bool:
+        return self.source.verifies_type_hint(hint)
+
+    def fingerprint(self, keys: List[str]) -> Optional[Hashable]:
+        return self.source.fingerprint(keys)
+
+    def reload(self) -> None:
+        with self.lock:
+            self.entries.clear()
+        self.source.reload()
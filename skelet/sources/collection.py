@@ -1,41 +1,174 @@
-from typing import List, Type, TypeVar, Optional, Any
+from typing import List, Dict, Tuple, Type, TypeVar, Optional, Any, cast
+from threading import Lock
+from dataclasses import MISSING
 
 from printo import descript_data_object
 
-from skelet.sources.abstract import AbstractSource, SecondNone
+from skelet.sources.abstract import AbstractSource, CheckedValue, SecondNone
 
 
 ExpectedType = TypeVar('ExpectedType')
+IndexEntry = Tuple[int, AbstractSource, Any]
+
+class IndexState:
+    def __init__(self, generation: int) -> None:
+        self.generation = generation
+        self.index: Dict[str, IndexEntry] = {}
+        self.snapshots: List[Optional[Dict[str, Any]]] = []
+        self.probing_sources: List[Tuple[int, AbstractSource]] = []
 
 class SourcesCollection(AbstractSource):
     def __init__(self, sources: List[AbstractSource]) -> None:
         self.sources = sources
+        self.index_lock = Lock()
+        self.reset_index()
 
-    def __getitem__(self, key: str) -> Any:
-        for source in self.sources:
-            try:
-                return source[key]
-            except KeyError:
-                pass
+    def lookup(self, key: str) -> Any:
+        entry = self.find(key)
+        if entry is None:
+            return MISSING
 
-        raise KeyError(key)
+        return entry[2]
 
     def __repr__(self) -> str:
         return descript_data_object(type(self).__name__, (self.sources,), {})
 
-    def get(self, key: str, default: Any = None) -> Any:
-        try:
-            return self[key]
-        except KeyError:
-            return default
-
     def type_awared_get(self, key: str, hint: Type[ExpectedType], default: Any = SecondNone()) -> Optional[ExpectedType]:
-        for source in self.sources:
-            maybe_result = source.type_awared_get(key, hint, default=default)
-            if maybe_result is not default:
-                return maybe_result
+        checked_value = self.checked_get(key, hint)
+
+        if checked_value is not None:
+            return cast(ExpectedType, checked_value.value)
 
         if not isinstance(default, SecondNone):
             return default
 
         return None
+
+    def checked_get(self, key: str, hint: Type[ExpectedType]) -> Optional[CheckedValue]:
+        return self.check_entry(key, self.find(key), hint)
+
+    def check_entry(self, key: str, entry: Optional[IndexEntry], hint: Type[ExpectedType]) -> Optional[CheckedValue]:
+        if entry is None:
+            return None
+
+        _, source, value = entry
+        if type(source).type_awared_get is not AbstractSource.type_awared_get:
+            return CheckedValue(source.type_awared_get(key, hint), None)
+
+        value = source.apply_type_hint(key, value, hint)
+        return CheckedValue(value, hint if source.verifies_type_hint(hint) else None)
+
+    def reset_index(self) -> None:
+        self.state = IndexState(AbstractSource.generation)
+
+    def get_state(self) -> IndexState:
+        state = self.state
+        if state.generation != AbstractSource.generation:
+            with self.index_lock:
+                if self.state.generation != AbstractSource.generation:  # pragma: no branch
+                    self.reset_index()
+                state = self.state
+
+        return state
+
+    def find(self, key: str) -> Optional[IndexEntry]:
+        state = self.get_state()
+
+        limit = len(state.snapshots)
+        entry = state.index.get(key)
+        if entry is not None:
+            limit = entry[0]
+
+        for position, source in state.probing_sources:
+            if position >= limit:
+                break
+            value = self.lookup_in_source(source, key)
+            if value is not MISSING:
+                return position, source, value
+
+        if entry is not None or limit == len(self.sources):
+            return entry
+
+        with self.index_lock:
+            return self.find_in_not_indexed_sources(state, key, limit)
+
+    def find_many(self, keys: List[str]) -> Dict[str, IndexEntry]:
+        state = self.get_state()
+
+        result: Dict[str, IndexEntry] = {}
+        unresolved_keys = keys
+
+        with self.index_lock:
+            for position, source in enumerate(self.sources):
+                if not unresolved_keys:
+                    break
+
+                snapshot = self.get_snapshot(state, position)
+                if snapshot is None:
+                    snapshot = self.get_many_from_source(source, unresolved_keys)
+
+                still_unresolved_keys = []
+                for key in unresolved_keys:
+                    if key in snapshot:
+                        result[key] = (position, source, snapshot[key])
+                    else:
+                        still_unresolved_keys.append(key)
+                unresolved_keys = still_unresolved_keys
+
+        return result
+
+    def find_in_not_indexed_sources(self, state: IndexState, key: str, start: int) -> Optional[IndexEntry]:
+        for position in range(start, len(self.sources)):
+            source = self.sources[position]
+            snapshot = self.get_snapshot(state, position)
+
+            if snapshot is None:
+                value = self.lookup_in_source(source, key)
+                if value is not MISSING:
+                    return position, source, value
+            elif key in snapshot:
+                return position, source, snapshot[key]
+
+        return None
+
+    def get_snapshot(self, state: IndexState, position: int) -> Optional[Dict[str, Any]]:
+        if position < len(state.snapshots):
+            return state.snapshots[position]
+
+        source = self.sources[position]
+        snapshot = source.snapshot() if isinstance(source, AbstractSource) else None
+        if snapshot is None:
+            state.probing_sources.append((position, source))
+        else:
+            for another_key, value in snapshot.items():
+                if another_key not in state.index:
+                    state.index[another_key] = (position, source, value)
+        state.snapshots.append(snapshot)
+
+        return snapshot
+
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        return {key: entry[2] for key, entry in self.find_many(keys).items()}
+
+    @classmethod
+    def get_many_from_source(cls, source: AbstractSource, keys: List[str]) -> Dict[str, Any]:
+        if isinstance(source, AbstractSource):
+            return source.get_many(keys)
+
+        result = {}
+        for key in keys:
+            value = cls.lookup_in_source(source, key)
+            if value is not MISSING:
+                result[key] = value
+
+        return result
+
+    @staticmethod
+    def lookup_in_source(source: AbstractSource, key: str) -> Any:
+        if isinstance(source, AbstractSource):
+            return source.lookup(key)
+
+        try:
+            return source[key]
+        except KeyError:
+            return MISSING
@@ -0,0 +1,92 @@
+from typing import Dict, Tuple, FrozenSet, Union, Optional
+from pathlib import Path
+from threading import Lock
+from os import scandir, stat, strerror, getcwd
+from os.path import abspath, split, join, dirname, isabs, isfile
+from errno import ENOENT
+
+from skelet.sources.abstract import AbstractSource
+
+
+listings: Dict[str, Tuple[int, FrozenSet[str]]] = {}
+found_files: Dict[Tuple[str, Union[str, Path]], Union[str, Path]] = {}
+listings_generation = AbstractSource.generation
+listings_lock = Lock()
+
+
+def find_file(path: Union[str, Path], search_parents: bool) -> Union[str, Path]:
+    if not search_parents or isabs(path):
+        return path
+
+    directory = getcwd()
+    key = (directory, path)
+
+    with listings_lock:
+        forget_old_listings()
+        if key in found_files:
+            return found_files[key]
+
+    result = path
+    while True:
+        candidate = join(directory, path)
+        candidate_directory, name = split(candidate)
+        listing = get_directory_listing(candidate_directory)
+        if listing is not None and name.casefold() in listing and isfile(candidate):
+            result = candidate
+            break
+        parent = dirname(directory)
+        if parent == directory:
+            break
+        directory = parent
+
+    with listings_lock:
+        found_files[key] = result
+
+    return result
+
+
+def file_may_exist(path: Union[str, Path]) -> bool:
+    directory, name = split(abspath(path))
+    listing = get_directory_listing(directory)
+    return listing is None or name.casefold() in listing
+
+
+def check_file_existence(path: Union[str, Path], may_exist: Optional[bool] = None) -> None:
+    if may_exist is None:
+        may_exist = file_may_exist(path)
+
+    if not may_exist:
+        raise FileNotFoundError(ENOENT, strerror(ENOENT), str(path))
+
+
+def get_directory_listing(directory: str) -> Optional[FrozenSet[str]]:
+    try:
+        modification_time = stat(directory).st_mtime_ns
+    except OSError:
+        return None
+
+    with listings_lock:
+        forget_old_listings()
+        listing = listings.get(directory)
+        if listing is not None and listing[0] == modification_time:
+            return listing[1]
+
+    try:
+        with scandir(directory) as entries:
+            names = frozenset(entry.name.casefold() for entry in entries)
+    except OSError:
+        return None
+
+    with listings_lock:
+        listings[directory] = (modification_time, names)
+
+    return names
+
+
+def forget_old_listings() -> None:
+    global listings_generation
+
+    if listings_generation != AbstractSource.generation:
+        listings.clear()
+        found_files.clear()
+        listings_generation = AbstractSource.generation
@@ -1,13 +1,14 @@
 import os
 import platform
-from typing import List, Dict, Type, TypeVar, Optional, Any, cast
-from functools import cached_property
+from typing import List, Dict, Type, TypeVar, Hashable, Optional, Any, cast
 from copy import copy
+from dataclasses import MISSING
 
 from printo import descript_data_object
 from simtypes import from_string
 
-from skelet.sources.abstract import AbstractSource, SecondNone
+from skelet.sources.abstract import AbstractSource
+from skelet.sources.locked_cached_property import locked_cached_property
 from skelet.errors import CaseError
 
 
@@ -22,17 +23,17 @@ class EnvSource(AbstractSource):
         self.postfix = postfix
         self.case_sensitive = case_sensitive
 
-    def __getitem__(self, key: str) -> Any:
+    def lookup(self, key: str) -> Any:
         full_key = f'{self.prefix}{key}{self.postfix}'
         if not self.case_sensitive:  # pragma: no cover
             full_key = full_key.upper()
 
-        return self.data[full_key]
+        return self.data.get(full_key, MISSING)
 
     def __repr__(self) -> str:
         return descript_data_object(type(self).__name__, (), {'prefix': self.prefix, 'postfix': self.postfix, 'case_sensitive': self.case_sensitive}, filters={'prefix': lambda x: x != '', 'postfix': lambda x: x != '', 'case_sensitive': lambda x: x != False})
 
-    @cached_property
+    @locked_cached_property
     def data(self) -> Dict[str, str]:
         if self.case_sensitive:  # pragma: no cover
             return cast(Dict[str, str], copy(os.environ))
@@ -49,15 +50,23 @@ class EnvSource(AbstractSource):
 
         return result
 
-    def type_awared_get(self, key: str, hint: Type[ExpectedType], default: Any = SecondNone()) -> Optional[ExpectedType]:
-        subresult = self.get(key, default)
+    def apply_type_hint(self, key: str, value: Any, hint: Type[ExpectedType]) -> ExpectedType:
+        return from_string(value, hint)
 
-        if subresult is default:
-            if not isinstance(default, SecondNone):
-                return default
-            return None
+    def verifies_type_hint(self, hint: Any) -> bool:
+        return hint in (str, int, float, bool)
 
-        return from_string(subresult, hint)
+    def fingerprint(self, keys: List[str]) -> Optional[Hashable]:
+        values = []
+        for key in keys:
+            value = self.lookup(key)
+            values.append(None if value is MISSING else value)
+
+        return repr(self), tuple(values)
+
+    def reload(self) -> None:
+        type(self).data.reset(self)
+        super().reload()
 
     @classmethod
     def for_library(cls, library_name: str) -> List['EnvSource']:
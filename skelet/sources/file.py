@@ -0,0 +1,70 @@
+from typing import List, Dict, Hashable, Union, Optional, Any
+from pathlib import Path
+from abc import abstractmethod
+from dataclasses import MISSING
+
+from printo import descript_data_object
+
+from skelet.sources.abstract import AbstractSource
+from skelet.sources.locked_cached_property import locked_cached_property
+from skelet.sources.fingerprints import get_file_fingerprint
+from skelet.sources.directories import check_file_existence, file_may_exist, find_file
+
+
+class FileSource(AbstractSource):
+    tracks_fingerprint = False
+
+    def __init__(self, path: Union[str, Path], allow_non_existent_files: bool = True, search_parents: bool = False) -> None:
+        self.path = path
+        self.allow_non_existent_files = allow_non_existent_files
+        self.search_parents = search_parents
+
+    def lookup(self, key: str) -> Any:
+        return self.data.get(key, MISSING)
+
+    def __repr__(self) -> str:
+        return descript_data_object(type(self).__name__, (self.path,), {'allow_non_existent_files': self.allow_non_existent_files, 'search_parents': self.search_parents}, filters={'allow_non_existent_files': lambda x: x != True, 'search_parents': lambda x: x != False})
+
+    @locked_cached_property
+    def data(self):
+        path = find_file(self.path, self.search_parents)
+        may_exist = file_may_exist(path)
+        if self.tracks_fingerprint:
+            self.file_fingerprint = get_file_fingerprint(path, may_exist)
+
+        try:
+            check_file_existence(path, may_exist)
+            return self.read(path)
+
+        except FileNotFoundError as e:
+            if self.allow_non_existent_files:
+                return {}
+            else:
+                raise e
+
+    @abstractmethod
+    def read(self, path: Union[str, Path]) -> Any:
+        ...  # pragma: no cover
+
+    def snapshot(self) -> Optional[Dict[str, Any]]:
+        if self.lookup_is_overridden(FileSource):
+            return None
+
+        data = self.data
+        if isinstance(data, dict):
+            return data
+        return None
+
+    def fingerprint(self, keys: List[str]) -> Optional[Hashable]:
+        self.tracks_fingerprint = True
+
+        if 'data' in self.__dict__:
+            file_fingerprint = self.__dict__.get('file_fingerprint')
+            if file_fingerprint is None:
+                return None
+            return repr(self), file_fingerprint
+        return repr(self), get_file_fingerprint(find_file(self.path, self.search_parents))
+
+    def reload(self) -> None:
+        type(self).data.reset(self)
+        super().reload()
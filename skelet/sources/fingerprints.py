@@ -0,0 +1,23 @@
+from typing import Tuple, Union, Optional
+from pathlib import Path
+from os import stat
+from os.path import abspath
+
+from skelet.sources.directories import file_may_exist
+
+
+def get_file_fingerprint(path: Union[str, Path], may_exist: Optional[bool] = None) -> Tuple[Union[str, int], ...]:
+    full_path = abspath(path)
+
+    if may_exist is None:
+        may_exist = file_may_exist(full_path)
+
+    if not may_exist:
+        return (full_path,)
+
+    try:
+        file_stat = stat(full_path)
+    except FileNotFoundError:
+        return (full_path,)
+
+    return full_path, file_stat.st_mtime_ns, file_stat.st_size
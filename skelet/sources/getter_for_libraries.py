@@ -4,5 +4,5 @@ from skelet.sources.abstract import AbstractSource
 from skelet import EnvSource, TOMLSource, JSONSource, YAMLSource
 
 
-def for_tool(tool_name: str) -> List[AbstractSource]:
-    return EnvSource.for_library(tool_name) + TOMLSource.for_library(tool_name) + YAMLSource.for_library(tool_name) + JSONSource.for_library(tool_name)  # type: ignore[return-value, operator]
+def for_tool(tool_name: str, search_parents: bool = False) -> List[AbstractSource]:
+    return EnvSource.for_library(tool_name) + TOMLSource.for_library(tool_name, search_parents=search_parents) + YAMLSource.for_library(tool_name, search_parents=search_parents) + JSONSource.for_library(tool_name, search_parents=search_parents)  # type: ignore[return-value, operator]
@@ -0,0 +1,48 @@
+from typing import Dict, Callable, Generic, TypeVar, Optional, Any, overload
+from threading import Lock
+
+
+CachedType = TypeVar('CachedType')
+
+class locked_cached_property(Generic[CachedType]):
+    locks_lock = Lock()
+
+    def __init__(self, function: Callable[[Any], CachedType]) -> None:
+        self.function = function
+        self.name = function.__name__
+        self.lock_name = f'__{self.name}_lock__'
+
+    def __set_name__(self, owner: Any, name: str) -> None:
+        self.name = name
+        self.lock_name = f'__{name}_lock__'
+
+    @overload
+    def __get__(self, instance: None, owner: Optional[type] = None) -> 'locked_cached_property[CachedType]': ...  # pragma: no cover
+
+    @overload
+    def __get__(self, instance: object, owner: Optional[type] = None) -> CachedType: ...  # pragma: no cover
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        if instance is None:
+            return self
+
+        storage: Dict[str, Any] = instance.__dict__
+
+        with self.get_lock(instance):
+            if self.name not in storage:
+                storage[self.name] = self.function(instance)
+            return storage[self.name]
+
+    def get_lock(self, instance: Any) -> Lock:
+        storage: Dict[str, Any] = instance.__dict__
+
+        lock = storage.get(self.lock_name)
+        if lock is None:
+            with self.locks_lock:
+                lock = storage.setdefault(self.lock_name, Lock())
+
+        return lock
+
+    def reset(self, instance: Any) -> None:
+        with self.get_lock(instance):
+            instance.__dict__.pop(self.name, None)
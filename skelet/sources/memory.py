@@ -1,4 +1,5 @@
 from typing import List, Dict, Any
+from dataclasses import MISSING
 
 from printo import descript_data_object
 
@@ -9,8 +10,14 @@ class MemorySource(AbstractSource):
     def __init__(self, data: Dict[str, Any]) -> None:
         self.data = data
 
-    def __getitem__(self, key: str) -> Any:
-        return self.data[key]
+    def lookup(self, key: str) -> Any:
+        if type(self.data) is dict:
+            return self.data.get(key, MISSING)
+
+        try:
+            return self.data[key]
+        except KeyError:
+            return MISSING
 
     def __repr__(self) -> str:
         return descript_data_object(type(self).__name__, (self.data,), {})
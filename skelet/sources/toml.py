@@ -1,6 +1,5 @@
 from typing import List, Union, Optional, Any
 from pathlib import Path
-from functools import cached_property
 
 try:
     from tomllib import load  # type: ignore[import-not-found]
@@ -9,13 +8,12 @@ except ImportError:  # pragma: no cover
 
 from printo import descript_data_object
 
-from skelet.sources.abstract import AbstractSource
+from skelet.sources.file import FileSource
 
 
-class TOMLSource(AbstractSource):
-    def __init__(self, path: Union[str, Path], table: Optional[Union[str, List[str]]] = None, allow_non_existent_files: bool = True) -> None:
-        self.path = path
-        self.allow_non_existent_files = allow_non_existent_files
+class TOMLSource(FileSource):
+    def __init__(self, path: Union[str, Path], table: Optional[Union[str, List[str]]] = None, allow_non_existent_files: bool = True, search_parents: bool = False) -> None:
+        super().__init__(path, allow_non_existent_files=allow_non_existent_files, search_parents=search_parents)
 
         if isinstance(table, str):
             self.table = table.split('.')
@@ -30,35 +28,24 @@ class TOMLSource(AbstractSource):
             if not subtable.isidentifier():
                 raise ValueError(f'You can only use a subset of all valid TOML format identifiers that can be used as a Python identifier. You used "{subtable}".')
 
-    def __getitem__(self, key: str) -> Any:
-        return self.data[key]
-
     def __repr__(self) -> str:
-        return descript_data_object(type(self).__name__, (self.path,), {'table': self.table, 'allow_non_existent_files': self.allow_non_existent_files}, filters={'allow_non_existent_files': lambda x: x != True, 'table': lambda x: bool(x)})
+        return descript_data_object(type(self).__name__, (self.path,), {'table': self.table, 'allow_non_existent_files': self.allow_non_existent_files, 'search_parents': self.search_parents}, filters={'allow_non_existent_files': lambda x: x != True, 'search_parents': lambda x: x != False, 'table': lambda x: bool(x)})
 
-    @cached_property
-    def data(self):
-        try:
-            with open(self.path, 'rb') as file:
-                table = load(file)
+    def read(self, path: Union[str, Path]) -> Any:
+        with open(path, 'rb') as file:
+            table = load(file)
 
+        try:
             for subtable_name in self.table:
                 table = table[subtable_name]
-
-            return table
-
-        except FileNotFoundError as e:
-            if self.allow_non_existent_files:
-                return {}
-            else:
-                raise e
-
         except KeyError:
             return {}
 
+        return table
+
     @classmethod
-    def for_library(cls, library_name: str) -> List['TOMLSource']:
+    def for_library(cls, library_name: str, search_parents: bool = False) -> List['TOMLSource']:
         if not library_name.isidentifier():
             raise ValueError('The library name can only be a valid Python identifier.')
 
-        return [cls(f'{library_name}.toml'), cls(f'.{library_name}.toml'), cls('pyproject.toml', table=f'tool.{library_name}')]
+        return [cls(f'{library_name}.toml', search_parents=search_parents), cls(f'.{library_name}.toml', search_parents=search_parents), cls('pyproject.toml', table=f'tool.{library_name}', search_parents=search_parents)]
@@ -1,115 +1,178 @@
 from dataclasses import MISSING
-from typing import List, Dict, Optional, Any
-from threading import Lock
+from typing import List, Dict, Set, Tuple, FrozenSet, MutableSet, Type, Callable, Iterable, Union, Optional, Any, cast
+from threading import Lock, Thread
+from weakref import WeakSet
 from collections import defaultdict
+from contextlib import ExitStack
+from pathlib import Path
 
 from printo import descript_data_object
 from locklib import ContextLockProtocol
 
 from skelet.sources.collection import SourcesCollection
 from skelet.sources.abstract import AbstractSource
+from skelet.compiled_cache import CompiledCache, CacheEntry
+from skelet.scheduler import scheduler
+from skelet.watching import Change, Subscription, notify_subscribers
 
 
+class LazyDefault:
+    pass
+
+LAZY_DEFAULT = LazyDefault()
+MAX_REFRESH_BACKOFF = 32
+instances_lock = Lock()
+ProposedValues = Tuple['Storage', Dict[str, Any]]
+
 class Storage:
     __values__: Dict[str, Any]
     __locks__: Dict[str, ContextLockProtocol]
     __field_names__: List[str] = []
+    __field_names_set__: Set[str] = set()
+    __type_hints__: Dict[str, Any]
+    __fields__: Dict[str, Any] = {}
     __reverse_conflicts__: Dict[str, List[str]]
     __sources__: SourcesCollection
+    __compiled_cache__: Optional[CompiledCache] = None
+    __preloading__: Optional[Thread] = None
+    __refresh_every__: Optional[float] = None
+    __refresh_group__: 'Optional[RefreshGroup]' = None
+    __on_change__: Optional[Callable[[List[Change], 'Storage'], Any]] = None
+    __resolved_from__: Dict[str, AbstractSource]
+    __subscriptions__: Tuple[Subscription, ...] = ()
+    __instances__: 'Optional[MutableSet[Storage]]' = None
+    __explicit_fields__: FrozenSet[str]
+    __overlays__: 'Optional[MutableSet[Storage]]' = None
 
     def __init__(self, **kwargs: Any) -> None:
+        preloading = self.__preloading__
+        if preloading is not None:
+            preloading.join()
+
+        check_explicit_fields(type(self), kwargs)
+
         self.__values__: Dict[str, Any] = {}
-        self.__locks__ = {field_name: Lock() for field_name in self.__field_names__}
-        deduplicated_fields = set(self.__field_names__)
+        self.__explicit_fields__ = frozenset(kwargs)
+        self.__locks__ = make_locks(type(self))
 
-        for field_name in self.__field_names__:
-            field = getattr(type(self), field_name)
-            lock = self.__locks__[field_name]
-            if field.conflicts is not None:
-                for another_field_name in field.conflicts:
-                    self.__locks__[another_field_name] = lock
-            if field.share_mutex_with is not None:
-                for another_field_name in field.share_mutex_with:
-                    self.__locks__[another_field_name] = lock
+        cache = self.__compiled_cache__
+        cache_key = cache.get_key(self) if cache is not None else None
+        cache_entry = cache.load(cache_key) if cache is not None and cache_key is not None else None
+        resolved_values: Dict[str, Any] = {}
+        resolved_positions: Dict[str, int] = {}
+        absent_values: Set[str] = set()
+        self.__resolved_from__: Dict[str, AbstractSource] = {}
 
-        for field_name in self.__field_names__:
-            field = getattr(type(self), field_name)
-            content = field.get_sources(self).type_awared_get(field.alias, field.type_hint, MISSING)
-            it_is_not_default = True
-            if content is not MISSING:
-                field.check_type_hints(type(self), field_name, content, strict=True, raise_all=True)
-                field.check_value(content, raise_all=True)
+        keys_by_collections: Dict[SourcesCollection, List[str]] = {}
+        for field_name, field in self.__fields__.items():
+            if field_name not in kwargs and (cache_entry is None or (field_name not in cache_entry.values and field_name not in cache_entry.absent)):
+                keys_by_collections.setdefault(field.get_sources(self), []).append(field.alias)
+        entries_by_collections = {collection: collection.find_many(keys) for collection, keys in keys_by_collections.items()}
+
+        for field_name, field in self.__fields__.items():
+            if field_name in kwargs:
+                self.__values__[field_name] = field.check_and_convert(kwargs[field_name])
+                continue
+
+            elif cache_entry is not None and field_name in cache_entry.values:
+                self.__values__[field_name] = cache_entry.values[field_name]
+                self.__resolved_from__[field_name] = field.get_sources(self).sources[cache_entry.positions[field_name]]
+                continue
+
+            elif cache_entry is not None and field_name in cache_entry.absent:
+                checked_value = None
+
+            else:
+                collection = field.get_sources(self)
+                entry = entries_by_collections[collection].get(field.alias)
+                checked_value = collection.check_entry(field.alias, entry, field.type_hint)
+                if entry is not None:
+                    self.__resolved_from__[field_name] = entry[1]
+                    resolved_positions[field_name] = entry[0]
+                elif cache_key is not None and not field.secret:
+                    absent_values.add(field_name)
+
+            if checked_value is not None:
+                content = field.check_and_convert_from_source(checked_value)
+            elif field.lazy:
+                self.__values__[field_name] = LAZY_DEFAULT
+                continue
+            elif field._default_factory is not None:
+                content = field.call_default_factory()
             else:
-                if field._default_factory is not None:
-                    content = field._default_factory()
-                    field.check_type_hints(type(self), field_name, content, strict=True, raise_all=True)
-                    if field.validate_default:
-                        field.check_value(content, raise_all=True)
-                else:
-                    it_is_not_default = False
-                    content = field._default
-
-            if field.conversion is not None and it_is_not_default:
-                content = field.conversion(content)
-                field.check_type_hints(type(self), field_name, content, strict=True, raise_all=True)
-                if field.validate_default:
-                    field.check_value(content, raise_all=True)
+                content = field._default
 
             self.__values__[field_name] = content
+            if checked_value is not None and cache_key is not None and not field.secret:
+                resolved_values[field_name] = content
 
-        for field_name in self.__field_names__:
-            field = getattr(type(self), field_name)
+        for field_name, field in self.__fields__.items():
+            if field_name in kwargs:
+                value = self.__values__[field_name]
+                field.check_conflicts(self, value, value)
 
-            if field._default_factory is not None:
-                if field.conflicts is not None:
-                    for conflicting_field_name, checker in field.conflicts.items():
-                        if checker(self.__values__[field_name], self.__values__[field_name], self.__values__[conflicting_field_name], self.__values__[conflicting_field_name]):
-                            conflicting_field = getattr(type(self), conflicting_field_name)
-                            raise ValueError(f'The {field.get_value_representation(self.__values__[field_name])} deferred default value of the {field.get_field_name_representation()} conflicts with the {conflicting_field.get_value_representation(self.__values__[conflicting_field_name])} value of the {conflicting_field.get_field_name_representation()}.')
-
-                if field_name in self.__reverse_conflicts__:
-                    conflicting_field_names = self.__reverse_conflicts__[field_name]
-                    for conflicting_field_name in conflicting_field_names:
-                        conflicting_field = getattr(type(self), conflicting_field_name)
-                        checker = conflicting_field.conflicts[field_name]
-                        if checker(self.__values__[conflicting_field_name], self.__values__[conflicting_field_name], self.__values__[field_name], self.__values__[field_name]):
-                            raise ValueError(f'The {conflicting_field.get_value_representation(self.__values__[conflicting_field_name])} deferred default value of the {conflicting_field.get_field_name_representation()} conflicts with the {field.get_value_representation(self.__values__[field_name])} value of the {field.get_field_name_representation()}.')
-
-        for key, value in kwargs.items():
-            if key not in deduplicated_fields:
-                raise KeyError(f'The "{key}" field is not defined.')
-            setattr(self, key, value)
+            elif field._default_factory is not None and self.__values__[field_name] is not LAZY_DEFAULT:
+                field.check_default_conflicts(self, self.__values__[field_name])
 
-        for field_name in self.__field_names__:
-            field_content = getattr(self, field_name)
+        for field_name, field_content in self.__values__.items():
             if field_content is MISSING:
                 raise ValueError(f'The value for the "{field_name}" field is undefined. Set the default value, or specify the value when creating the instance.')
 
+        if cache is not None and cache_key is not None and (resolved_values or absent_values):
+            if cache_entry is not None:
+                resolved_values = {**cache_entry.values, **resolved_values}
+                resolved_positions = {**cache_entry.positions, **resolved_positions}
+                absent_values |= cache_entry.absent
+            cache.save(CacheEntry(cache_key, resolved_values, {field_name: resolved_positions[field_name] for field_name in resolved_values}, frozenset(absent_values)))
+
+        if type(self).__on_change__ is not None:
+            call_on_change(self, [Change(field_name, MISSING, value) for field_name, value in self.__values__.items() if value is not LAZY_DEFAULT])
+
+        for field_name, field in self.__fields__.items():
+            if field.refresh_every is not None and field_name not in kwargs:
+                field.schedule_refresh(self)
+
+        if self.__refresh_group__ is not None:
+            self.__refresh_group__.add(self)
 
-    def __init_subclass__(cls, reverse_conflicts: bool = True, sources: Optional[List[AbstractSource]] = None, **kwargs: Any):
+        for field_name, field in self.__fields__.items():
+            if field.index is not None:
+                field.index.add(self, self.__values__[field_name])
+
+        instances = type(self).__instances__
+        if instances is not None:
+            with instances_lock:
+                instances.add(self)
+
+    def __init_subclass__(cls, reverse_conflicts: bool = True, sources: Optional[List[AbstractSource]] = None, cache_dir: Optional[Union[str, Path]] = None, preload: bool = False, refresh_every: Optional[float] = None, on_change: Optional[Callable[[List[Change], 'Storage'], Any]] = None, track_instances: bool = False, **kwargs: Any):
             super().__init_subclass__(**kwargs)
 
-            for field_name in cls.__field_names__:
-                field = getattr(cls, field_name)
+            if refresh_every is not None and refresh_every <= 0:
+                raise ValueError('The refresh interval must be a positive number.')
+
+            cls.__fields__ = {field_name: getattr(cls, field_name) for field_name in cls.__field_names__}
+
+            for field in cls.__fields__.values():
                 if field.exception is not None:
                     raise field.exception
 
             cls.__sources__ = SourcesCollection(sources) if sources is not None else SourcesCollection([])
+            cls.__compiled_cache__ = CompiledCache(cache_dir, cls) if cache_dir is not None else None
+            cls.__refresh_every__ = refresh_every
+            cls.__refresh_group__ = RefreshGroup(refresh_every, get_refreshed_collections, lambda instance: refresh_storage(instance, get_refreshed_field_names(instance), reload=False)) if refresh_every is not None else None
+            cls.__on_change__ = on_change
+            cls.__instances__ = WeakSet() if track_instances else None
 
-            deduplicated_field_names = set(cls.__field_names__)
+            deduplicated_field_names = cls.__field_names_set__
 
             cls.__reverse_conflicts__ = defaultdict(list)
-            for field_name in cls.__field_names__:
-                field = getattr(cls, field_name)
-
+            for field_name, field in cls.__fields__.items():
                 if field.conflicts is not None:
                     for other_field_name in field.conflicts:
                         if field.reverse_conflicts_on and reverse_conflicts:
                             cls.__reverse_conflicts__[other_field_name].append(field_name)
 
-            for field_name in cls.__field_names__:
-                field = getattr(cls, field_name)
-
+            for field in cls.__fields__.values():
                 if field.share_mutex_with is not None:
                     for another_field_name in field.share_mutex_with:
                         if another_field_name not in deduplicated_field_names:
@@ -119,10 +182,16 @@ class Storage:
                     for conficting_field_name, checker in field.conflicts.items():
                         if conficting_field_name not in deduplicated_field_names:
                             raise NameError(f'You have set a conflict condition for {field.get_field_name_representation()} with field "{conficting_field_name}", but the field "{conficting_field_name}" does not exist in the class {cls.__name__}.')
-                        elif field._default is not MISSING and getattr(cls, conficting_field_name)._default is not MISSING and reverse_conflicts and field.reverse_conflicts_on and checker(field._default, field._default, getattr(cls, conficting_field_name)._default, getattr(cls, conficting_field_name)._default):
-                            other_field = getattr(cls, conficting_field_name)
+                        elif field._default is not MISSING and cls.__fields__[conficting_field_name]._default is not MISSING and reverse_conflicts and field.reverse_conflicts_on and checker(field._default, field._default, cls.__fields__[conficting_field_name]._default, cls.__fields__[conficting_field_name]._default):
+                            other_field = cls.__fields__[conficting_field_name]
                             raise ValueError(f'The {field.get_value_representation(field._default)} default value of the {field.get_field_name_representation()} conflicts with the {other_field.get_value_representation(other_field._default)} value of the {other_field.get_field_name_representation()}.')
 
+            if preload:
+                cls.__preloading__ = Thread(target=preload_sources, args=(cls,), daemon=True)
+                cls.__preloading__.start()
+            else:
+                cls.__preloading__ = None
+
     def __repr__(self) -> str:
         fields_content = {}
         secrets = {}
@@ -133,3 +202,187 @@ class Storage:
                 secrets[field_name] = '***'
 
         return descript_data_object(type(self).__name__, (), fields_content, placeholders=secrets)  # type: ignore[arg-type]
+
+
+def make_locks(storage_class: Type[Storage]) -> Dict[str, ContextLockProtocol]:
+    locks: Dict[str, ContextLockProtocol] = {field_name: Lock() for field_name in storage_class.__field_names__}
+
+    for field_name, field in storage_class.__fields__.items():
+        lock = locks[field_name]
+        if field.conflicts is not None:
+            for another_field_name in field.conflicts:
+                locks[another_field_name] = lock
+        if field.share_mutex_with is not None:
+            for another_field_name in field.share_mutex_with:
+                locks[another_field_name] = lock
+
+    return locks
+
+
+def check_explicit_fields(storage_class: Type[Storage], values: Dict[str, Any]) -> None:
+    for key in values:
+        if key not in storage_class.__fields__:
+            raise KeyError(f'The "{key}" field is not defined.')
+        elif storage_class.__fields__[key].read_only:
+            raise AttributeError(f'{storage_class.__fields__[key].get_field_name_representation()} is read-only.')
+
+
+def preload_sources(storage_class: Type[Storage]) -> None:
+    try:
+        instance = cast(Storage, storage_class)
+        cache = storage_class.__compiled_cache__
+        if cache is not None:
+            cache_key = cache.get_key(instance)
+            if cache_key is not None and cache.load(cache_key) is not None:
+                return
+
+        keys_by_collections: Dict[SourcesCollection, List[str]] = {}
+        for field in storage_class.__fields__.values():
+            keys_by_collections.setdefault(field.get_sources(instance), []).append(field.alias)
+
+        for collection, keys in keys_by_collections.items():
+            collection.find_many(keys)
+
+    except Exception:
+        pass
+
+
+def call_on_change(instance: Storage, changes: List[Change]) -> None:
+    on_change = type(instance).__on_change__
+    if on_change is not None and changes:
+        on_change(changes, instance)
+
+
+def get_refreshed_field_names(instance: Storage) -> List[str]:
+    return [field_name for field_name in instance.__fields__ if field_name not in instance.__explicit_fields__]
+
+
+def get_refreshed_collections(instance: Storage) -> List[SourcesCollection]:
+    return [instance.__fields__[field_name].get_sources(instance) for field_name in get_refreshed_field_names(instance)]
+
+
+class RefreshGroup:
+    def __init__(self, interval: float, get_collections: Callable[[Storage], Iterable[SourcesCollection]], refresh: Callable[[Storage], Any]) -> None:
+        self.interval = interval
+        self.get_collections = get_collections
+        self.refresh = refresh
+        self.instances: 'MutableSet[Storage]' = WeakSet()
+        self.is_scheduled = False
+        self.failures = 0
+
+    def add(self, instance: Storage) -> None:
+        with instances_lock:
+            self.instances.add(instance)
+            if self.is_scheduled:
+                return
+            self.is_scheduled = True
+
+        scheduler.schedule(self.interval, self.run)
+
+    def run(self) -> Optional[float]:
+        with instances_lock:
+            instances = list(self.instances)
+            if not instances:
+                self.is_scheduled = False
+                return None
+
+        failed = False
+        try:
+            reload_sources({collection for instance in instances for collection in self.get_collections(instance)})
+        except Exception:
+            failed = True
+        else:
+            for instance in instances:
+                try:
+                    self.refresh(instance)
+                except Exception:
+                    failed = True
+
+        if failed:
+            self.failures += 1
+            return self.interval * min(2 ** self.failures, MAX_REFRESH_BACKOFF)
+
+        self.failures = 0
+        return self.interval
+
+
+def refresh_all(storage_class: Type[Storage]) -> List[Tuple[Storage, Exception]]:
+    instances = storage_class.__instances__
+    if instances is None:
+        raise ValueError(f'Instances of the {storage_class.__name__} class are not tracked.')
+
+    with instances_lock:
+        instances_to_refresh = list(instances)
+
+    reload_sources({field.get_sources(cast(Storage, storage_class)) for field in storage_class.__fields__.values()})
+
+    errors = []
+    for instance in instances_to_refresh:
+        try:
+            refresh_storage(instance, get_refreshed_field_names(instance), reload=False)
+        except Exception as error:
+            errors.append((instance, error))
+
+    return errors
+
+
+def reload_sources(collections: Iterable[SourcesCollection]) -> None:
+    reloaded_sources: Set[int] = set()
+    for collection in collections:
+        for source in collection.sources:
+            if id(source) not in reloaded_sources:
+                reloaded_sources.add(id(source))
+                source.reload()
+
+
+def refresh_storage(instance: Storage, field_names: List[str], reload: bool = True) -> Dict[str, Tuple[Any, Any]]:
+    keys_by_collections: Dict[SourcesCollection, List[str]] = {}
+    for field_name in field_names:
+        field = instance.__fields__[field_name]
+        keys_by_collections.setdefault(field.get_sources(instance), []).append(field.alias)
+
+    if reload:
+        reload_sources(keys_by_collections)
+
+    entries_by_collections = {collection: collection.find_many(keys) for collection, keys in keys_by_collections.items()}
+
+    new_values: Dict[str, Any] = {}
+    for field_name in field_names:
+        field = instance.__fields__[field_name]
+        collection = field.get_sources(instance)
+        entry = entries_by_collections[collection].get(field.alias)
+        checked_value = collection.check_entry(field.alias, entry, field.type_hint)
+        if checked_value is not None:
+            new_values[field_name] = field.check_and_convert_from_source(checked_value)
+
+    locks = {id(instance.__locks__[field_name]): instance.__locks__[field_name] for field_name in new_values}
+    changes: Dict[str, Tuple[Any, Any]] = {}
+
+    with ExitStack() as stack:
+        for _, lock in sorted(locks.items()):
+            stack.enter_context(lock)
+
+        for field_name, value in new_values.items():
+            old_value = instance.__fields__[field_name].get_assigned_value(instance)
+            if old_value != value:
+                changes[field_name] = (old_value, value)
+
+        proposed = (instance, {field_name: value for field_name, (_, value) in changes.items()})
+        for field_name, (old_value, value) in changes.items():
+            instance.__fields__[field_name].check_conflicts(instance, old_value, value, proposed)
+            instance.__fields__[field_name].check_overlays_conflicts(instance, old_value, value, proposed)
+
+        for field_name, (_, value) in changes.items():
+            instance.__values__[field_name] = value
+
+        for field_name, (old_value, value) in changes.items():
+            field = instance.__fields__[field_name]
+            if field.index is not None:
+                field.index.move(instance, old_value, value)
+            if field.change_action is not None:
+                field.change_action(old_value, value, instance)
+            notify_subscribers(instance, field_name, old_value, value)
+
+    call_on_change(instance, [Change(field_name, old_value, value) for field_name, (old_value, value) in changes.items()])
+
+    return changes
@@ -0,0 +1,127 @@
+from typing import List, Dict, Type, TypeVar, Iterable, Iterator, MutableSequence, Generic, Any, cast
+from threading import Lock
+from array import array
+
+from skelet.storage import Storage, make_locks
+from skelet.validation import check_record, has_conflicts
+
+
+StorageType = TypeVar('StorageType', bound=Storage)
+
+ARRAY_TYPECODES = {int: 'q', float: 'd'}
+CHUNK_SIZE = 10000
+MIN_ARRAY_INT = -2 ** 63
+MAX_ARRAY_INT = 2 ** 63 - 1
+
+class RowValues(Dict[str, Any]):
+    def __init__(self, table: 'StorageTable[Any]', index: int) -> None:
+        super().__init__()
+        self.table = table
+        self.index = index
+
+    def __getitem__(self, key: str) -> Any:
+        return self.table.columns[key][self.index]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.table.set_cell(key, self.index, value)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.table.columns
+
+    def get(self, key: str, default: Any = None) -> Any:  # type: ignore[override]
+        column = self.table.columns.get(key)
+        if column is None:
+            return default
+        return column[self.index]
+
+class StorageTable(Generic[StorageType]):
+    def __init__(self, storage_class: Type[StorageType], records: Iterable[Dict[str, Any]] = ()) -> None:
+        self.storage_class = storage_class
+        self.lock = Lock()
+        self.locks = make_locks(storage_class)
+        self.columns: Dict[str, MutableSequence[Any]] = {}
+        self.array_types: Dict[str, type] = {}
+        self.length = 0
+        self.has_conflicts = has_conflicts(storage_class)
+
+        for field_name, field in storage_class.__fields__.items():
+            typecode = ARRAY_TYPECODES.get(field.type_hint)
+            if typecode is not None:
+                self.columns[field_name] = array(typecode)
+                self.array_types[field_name] = field.type_hint
+            else:
+                self.columns[field_name] = []
+
+        self.extend(records)
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, index: int) -> StorageType:
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError('The row index is out of range.')
+
+        return self.make_row(RowValues(self, index))
+
+    def __iter__(self) -> Iterator[StorageType]:
+        for index in range(self.length):
+            yield self.make_row(RowValues(self, index))
+
+    def make_row(self, values: Dict[str, Any]) -> StorageType:
+        row = cast(StorageType, object.__new__(self.storage_class))
+        row.__values__ = values
+        row.__locks__ = self.locks
+        return row
+
+    def append(self, **values: Any) -> None:
+        self.extend([values])
+
+    def extend(self, records: Iterable[Dict[str, Any]]) -> None:
+        with self.lock:
+            length = self.length
+            try:
+                chunk: List[Dict[str, Any]] = []
+                for record in records:
+                    chunk.append(check_record(self.storage_class, record, self.has_conflicts))
+                    if len(chunk) == CHUNK_SIZE:
+                        self.append_chunk(chunk)
+                        chunk = []
+                self.append_chunk(chunk)
+
+            except BaseException:
+                for column in self.columns.values():
+                    del column[length:]
+                self.length = length
+                raise
+
+    def append_chunk(self, chunk: List[Dict[str, Any]]) -> None:
+        for field_name, column in self.columns.items():
+            column_values = [values[field_name] for values in chunk]
+            expected_type = self.array_types.get(field_name)
+            if expected_type is not None and not self.fits_array(expected_type, column_values):
+                column = self.convert_to_list(field_name)
+            column.extend(column_values)
+        self.length += len(chunk)
+
+    def set_cell(self, field_name: str, index: int, value: Any) -> None:
+        expected_type = self.array_types.get(field_name)
+        if expected_type is not None and not self.fits_array(expected_type, [value]):
+            with self.lock:
+                self.convert_to_list(field_name)
+        self.columns[field_name][index] = value
+
+    @staticmethod
+    def fits_array(expected_type: type, values: List[Any]) -> bool:
+        for value in values:
+            if type(value) is not expected_type:
+                return False
+            if expected_type is int and not MIN_ARRAY_INT <= cast(int, value) <= MAX_ARRAY_INT:
+                return False
+        return True
+
+    def convert_to_list(self, field_name: str) -> MutableSequence[Any]:
+        column = self.columns[field_name] = list(self.columns[field_name])
+        self.array_types.pop(field_name, None)
+        return column
@@ -0,0 +1,113 @@
+from typing import Type, Tuple, Callable, Union, Literal, Any, get_args, get_origin
+from inspect import isclass
+from functools import lru_cache
+
+try:
+    from types import UnionType  # type: ignore[attr-defined]
+except ImportError:  # pragma: no cover
+    from typing import Union as UnionType  # type: ignore[assignment]
+
+from simtypes import check
+
+
+TypeChecker = Callable[[Any], bool]
+
+
+def always_true(value: Any) -> bool:
+    return True
+
+
+def get_type_checker(hint: Any, strict: bool = False) -> TypeChecker:
+    try:
+        return get_cached_type_checker(hint, strict)
+    except TypeError:
+        return compile_type_checker(hint, strict)
+
+
+@lru_cache(maxsize=1024)
+def get_cached_type_checker(hint: Any, strict: bool) -> TypeChecker:
+    return compile_type_checker(hint, strict)
+
+
+def compile_type_checker(hint: Any, strict: bool = False) -> TypeChecker:
+    if hint is Any:
+        return always_true
+
+    elif hint is None:
+        return lambda value: value is None
+
+    origin = get_origin(hint)
+
+    if origin is Union or origin is UnionType:
+        return compile_union_checker(get_args(hint), strict)
+
+    elif origin is Literal:
+        return compile_literal_checker(get_args(hint))
+
+    elif origin is list and strict:
+        return compile_sequence_checker(list, get_args(hint), strict)
+
+    elif origin is dict and strict:
+        return compile_dict_checker(get_args(hint), strict)
+
+    elif origin is tuple and strict:
+        return compile_tuple_checker(get_args(hint), strict)
+
+    elif origin is not None:
+        return lambda value: isinstance(value, origin)
+
+    elif isclass(hint):
+        return lambda value: type(value) is hint or isinstance(value, hint)
+
+    return lambda value: check(value, hint, strict=strict)
+
+
+def compile_union_checker(arguments: Tuple[Any, ...], strict: bool) -> TypeChecker:
+    if all(isclass(argument) for argument in arguments):
+        classes = tuple(argument for argument in arguments if argument is not type(None))
+        if len(classes) != len(arguments):
+            return lambda value: value is None or isinstance(value, classes)
+        return lambda value: isinstance(value, classes)
+
+    checkers = tuple(compile_type_checker(argument, strict) for argument in arguments)
+    return lambda value: any(checker(value) for checker in checkers)
+
+
+def compile_literal_checker(arguments: Tuple[Any, ...]) -> TypeChecker:
+    variants = frozenset((type(argument), argument) for argument in arguments)
+
+    def checker(value: Any) -> bool:
+        try:
+            return (type(value), value) in variants
+        except TypeError:
+            return False
+
+    return checker
+
+
+def compile_sequence_checker(sequence_type: Type[Any], arguments: Tuple[Any, ...], strict: bool) -> TypeChecker:
+    item_checker = compile_type_checker(arguments[0], strict) if arguments else always_true
+    if item_checker is always_true:
+        return lambda value: isinstance(value, sequence_type)
+
+    return lambda value: isinstance(value, sequence_type) and all(item_checker(item) for item in value)
+
+
+def compile_dict_checker(arguments: Tuple[Any, ...], strict: bool) -> TypeChecker:
+    if not arguments:
+        return lambda value: isinstance(value, dict)
+
+    key_checker = compile_type_checker(arguments[0], strict)
+    value_checker = compile_type_checker(arguments[1], strict)
+    return lambda value: isinstance(value, dict) and all(key_checker(key) and value_checker(subvalue) for key, subvalue in value.items())
+
+
+def compile_tuple_checker(arguments: Tuple[Any, ...], strict: bool) -> TypeChecker:
+    if not arguments:
+        return lambda value: isinstance(value, tuple)
+
+    if len(arguments) == 2 and arguments[1] is Ellipsis:
+        return compile_sequence_checker(tuple, arguments[:1], strict)
+
+    checkers = tuple(compile_type_checker(argument, strict) for argument in arguments)
+    return lambda value: isinstance(value, tuple) and len(value) == len(checkers) and all(checker(item) for checker, item in zip(checkers, value))
@@ -0,0 +1,96 @@
+from typing import List, Dict, Deque, Type, Iterable, Iterator, NamedTuple, Optional, Any, cast
+from concurrent.futures import ProcessPoolExecutor, Future
+from multiprocessing import get_context
+from collections import deque
+from itertools import islice
+from dataclasses import MISSING
+
+from skelet.storage import Storage, check_explicit_fields
+
+
+class ValidationResult(NamedTuple):
+    values: Optional[Dict[str, Any]]
+    error: Optional[Exception]
+
+
+def has_conflicts(storage_class: Type[Storage]) -> bool:
+    return any(field.conflicts is not None for field in storage_class.__fields__.values())
+
+
+def check_record(storage_class: Type[Storage], record: Dict[str, Any], with_conflicts: bool = True) -> Dict[str, Any]:
+    fields = storage_class.__fields__
+    check_explicit_fields(storage_class, record)
+
+    values = {}
+    for field_name, field in fields.items():
+        if field_name in record:
+            values[field_name] = field.check_and_convert(record[field_name])
+        elif field._default_factory is not None:
+            values[field_name] = field.call_default_factory()
+        elif field._default is not MISSING:
+            values[field_name] = field._default
+        else:
+            raise ValueError(f'The value for the "{field_name}" field is undefined. Set the default value, or specify the value when creating the instance.')
+
+    if not with_conflicts:
+        return values
+
+    row = cast(Storage, object.__new__(storage_class))
+    row.__values__ = values
+    for field_name, field in fields.items():
+        if field_name in record:
+            field.check_conflicts(row, values[field_name], values[field_name])
+        elif field._default_factory is not None:
+            field.check_default_conflicts(row, values[field_name])
+
+    return values
+
+
+def validate_chunk(storage_class: Type[Storage], records: List[Dict[str, Any]]) -> List[ValidationResult]:
+    with_conflicts = has_conflicts(storage_class)
+    results = []
+
+    for record in records:
+        try:
+            results.append(ValidationResult(check_record(storage_class, record, with_conflicts), None))
+        except Exception as error:
+            results.append(ValidationResult(None, error))
+
+    return results
+
+
+def validate_many(storage_class: Type[Storage], records: Iterable[Dict[str, Any]], processes: Optional[int] = None, chunk_size: int = 1000) -> Iterator[ValidationResult]:
+    if processes is not None and processes <= 0:
+        raise ValueError('The number of processes must be a positive number.')
+    if chunk_size <= 0:
+        raise ValueError('The chunk size must be a positive number.')
+
+    return validate_in_processes(storage_class, records, processes, chunk_size) if processes is not None else validate_in_place(storage_class, records)
+
+
+def validate_in_place(storage_class: Type[Storage], records: Iterable[Dict[str, Any]]) -> Iterator[ValidationResult]:
+    with_conflicts = has_conflicts(storage_class)
+
+    for record in records:
+        try:
+            yield ValidationResult(check_record(storage_class, record, with_conflicts), None)
+        except Exception as error:
+            yield ValidationResult(None, error)
+
+
+def validate_in_processes(storage_class: Type[Storage], records: Iterable[Dict[str, Any]], processes: int, chunk_size: int) -> Iterator[ValidationResult]:
+    iterator = iter(records)
+    futures: Deque['Future[List[ValidationResult]]'] = deque()
+
+    with ProcessPoolExecutor(processes, mp_context=get_context('spawn')) as executor:
+        while True:
+            while len(futures) < processes * 2:
+                chunk = list(islice(iterator, chunk_size))
+                if not chunk:
+                    break
+                futures.append(executor.submit(validate_chunk, storage_class, chunk))
+
+            if not futures:
+                break
+
+            yield from futures.popleft().result()
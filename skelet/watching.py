@@ -0,0 +1,128 @@
+from typing import List, Tuple, Deque, FrozenSet, NamedTuple, Optional, Any
+from threading import Lock, Condition
+from collections import deque
+from asyncio import AbstractEventLoop, Future, get_running_loop
+
+
+class Change(NamedTuple):
+    field_name: str
+    old_value: Any
+    new_value: Any
+
+class Subscription:
+    def __init__(self, storage: Any, field_names: Optional[FrozenSet[str]], max_size: int) -> None:
+        self.storage = storage
+        self.field_names = field_names
+        self.max_size = max_size
+        self.queue: Deque[Change] = deque()
+        self.condition = Condition()
+        self.waiters: List[Tuple[AbstractEventLoop, 'Future[None]']] = []
+        self.closed = False
+
+    def __iter__(self) -> 'Subscription':
+        return self
+
+    def __next__(self) -> Change:
+        with self.condition:
+            while not self.queue:
+                if self.closed:
+                    raise StopIteration
+                self.condition.wait()
+            return self.queue.popleft()
+
+    def __aiter__(self) -> 'Subscription':
+        return self
+
+    async def __anext__(self) -> Change:
+        loop = get_running_loop()
+
+        while True:
+            with self.condition:
+                if self.queue:
+                    return self.queue.popleft()
+                if self.closed:
+                    raise StopAsyncIteration
+                waiter: Tuple[AbstractEventLoop, 'Future[None]'] = (loop, loop.create_future())
+                self.waiters.append(waiter)
+
+            try:
+                await waiter[1]
+            finally:
+                with self.condition:
+                    if waiter in self.waiters:
+                        self.waiters.remove(waiter)
+
+    def __enter__(self) -> 'Subscription':
+        return self
+
+    def __exit__(self, exception_type: Any, exception_value: Any, traceback: Any) -> None:
+        self.close()
+
+    def put(self, change: Change) -> None:
+        if self.field_names is not None and change.field_name not in self.field_names:
+            return
+
+        with self.condition:
+            if self.closed:
+                return
+
+            if len(self.queue) >= self.max_size:
+                for index, queued_change in enumerate(self.queue):
+                    if queued_change.field_name == change.field_name:
+                        del self.queue[index]
+                        change = Change(change.field_name, queued_change.old_value, change.new_value)
+                        break
+                else:
+                    self.queue.popleft()
+
+            self.queue.append(change)
+            self.wake_up()
+
+    def close(self) -> None:
+        with subscriptions_lock:
+            self.storage.__subscriptions__ = tuple(subscription for subscription in self.storage.__subscriptions__ if subscription is not self)
+
+        with self.condition:
+            self.closed = True
+            self.wake_up()
+
+    def wake_up(self) -> None:
+        self.condition.notify_all()
+        for loop, future in self.waiters:
+            if not future.done() and not loop.is_closed():
+                try:
+                    loop.call_soon_threadsafe(set_empty_result, future)
+                except Exception:
+                    pass
+        self.waiters.clear()
+
+
+subscriptions_lock = Lock()
+
+def set_empty_result(future: 'Future[None]') -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+def notify_subscribers(storage: Any, field_name: str, old_value: Any, new_value: Any) -> None:
+    subscriptions = storage.__subscriptions__
+    if subscriptions:
+        change = Change(field_name, old_value, new_value)
+        for subscription in subscriptions:
+            subscription.put(change)
+
+
+def watch(storage: Any, *field_names: str, max_size: int = 100) -> Subscription:
+    if max_size <= 0:
+        raise ValueError('The maximum size of the queue must be a positive number.')
+
+    for field_name in field_names:
+        if field_name not in storage.__fields__:
+            raise KeyError(f'The "{field_name}" field is not defined.')
+
+    subscription = Subscription(storage, frozenset(field_names) if field_names else None, max_size)
+
+    with subscriptions_lock:
+        storage.__subscriptions__ = (*storage.__subscriptions__, subscription)
+
+    return subscription
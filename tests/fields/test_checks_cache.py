@@ -0,0 +1,88 @@
+import pytest
+from full_match import match
+
+from skelet.fields.checks_cache import ChecksCache, LOOSE_TYPE_CHECK, STRICT_TYPE_CHECK, VALIDATION
+
+
+@pytest.mark.parametrize(
+    ['size'],
+    [
+        (0,),
+        (-1,),
+    ],
+)
+def test_wrong_size(size):
+    with pytest.raises(ValueError, match=match('The size of the checks cache must be a positive number.')):
+        ChecksCache(size)
+
+
+def test_remember_and_check():
+    cache = ChecksCache(10)
+
+    assert not cache.passed('kek', LOOSE_TYPE_CHECK)
+
+    cache.remember('kek', LOOSE_TYPE_CHECK)
+
+    assert cache.passed('kek', LOOSE_TYPE_CHECK)
+    assert not cache.passed('kek', STRICT_TYPE_CHECK)
+    assert not cache.passed('kek', VALIDATION)
+
+    cache.remember('kek', VALIDATION)
+
+    assert cache.passed('kek', LOOSE_TYPE_CHECK)
+    assert cache.passed('kek', VALIDATION)
+    assert len(cache) == 1
+
+
+@pytest.mark.parametrize(
+    ['first_value', 'second_value'],
+    [
+        (1, True),
+        (1, 1.0),
+        ((1,), (True,)),
+        (frozenset([1]), frozenset([True])),
+        ((1, 2), frozenset([1, 2])),
+    ],
+)
+def test_equal_values_of_different_types_are_different_keys(first_value, second_value):
+    cache = ChecksCache(10)
+
+    cache.remember(first_value, STRICT_TYPE_CHECK)
+
+    assert cache.passed(first_value, STRICT_TYPE_CHECK)
+    assert not cache.passed(second_value, STRICT_TYPE_CHECK)
+
+
+@pytest.mark.parametrize(
+    ['value'],
+    [
+        ([1, 2],),
+        ({'lol': 'kek'},),
+        ({1, 2},),
+        ((1, [2]),),
+        (object(),),
+    ],
+)
+def test_not_deeply_immutable_values_are_not_cached(value):
+    cache = ChecksCache(10)
+
+    cache.remember(value, STRICT_TYPE_CHECK)
+
+    assert not cache.passed(value, STRICT_TYPE_CHECK)
+    assert len(cache) == 0
+
+
+def test_least_recently_used_values_are_evicted():
+    cache = ChecksCache(2)
+
+    cache.remember(1, VALIDATION)
+    cache.remember(2, VALIDATION)
+
+    assert cache.passed(1, VALIDATION)
+
+    cache.remember(3, VALIDATION)
+
+    assert len(cache) == 2
+    assert cache.passed(1, VALIDATION)
+    assert not cache.passed(2, VALIDATION)
+    assert cache.passed(3, VALIDATION)
@@ -1,8 +1,79 @@
+from dataclasses import MISSING
+
 import pytest
 
+from skelet import MemorySource
 from skelet.sources.abstract import AbstractSource
 
 
 def test_cant_instantiate_abstract_class():
     with pytest.raises(TypeError):
         AbstractSource()
+
+
+def test_cant_instantiate_source_without_lookup_and_getitem():
+    class SomeSource(AbstractSource):
+        pass
+
+    with pytest.raises(TypeError):
+        SomeSource()
+
+
+def test_source_with_only_getitem_gets_lookup():
+    class SomeSource(AbstractSource):
+        def __getitem__(self, key):
+            if key == 'key':
+                return 'value'
+            raise KeyError(key)
+
+    source = SomeSource()
+
+    assert source.lookup('key') == 'value'
+    assert source.lookup('other_key') is MISSING
+    assert source['key'] == 'value'
+    assert source.get('other_key') is None
+    assert source.get('other_key', 'default') == 'default'
+    assert source.type_awared_get('key', str) == 'value'
+    assert source.type_awared_get('other_key', str) is None
+
+
+def test_source_with_only_lookup_gets_getitem_and_get():
+    class SomeSource(AbstractSource):
+        def lookup(self, key):
+            if key == 'key':
+                return 'value'
+            return MISSING
+
+    source = SomeSource()
+
+    assert source['key'] == 'value'
+    assert source.get('key') == 'value'
+    assert source.get('other_key', 'default') == 'default'
+
+    with pytest.raises(KeyError):
+        source['other_key']
+
+
+def test_overridden_getitem_of_built_in_source_is_used_by_lookup():
+    keys = []
+
+    class SomeSource(MemorySource):
+        def __getitem__(self, key):
+            keys.append(key)
+            return super().__getitem__(key)
+
+    source = SomeSource({'key': 'value'})
+
+    assert source.lookup('key') == 'value'
+    assert source.lookup('other_key') is MISSING
+    assert source.get('key') == 'value'
+    assert keys == ['key', 'other_key', 'key']
+
+
+def test_get_many():
+    class SomeSource(AbstractSource):
+        def lookup(self, key):
+            return {'lol': 'kek', 'cheburek': None}.get(key, MISSING)
+
+    assert SomeSource().get_many(['lol', 'cheburek', 'other']) == {'lol': 'kek', 'cheburek': None}
+    assert SomeSource().get_many([]) == {}
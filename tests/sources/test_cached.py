@@ -0,0 +1,243 @@
+from time import sleep
+from threading import Event
+from typing import List
+
+import pytest
+from full_match import match
+
+from skelet import CachedSource, MemorySource, EnvSource, Storage, Field
+from skelet.sources import cached as cached_module
+
+
+class Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class CountingSource(MemorySource):
+    def __init__(self, data):
+        super().__init__(data)
+        self.lookups = []
+        self.batches = []
+
+    def lookup(self, key):
+        self.lookups.append(key)
+        return super().lookup(key)
+
+    def get_many(self, keys):
+        self.batches.append(list(keys))
+        return {key: self.data[key] for key in keys if key in self.data}
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(cached_module, 'monotonic', clock)
+    return clock
+
+
+def wait_for_refreshing(source):
+    for _ in range(1000):
+        with source.lock:
+            if not source.refreshing:
+                return
+        sleep(0.001)
+
+
+def test_wrong_parameters():
+    with pytest.raises(ValueError, match=match('The TTL must be a positive number.')):
+        CachedSource(MemorySource({}), ttl=0)
+
+    with pytest.raises(ValueError, match=match('The maximum number of entries must be a positive number.')):
+        CachedSource(MemorySource({}), ttl=1, max_entries=0)
+
+    with pytest.raises(ValueError, match=match('The share of the TTL for refreshing ahead must be in the range from 0 to 1.')):
+        CachedSource(MemorySource({}), ttl=1, refresh_ahead=1)
+
+    with pytest.raises(ValueError, match=match('The share of the TTL for refreshing ahead must be in the range from 0 to 1.')):
+        CachedSource(MemorySource({}), ttl=1, refresh_ahead=-0.1)
+
+
+def test_repr():
+    assert repr(CachedSource(MemorySource({}), ttl=1)) == 'CachedSource(MemorySource({}), ttl=1)'
+    assert repr(CachedSource(MemorySource({}), ttl=1, max_entries=10, refresh_ahead=0)) == 'CachedSource(MemorySource({}), ttl=1, max_entries=10, refresh_ahead=0)'
+
+
+def test_values_are_cached_until_expiration(clock):
+    inner = CountingSource({'key': 'value'})
+    source = CachedSource(inner, ttl=10, refresh_ahead=0)
+
+    assert source['key'] == 'value'
+    assert source.get('other_key') is None
+
+    inner.data['key'] = 'new_value'
+    inner.data['other_key'] = 'other_value'
+    clock.now += 9.9
+
+    assert source['key'] == 'value'
+    assert source.get('other_key') is None
+    assert inner.lookups == ['key', 'other_key']
+
+    clock.now += 0.1
+
+    assert source['key'] == 'new_value'
+    assert source['other_key'] == 'other_value'
+    assert inner.lookups == ['key', 'other_key', 'key', 'other_key']
+
+
+def test_least_recently_used_entries_are_evicted(clock):
+    inner = CountingSource({'first': 1, 'second': 2, 'third': 3})
+    source = CachedSource(inner, ttl=10, max_entries=2)
+
+    assert source['first'] == 1
+    assert source['second'] == 2
+    assert source['first'] == 1
+    assert source['third'] == 3
+
+    assert list(source.entries) == ['first', 'third']
+
+    assert source['first'] == 1
+    assert source['second'] == 2
+    assert inner.lookups == ['first', 'second', 'third', 'second']
+
+
+def test_get_many_asks_inner_source_once_for_missed_keys(clock):
+    inner = CountingSource({'first': 1, 'second': 2})
+    source = CachedSource(inner, ttl=10)
+
+    assert source['first'] == 1
+    assert source.get_many(['first', 'second', 'third']) == {'first': 1, 'second': 2}
+    assert source.get_many(['first', 'second', 'third']) == {'first': 1, 'second': 2}
+
+    assert inner.lookups == ['first']
+    assert inner.batches == [['second', 'third']]
+
+
+def test_refresh_ahead(clock):
+    inner = CountingSource({'key': 'value'})
+    source = CachedSource(inner, ttl=10, refresh_ahead=0.2)
+
+    assert source['key'] == 'value'
+
+    inner.data['key'] = 'new_value'
+    clock.now += 7.9
+
+    assert source['key'] == 'value'
+    assert inner.batches == []
+
+    clock.now += 0.1
+
+    assert source['key'] == 'value'
+    wait_for_refreshing(source)
+
+    assert inner.batches == [['key']]
+    assert source['key'] == 'new_value'
+
+    clock.now += 7.9
+
+    assert source['key'] == 'new_value'
+    assert inner.lookups == ['key']
+
+
+def test_refresh_is_not_started_twice_and_does_not_block(clock):
+    started = Event()
+    release = Event()
+
+    class SlowSource(CountingSource):
+        def get_many(self, keys):
+            started.set()
+            release.wait()
+            return super().get_many(keys)
+
+    inner = SlowSource({'key': 'value'})
+    source = CachedSource(inner, ttl=10)
+
+    assert source['key'] == 'value'
+
+    clock.now += 9
+
+    assert source['key'] == 'value'
+    started.wait()
+    assert source['key'] == 'value'
+    assert source.refreshing == {'key'}
+
+    release.set()
+    wait_for_refreshing(source)
+
+    assert inner.batches == [['key']]
+
+
+def test_errors_of_refreshing_are_ignored(clock):
+    class BrokenSource(CountingSource):
+        def get_many(self, keys):
+            raise ConnectionError('kek')
+
+    inner = BrokenSource({'key': 'value'})
+    source = CachedSource(inner, ttl=10)
+
+    assert source['key'] == 'value'
+
+    clock.now += 9
+
+    assert source['key'] == 'value'
+    wait_for_refreshing(source)
+
+    assert source['key'] == 'value'
+
+    clock.now += 1
+
+    with pytest.raises(ConnectionError, match=match('kek')):
+        source.get_many(['key'])
+
+
+def test_reload(clock):
+    inner = CountingSource({'key': 'value'})
+    source = CachedSource(inner, ttl=10)
+
+    assert source['key'] == 'value'
+
+    inner.data['key'] = 'new_value'
+    source.reload()
+
+    assert source['key'] == 'new_value'
+
+
+def test_type_hints_are_applied_by_inner_source(monkeypatch):
+    monkeypatch.setenv('SKELET_CACHED_NUMBERS', '[1, 2, 3]')
+
+    source = CachedSource(EnvSource(prefix='skelet_cached_'), ttl=10)
+
+    assert source.type_awared_get('numbers', List[int]) == [1, 2, 3]
+    assert source.verifies_type_hint(int)
+    assert not source.verifies_type_hint(tuple)
+    assert CachedSource(MemorySource({}), ttl=10).verifies_type_hint(int)
+    assert source.fingerprint(['numbers']) == EnvSource(prefix='skelet_cached_').fingerprint(['numbers'])
+
+    class SomeClass(Storage, sources=[source]):
+        numbers: List[int] = Field([])
+
+    assert SomeClass().numbers == [1, 2, 3]
+
+
+def test_storage_with_cached_source(clock):
+    inner = CountingSource({'field': 1, 'other_field': 'kek'})
+
+    class SomeClass(Storage, sources=[CachedSource(inner, ttl=10)]):
+        field: int = Field(0)
+        other_field: str = Field('')
+        third_field: int = Field(3)
+
+    assert SomeClass().field == 1
+    assert SomeClass().other_field == 'kek'
+
+    inner.data['field'] = 2
+
+    assert SomeClass().field == 1
+
+    clock.now += 10
+
+    assert SomeClass().field == 2
+    assert inner.batches == [['field', 'other_field', 'third_field'], ['field', 'other_field', 'third_field']]
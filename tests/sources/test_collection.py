@@ -1,4 +1,5 @@
 from typing import List
+from dataclasses import MISSING
 
 import pytest
 from full_match import match
@@ -86,3 +87,219 @@ def test_type_awared_get():
     assert SourcesCollection([MemorySource({}), MemorySource({'key': 'kek'}), MemorySource({})]).type_awared_get('key2', str) is None
     assert SourcesCollection([MemorySource({}), MemorySource({'key': 'kek'}), MemorySource({})]).type_awared_get('key2', str, default='kek') == 'kek'
     assert SourcesCollection([MemorySource({}), MemorySource({'key': 'kek'}), MemorySource({})]).type_awared_get('key2', str, default=1) == 1
+
+
+def test_sources_that_cant_be_enumerated_are_probed_before_indexed_ones():
+    class CountingSource(MemorySource):
+        def __init__(self, data):
+            super().__init__(data)
+            self.calls = 0
+
+        def __getitem__(self, key):
+            self.calls += 1
+            return super().__getitem__(key)
+
+    class StaticSource(MemorySource):
+        def snapshot(self):
+            return self.data
+
+    first_probing = CountingSource({'first': 1})
+    static = StaticSource({'first': 2, 'second': 2, 'third': 2})
+    second_probing = CountingSource({'third': 3, 'fourth': 3})
+    collection = SourcesCollection([first_probing, static, second_probing])
+
+    assert collection['first'] == 1
+    assert collection['second'] == 2
+    assert collection['third'] == 2
+    assert collection['fourth'] == 3
+    assert collection.get('fifth') is None
+    assert collection['third'] == 2
+
+    assert first_probing.calls == 6
+    assert second_probing.calls == 2
+
+    assert collection.find_in_not_indexed_sources(collection.state, 'fourth', 0) == (2, second_probing, 3)
+    assert collection.find_in_not_indexed_sources(collection.state, 'second', 0) == (1, static, 2)
+
+
+def test_index_is_reset_after_reload():
+    class StaticSource(MemorySource):
+        def __init__(self, data):
+            super().__init__(data)
+            self.snapshots = 0
+
+        def snapshot(self):
+            self.snapshots += 1
+            return dict(self.data)
+
+    source = StaticSource({'key': 'value'})
+    collection = SourcesCollection([source])
+
+    assert collection['key'] == 'value'
+    assert collection['key'] == 'value'
+    assert source.snapshots == 1
+
+    source.data['key'] = 'new_value'
+
+    assert collection['key'] == 'value'
+
+    source.reload()
+
+    assert collection['key'] == 'new_value'
+    assert source.snapshots == 2
+
+
+def test_index_is_used_for_type_awared_get():
+    class StaticSource(MemorySource):
+        def __getitem__(self, key):
+            raise AssertionError('The index must be used instead of probing.')
+
+        def snapshot(self):
+            return self.data
+
+    collection = SourcesCollection([StaticSource({'key': [1, 2]}), StaticSource({'key': 'kek', 'other_key': 'lol'}), StaticSource({})])
+
+    assert collection.type_awared_get('key', List[int]) == [1, 2]
+    assert collection.type_awared_get('other_key', str) == 'lol'
+    assert collection.type_awared_get('third_key', str, default='kek') == 'kek'
+
+    with pytest.raises(TypeError, match=match('The value of the "key" field did not pass the type check.')):
+        collection.type_awared_get('key', List[str])
+
+
+def test_overridden_type_awared_get_of_source_is_respected():
+    class SpecialSource(MemorySource):
+        def type_awared_get(self, key, hint, default=None):
+            return 'special'
+
+    assert SourcesCollection([SpecialSource({'key': 'kek'})]).type_awared_get('key', str) == 'special'
+
+
+def test_lookup():
+    assert SourcesCollection([MemorySource({}), {'key': 'value'}]).lookup('key') == 'value'
+    assert SourcesCollection([MemorySource({}), {'key': 'value'}]).lookup('other_key') is MISSING
+
+
+def test_checked_get():
+    class NotVerifyingSource(MemorySource):
+        def apply_type_hint(self, key, value, hint):
+            return value
+
+    assert SourcesCollection([MemorySource({'key': 'kek'})]).checked_get('key', str) == ('kek', str)
+    assert SourcesCollection([NotVerifyingSource({'key': 'kek'})]).checked_get('key', str) == ('kek', None)
+    assert SourcesCollection([MemorySource({'key': 'kek'})]).checked_get('other_key', str) is None
+
+
+def test_find_many():
+    class StaticSource(MemorySource):
+        def __init__(self, data):
+            super().__init__(data)
+            self.snapshots = 0
+
+        def snapshot(self):
+            self.snapshots += 1
+            return self.data
+
+    class ProbingSource(MemorySource):
+        def __init__(self, data):
+            super().__init__(data)
+            self.probed_keys = []
+
+        def lookup(self, key):
+            self.probed_keys.append(key)
+            return super().lookup(key)
+
+    first = ProbingSource({'first': 1})
+    second = StaticSource({'first': 2, 'second': 2})
+    third = StaticSource({'third': 3})
+    fourth = StaticSource({'third': 4})
+    collection = SourcesCollection([first, second, third, fourth])
+
+    assert collection.find_many(['first', 'second']) == {'first': (0, first, 1), 'second': (1, second, 2)}
+    assert first.probed_keys == ['first', 'second']
+    assert second.snapshots == 1
+    assert third.snapshots == 0
+    assert fourth.snapshots == 0
+
+    assert collection.find_many(['third', 'second', 'fifth']) == {'third': (2, third, 3), 'second': (1, second, 2)}
+    assert second.snapshots == 1
+    assert third.snapshots == 1
+    assert fourth.snapshots == 1
+
+    assert collection.find_many([]) == {}
+    assert collection['third'] == 3
+    assert collection['first'] == 1
+
+
+def test_find_many_with_raw_dicts():
+    assert SourcesCollection([MemorySource({}), {'key': 'value'}]).find_many(['key', 'other_key']) == {'key': (1, {'key': 'value'}, 'value')}
+
+
+def test_check_entry():
+    source = MemorySource({'key': 'kek'})
+    collection = SourcesCollection([source])
+
+    assert collection.check_entry('key', (0, source, 'kek'), str) == ('kek', str)
+    assert collection.check_entry('key', None, str) is None
+
+    with pytest.raises(TypeError, match=match('The value of the "key" field did not pass the type check.')):
+        collection.check_entry('key', (0, source, 'kek'), int)
+
+
+def test_find_many_asks_probing_sources_once():
+    class BatchSource(MemorySource):
+        def __init__(self, data):
+            super().__init__(data)
+            self.batches = []
+
+        def lookup(self, key):
+            raise AssertionError('The batch method must be used.')
+
+        def get_many(self, keys):
+            self.batches.append(list(keys))
+            return {key: self.data[key] for key in keys if key in self.data}
+
+    first = BatchSource({'first': 1})
+    second = BatchSource({'first': 2, 'second': 2})
+    third = BatchSource({'third': 3})
+    collection = SourcesCollection([first, second, third])
+
+    assert collection.find_many(['first', 'second', 'fourth']) == {'first': (0, first, 1), 'second': (1, second, 2)}
+    assert first.batches == [['first', 'second', 'fourth']]
+    assert second.batches == [['second', 'fourth']]
+    assert third.batches == [['fourth']]
+
+
+def test_get_many():
+    collection = SourcesCollection([MemorySource({'first': 1}), {'first': 2, 'second': 2}])
+
+    assert collection.get_many(['first', 'second', 'third']) == {'first': 1, 'second': 2}
+
+
+
+def test_reload_during_lookup_does_not_break_priorities():
+    class ReloadingSource(MemorySource):
+        def __init__(self) -> None:
+            super().__init__({'probed': 'value'})
+            self.reload_next_lookup = False
+
+        def snapshot(self):
+            return None
+
+        def lookup(self, key):
+            if self.reload_next_lookup:
+                self.reload_next_lookup = False
+                collection.reload()
+                collection.get('probed')
+            return super().lookup(key)
+
+    source = ReloadingSource()
+    collection = SourcesCollection([source, MemorySource({'shared': 0}), MemorySource({}), MemorySource({'shared': 1})])
+
+    assert collection.get('shared') == 0
+
+    source.reload_next_lookup = True
+
+    assert collection.get('other') is None
+    assert collection.get('shared') == 0
+    assert collection.get('probed') == 'value'
@@ -0,0 +1,260 @@
+from os import scandir, stat, makedirs
+from os.path import join, realpath, exists
+
+import pytest
+from full_match import match
+
+from skelet import Storage, Field, TOMLSource, JSONSource, YAMLSource, for_tool
+from skelet.sources import directories
+from skelet.sources.directories import file_may_exist, check_file_existence, get_directory_listing, find_file
+
+
+@pytest.fixture
+def scanned_directories(monkeypatch):
+    calls = []
+
+    def counting_scandir(path):
+        calls.append(path)
+        return scandir(path)
+
+    monkeypatch.setattr(directories, 'scandir', counting_scandir)
+
+    return calls
+
+
+def write_file(path, content):
+    with open(path, 'w') as file:
+        file.write(content)
+
+
+def test_directory_is_scanned_once(temporary_dir_path, scanned_directories):
+    write_file(join(temporary_dir_path, 'file.toml'), 'key = 1')
+
+    assert file_may_exist(join(temporary_dir_path, 'file.toml'))
+    assert not file_may_exist(join(temporary_dir_path, 'file.yaml'))
+    assert not file_may_exist(join(temporary_dir_path, '.file.yaml'))
+
+    assert scanned_directories == [temporary_dir_path]
+    assert get_directory_listing(temporary_dir_path) == frozenset({'file.toml'})
+
+
+def test_names_are_compared_case_insensitive(temporary_dir_path):
+    write_file(join(temporary_dir_path, 'File.toml'), 'key = 1')
+
+    assert file_may_exist(join(temporary_dir_path, 'File.toml'))
+    assert file_may_exist(join(temporary_dir_path, 'file.toml'))
+
+
+def test_not_existing_directory(temporary_dir_path):
+    path = join(temporary_dir_path, 'directory', 'file.toml')
+
+    assert get_directory_listing(join(temporary_dir_path, 'directory')) is None
+    assert file_may_exist(path)
+    assert TOMLSource(path).fingerprint([]) == (repr(TOMLSource(path)), (path,))
+    assert TOMLSource(path).get('key') is None
+
+
+def test_check_file_existence(temporary_dir_path):
+    write_file(join(temporary_dir_path, 'file.toml'), 'key = 1')
+
+    check_file_existence(join(temporary_dir_path, 'file.toml'))
+
+    path = join(temporary_dir_path, 'other_file.toml')
+    with pytest.raises(FileNotFoundError, match=match(f'[Errno 2] No such file or directory: {path!r}')):
+        check_file_existence(path)
+
+
+def test_listings_are_forgotten_after_reload(temporary_dir_path, scanned_directories):
+    path = join(temporary_dir_path, 'file.json')
+    source = JSONSource(path)
+
+    assert source.get('key') is None
+    assert JSONSource(path).get('key') is None
+    assert scanned_directories == [temporary_dir_path]
+
+    source.reload()
+
+    assert JSONSource(path).get('key') is None
+    assert scanned_directories == [temporary_dir_path, temporary_dir_path]
+
+
+def test_new_files_are_found_without_reload(temporary_dir_path, scanned_directories):
+    path = join(temporary_dir_path, 'file.json')
+    source = JSONSource(path)
+
+    assert source.get('key') is None
+
+    write_file(path, '{"key": 1}')
+
+    assert JSONSource(path)['key'] == 1
+    assert source.get('key') is None
+    assert scanned_directories == [temporary_dir_path, temporary_dir_path]
+
+
+def test_directory_that_cannot_be_scanned(temporary_dir_path, monkeypatch):
+    def failing_scandir(path):
+        raise PermissionError(path)
+
+    monkeypatch.setattr(directories, 'scandir', failing_scandir)
+
+    assert get_directory_listing(temporary_dir_path) is None
+    assert file_may_exist(join(temporary_dir_path, 'file.toml'))
+
+
+@pytest.mark.parametrize(
+    ['source_class', 'extension'],
+    [
+        (TOMLSource, 'toml'),
+        (JSONSource, 'json'),
+        (YAMLSource, 'yaml'),
+    ],
+)
+def test_missing_files_are_not_opened(temporary_dir_path, scanned_directories, monkeypatch, source_class, extension):
+    def forbidden_open(*args, **kwargs):
+        raise AssertionError('Missing files must not be opened.')
+
+    path = join(temporary_dir_path, f'file.{extension}')
+    source = source_class(path)
+    strict_source = source_class(path, allow_non_existent_files=False)
+
+    monkeypatch.setattr('builtins.open', forbidden_open)
+
+    assert source.fingerprint(['key']) == (repr(source), (path,))
+    assert source.get('key') is None
+    assert source.fingerprint(['key']) == (repr(source), (path,))
+
+    with pytest.raises(FileNotFoundError):
+        strict_source.get('key')
+
+
+@pytest.mark.parametrize(
+    ['source_class', 'extension'],
+    [
+        (TOMLSource, 'toml'),
+        (JSONSource, 'json'),
+        (YAMLSource, 'yaml'),
+    ],
+)
+def test_missing_file_is_checked_with_one_stat(temporary_dir_path, monkeypatch, source_class, extension):
+    calls = []
+
+    def counting_stat(path):
+        calls.append(path)
+        return stat(path)
+
+    monkeypatch.setattr(directories, 'stat', counting_stat)
+    source = source_class(join(temporary_dir_path, f'file.{extension}'))
+
+    assert source.fingerprint(['key']) is not None
+    calls.clear()
+
+    assert source.get('key') is None
+    assert calls == [temporary_dir_path]
+
+
+def test_one_scan_for_all_candidates_of_a_tool(temporary_dir_path, scanned_directories, monkeypatch):
+    monkeypatch.chdir(temporary_dir_path)
+    write_file('pyproject.toml', '[tool.kek]\nfield = 1\n')
+
+    class SomeClass(Storage, sources=for_tool('kek')):
+        field: int = Field(0)
+        other_field: int = Field(0)
+
+    assert SomeClass().field == 1
+    assert len(scanned_directories) == 1
+
+
+@pytest.mark.parametrize(
+    ['source_class', 'extension', 'content'],
+    [
+        (TOMLSource, 'toml', 'key = 1'),
+        (JSONSource, 'json', '{"key": 1}'),
+        (YAMLSource, 'yaml', 'key: 1'),
+    ],
+)
+def test_search_in_parent_directories(temporary_dir_path, monkeypatch, source_class, extension, content):
+    root = realpath(temporary_dir_path)
+    makedirs(join(root, 'project', 'package', 'subpackage'))
+    write_file(join(root, 'project', f'file.{extension}'), content)
+    monkeypatch.chdir(join(root, 'project', 'package', 'subpackage'))
+
+    assert source_class(f'file.{extension}').get('key') is None
+    assert source_class(f'file.{extension}', search_parents=True)['key'] == 1
+    assert source_class(f'file.{extension}', search_parents=True).fingerprint(['key'])[1][0] == join(root, 'project', f'file.{extension}')
+    assert source_class(join(root, f'file.{extension}'), search_parents=True).get('key') is None
+
+
+def test_nearest_file_is_found(temporary_dir_path, monkeypatch):
+    root = realpath(temporary_dir_path)
+    makedirs(join(root, 'project', 'package'))
+    write_file(join(root, 'pyproject.toml'), '[tool.kek]\nfield = 1\n')
+    write_file(join(root, 'project', 'pyproject.toml'), '[tool.kek]\nfield = 2\n')
+    monkeypatch.chdir(join(root, 'project', 'package'))
+
+    class SomeClass(Storage, sources=for_tool('kek', search_parents=True)):
+        field: int = Field(0)
+
+    assert SomeClass().field == 2
+    assert find_file('pyproject.toml', True) == join(root, 'project', 'pyproject.toml')
+    assert find_file('pyproject.toml', False) == 'pyproject.toml'
+
+
+def test_not_found_file_stays_relative(temporary_dir_path, monkeypatch):
+    monkeypatch.chdir(temporary_dir_path)
+
+    assert find_file('kek_not_existing_file.toml', True) == 'kek_not_existing_file.toml'
+    assert TOMLSource('kek_not_existing_file.toml', search_parents=True).get('key') is None
+
+
+def test_found_locations_are_cached_until_reload(temporary_dir_path, monkeypatch, scanned_directories):
+    root = realpath(temporary_dir_path)
+    makedirs(join(root, 'project', 'package'))
+    write_file(join(root, 'file.toml'), 'key = 1')
+    monkeypatch.chdir(join(root, 'project', 'package'))
+
+    assert find_file('file.toml', True) == join(root, 'file.toml')
+    number_of_scans = len(scanned_directories)
+
+    assert find_file('file.toml', True) == join(root, 'file.toml')
+    source = TOMLSource('file.toml', search_parents=True)
+    assert source['key'] == 1
+    assert len(scanned_directories) == number_of_scans
+
+    write_file(join(root, 'project', 'file.toml'), 'key = 2')
+
+    assert find_file('file.toml', True) == join(root, 'file.toml')
+
+    source.reload()
+
+    assert find_file('file.toml', True) == join(root, 'project', 'file.toml')
+    assert TOMLSource('file.toml', search_parents=True)['key'] == 2
+
+
+def test_found_locations_depend_on_working_directory(temporary_dir_path, monkeypatch):
+    root = realpath(temporary_dir_path)
+    makedirs(join(root, 'project', 'package'))
+    write_file(join(root, 'file.toml'), 'key = 1')
+    write_file(join(root, 'project', 'file.toml'), 'key = 2')
+
+    monkeypatch.chdir(join(root, 'project', 'package'))
+    assert find_file('file.toml', True) == join(root, 'project', 'file.toml')
+
+    monkeypatch.chdir(root)
+    assert find_file('file.toml', True) == join(root, 'file.toml')
+
+
+def test_names_of_found_files_are_compared_exactly(temporary_dir_path, monkeypatch):
+    root = realpath(temporary_dir_path)
+    makedirs(join(root, 'project'))
+    write_file(join(root, 'pyproject.toml'), '[tool.kek]\nfield = 1\n')
+    write_file(join(root, 'project', 'PyProject.toml'), '[tool.kek]\nfield = 2\n')
+    monkeypatch.chdir(join(root, 'project'))
+
+    if exists(join(root, 'project', 'pyproject.toml')):
+        pytest.skip('The file system is not case-sensitive.')
+
+    class SomeClass(Storage, sources=for_tool('kek', search_parents=True)):
+        field: int = Field(0)
+
+    assert find_file('pyproject.toml', True) == join(root, 'pyproject.toml')
+    assert SomeClass().field == 1
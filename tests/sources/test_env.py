@@ -1,11 +1,12 @@
 import os
-from typing import List, Dict
+from typing import List, Dict, Tuple
 import platform
+from dataclasses import MISSING
 
 import pytest
 from full_match import match
 
-from skelet import EnvSource
+from skelet import EnvSource, Storage, Field
 from skelet.errors import CaseError
 
 
@@ -219,3 +220,77 @@ def test_read_with_prefix_and_postfix(monkeypatch):
 def test_try_to_use_case_sensitive_mod_on_windows():
     with pytest.raises(OSError, match=match('On Windows, the environment variables are case-independent.')):
         EnvSource(case_sensitive=True)
+
+
+def test_reload(monkeypatch):
+    monkeypatch.setenv('SKELET_RELOAD_KEY', 'kek')
+
+    source = EnvSource()
+
+    assert source['SKELET_RELOAD_KEY'] == 'kek'
+
+    monkeypatch.setenv('SKELET_RELOAD_KEY', 'lol')
+
+    assert source['SKELET_RELOAD_KEY'] == 'kek'
+
+    source.reload()
+
+    assert source['SKELET_RELOAD_KEY'] == 'lol'
+
+
+def test_lookup(monkeypatch):
+    monkeypatch.setenv('SKELET_LOOKUP_KEY', 'kek')
+
+    assert EnvSource(prefix='skelet_').lookup('lookup_key') == 'kek'
+    assert EnvSource(prefix='skelet_').lookup('other_lookup_key') is MISSING
+
+
+def test_fingerprint(monkeypatch):
+    monkeypatch.setenv('SKELET_FINGERPRINT_KEY', 'kek')
+    monkeypatch.delenv('SKELET_FINGERPRINT_OTHER_KEY', raising=False)
+
+    source = EnvSource(prefix='skelet_fingerprint_')
+    fingerprint = source.fingerprint(['key', 'other_key'])
+
+    assert fingerprint == EnvSource(prefix='skelet_fingerprint_').fingerprint(['key', 'other_key'])
+    assert fingerprint != EnvSource(prefix='skelet_').fingerprint(['key', 'other_key'])
+    assert fingerprint != source.fingerprint(['key'])
+
+    monkeypatch.setenv('SKELET_FINGERPRINT_THIRD_KEY', 'lol')
+
+    assert EnvSource(prefix='skelet_fingerprint_').fingerprint(['key', 'other_key']) == fingerprint
+
+    monkeypatch.setenv('SKELET_FINGERPRINT_OTHER_KEY', 'lol')
+
+    assert EnvSource(prefix='skelet_fingerprint_').fingerprint(['key', 'other_key']) != fingerprint
+    assert source.fingerprint(['key', 'other_key']) == fingerprint
+
+
+def test_verifies_type_hint():
+    source = EnvSource()
+
+    assert source.verifies_type_hint(str)
+    assert source.verifies_type_hint(int)
+    assert source.verifies_type_hint(float)
+    assert source.verifies_type_hint(bool)
+    assert not source.verifies_type_hint(tuple)
+    assert not source.verifies_type_hint(Tuple[int, int])
+    assert not source.verifies_type_hint(List[Tuple[int, int]])
+    assert not source.verifies_type_hint(Dict[str, Tuple[int, int]])
+
+
+@pytest.mark.parametrize(
+    ['hint', 'value'],
+    [
+        (List[Tuple[int, int]], '[[1, 2]]'),
+        (Dict[str, Tuple[int, int]], '{"key": [1, 2]}'),
+    ],
+)
+def test_nested_tuples_from_environment_are_checked(monkeypatch, hint, value):
+    monkeypatch.setenv('FIELD', value)
+
+    class SomeClass(Storage, sources=[EnvSource()]):
+        field: hint = Field()  # type: ignore[valid-type]
+
+    with pytest.raises(TypeError):
+        SomeClass()
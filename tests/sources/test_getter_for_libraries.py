@@ -41,3 +41,8 @@ def test_all_sources():
     assert isinstance(sources[7], JSONSource)
     assert sources[7].path == '.kek.json'
     assert sources[7].allow_non_existent_files == True
+
+
+def test_search_in_parents():
+    assert all(not getattr(source, 'search_parents', False) for source in for_tool('kek'))
+    assert all(source.search_parents for source in for_tool('kek', search_parents=True) if not isinstance(source, EnvSource))
@@ -1,9 +1,12 @@
 from typing import List
+from dataclasses import MISSING
 
 import pytest
 from full_match import match
 
-from skelet import JSONSource
+from skelet import JSONSource, Storage, Field
+from skelet.sources import file as file_module
+from skelet.sources.fingerprints import get_file_fingerprint
 
 
 @pytest.mark.parametrize(
@@ -76,6 +79,10 @@ def test_defaults_for_libraries():
     assert sources[1].allow_non_existent_files == True
 
 
+def test_defaults_for_libraries_with_search_in_parents():
+    assert all(not source.search_parents for source in JSONSource.for_library('library'))
+    assert all(source.search_parents for source in JSONSource.for_library('library', search_parents=True))
+
 def test_defaults_for_not_allowed_library_name():
     with pytest.raises(ValueError, match=match('The library name can only be a valid Python identifier.')):
         JSONSource.for_library(':library')
@@ -85,6 +92,8 @@ def test_repr():
     assert repr(JSONSource('file.json')) == "JSONSource('file.json')"
     assert repr(JSONSource('file.json', allow_non_existent_files=False)) == "JSONSource('file.json', allow_non_existent_files=False)"
     assert repr(JSONSource('file.json', allow_non_existent_files=True)) == "JSONSource('file.json')"
+    assert repr(JSONSource('file.json', search_parents=True)) == "JSONSource('file.json', search_parents=True)"
+    assert repr(JSONSource('file.json', search_parents=False)) == "JSONSource('file.json')"
 
 
 @pytest.mark.parametrize(
@@ -119,3 +128,149 @@ def test_type_awared_get(json_config_path):
 
     assert JSONSource(json_config_path).type_awared_get('key2', str) is None
     assert JSONSource(json_config_path).type_awared_get('key2', str, default='kek') == 'kek'
+
+
+@pytest.mark.parametrize(
+    ['data'],
+    [
+        ({
+            'value': 1,
+        },),
+    ],
+)
+def test_snapshot_and_reload(json_config_path):
+    source = JSONSource(json_config_path)
+
+    assert source.snapshot() == {'value': 1}
+
+    with open(json_config_path, 'w') as file:
+        file.write('{"value": 2}')
+
+    assert source.snapshot() == {'value': 1}
+
+    source.reload()
+
+    assert source.snapshot() == {'value': 2}
+
+
+@pytest.mark.parametrize(
+    ['data'],
+    [
+        ([1, 2, 3],),
+    ],
+)
+def test_snapshot_of_not_dict_content(json_config_path):
+    assert JSONSource(json_config_path).snapshot() is None
+
+
+@pytest.mark.parametrize(
+    ['data'],
+    [
+        ({
+            'value': 1,
+        },),
+    ],
+)
+def test_overridden_lookup_is_respected_by_storages(json_config_path):
+    class MultiplyingByGetitemSource(JSONSource):
+        def __getitem__(self, key):
+            return super().__getitem__(key) * 100
+
+    class MultiplyingByLookupSource(JSONSource):
+        def lookup(self, key):
+            return super().lookup(key) * 10
+
+    by_getitem = MultiplyingByGetitemSource(json_config_path)
+    by_lookup = MultiplyingByLookupSource(json_config_path)
+
+    class FirstStorage(Storage, sources=[by_getitem]):
+        value: int = Field(0)
+
+    class SecondStorage(Storage, sources=[by_lookup]):
+        value: int = Field(0)
+
+    assert by_getitem.snapshot() is None
+    assert by_lookup.snapshot() is None
+    assert JSONSource(json_config_path).snapshot() == {'value': 1}
+    assert by_getitem['value'] == 100
+    assert FirstStorage().value == 100
+    assert SecondStorage().value == 10
+
+
+@pytest.mark.parametrize(
+    ['data'],
+    [
+        ({
+            'value': 1,
+        },),
+    ],
+)
+def test_lookup(json_config_path):
+    source = JSONSource(json_config_path)
+
+    assert source.lookup('value') == 1
+    assert source.lookup('other_value') is MISSING
+
+
+@pytest.mark.parametrize(
+    ['data'],
+    [
+        ({
+            'value': 1,
+        },),
+    ],
+)
+def test_fingerprint(json_config_path):
+    source = JSONSource(json_config_path)
+    fingerprint = source.fingerprint(['value'])
+
+    assert fingerprint == source.fingerprint([])
+    assert fingerprint == JSONSource(json_config_path).fingerprint(['value'])
+    assert fingerprint != JSONSource(json_config_path, allow_non_existent_files=False).fingerprint(['value'])
+
+    source.data
+
+    with open(json_config_path, 'w') as file:
+        file.write('{"value": 22}')
+
+    assert source.fingerprint(['value']) == fingerprint
+    assert JSONSource(json_config_path).fingerprint(['value']) != fingerprint
+
+    source.reload()
+
+    assert source.fingerprint(['value']) == JSONSource(json_config_path).fingerprint(['value'])
+    assert source.fingerprint(['value']) != fingerprint
+
+
+@pytest.mark.parametrize(
+    ['data'],
+    [
+        ({
+            'value': 1,
+        },),
+    ],
+)
+def test_fingerprint_is_tracked_only_after_it_was_requested(json_config_path, monkeypatch):
+    calls = []
+
+    def counting_get_file_fingerprint(path, may_exist=None):
+        calls.append(path)
+        return get_file_fingerprint(path, may_exist)
+
+    monkeypatch.setattr(file_module, 'get_file_fingerprint', counting_get_file_fingerprint)
+    source = JSONSource(json_config_path)
+
+    assert source['value'] == 1
+    assert calls == []
+    assert source.fingerprint(['value']) is None
+
+    source.reload()
+
+    assert source['value'] == 1
+    assert source.fingerprint(['value']) == JSONSource(json_config_path).fingerprint(['value'])
+    assert len(calls) == 2
+
+
+def test_fingerprint_of_non_existent_file():
+    assert JSONSource('kek.json').fingerprint(['value']) == JSONSource('kek.json').fingerprint(['value'])
+    assert JSONSource('kek.json').fingerprint(['value']) != JSONSource('lol.json').fingerprint(['value'])
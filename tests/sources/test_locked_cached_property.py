@@ -0,0 +1,99 @@
+from time import sleep
+from threading import Thread, Barrier, Event
+
+from skelet.sources.locked_cached_property import locked_cached_property
+
+
+class CountingObject:
+    def __init__(self):
+        self.calls = 0
+
+    @locked_cached_property
+    def data(self):
+        self.calls += 1
+        sleep(0.01)
+        return [self.calls]
+
+
+def test_value_is_cached():
+    instance = CountingObject()
+
+    assert instance.data == [1]
+    assert instance.data is instance.data
+    assert instance.calls == 1
+
+
+def test_access_from_class():
+    assert isinstance(CountingObject.data, locked_cached_property)
+    assert CountingObject.data.name == 'data'
+
+
+def test_values_are_not_shared_between_instances():
+    first = CountingObject()
+    second = CountingObject()
+
+    assert first.data is not second.data
+    assert first.calls == 1
+    assert second.calls == 1
+
+
+def test_reset():
+    instance = CountingObject()
+
+    assert instance.data == [1]
+
+    CountingObject.data.reset(instance)
+
+    assert instance.data == [2]
+    assert instance.calls == 2
+
+
+def test_reset_before_first_access():
+    instance = CountingObject()
+
+    CountingObject.data.reset(instance)
+
+    assert instance.data == [1]
+
+
+def test_function_is_called_once_under_concurrency():
+    instance = CountingObject()
+    number_of_threads = 20
+    barrier = Barrier(number_of_threads)
+    results = []
+
+    def read():
+        barrier.wait()
+        results.append(instance.data)
+
+    threads = [Thread(target=read) for _ in range(number_of_threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert instance.calls == 1
+    assert len(results) == number_of_threads
+    assert all(result is results[0] for result in results)
+
+
+def test_reset_waits_for_loading():
+    loading_started = Event()
+
+    class SignalingObject(CountingObject):
+        @locked_cached_property
+        def data(self):
+            self.calls += 1
+            loading_started.set()
+            sleep(0.01)
+            return [self.calls]
+
+    instance = SignalingObject()
+    thread = Thread(target=lambda: instance.data)
+
+    thread.start()
+    loading_started.wait()
+    SignalingObject.data.reset(instance)
+    thread.join()
+
+    assert instance.data == [2]
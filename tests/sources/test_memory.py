@@ -1,4 +1,5 @@
 from typing import List
+from dataclasses import MISSING
 
 import pytest
 from full_match import match
@@ -77,3 +78,20 @@ def test_type_awared_get():
 
     assert source.type_awared_get('key2', str) is None
     assert source.type_awared_get('key2', str, default='kek') == 'kek'
+
+
+def test_lookup():
+    class PseudoDict:
+        def __getitem__(self, key):
+            if key == 'key':
+                return 'value'
+            raise KeyError(key)
+
+    assert MemorySource({'key': 'value'}).lookup('key') == 'value'
+    assert MemorySource({'key': 'value'}).lookup('other_key') is MISSING
+    assert MemorySource(PseudoDict()).lookup('key') == 'value'
+    assert MemorySource(PseudoDict()).lookup('other_key') is MISSING
+
+
+def test_fingerprint():
+    assert MemorySource({'lol': 'kek'}).fingerprint(['lol']) is None
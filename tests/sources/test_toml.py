@@ -1,9 +1,10 @@
 from typing import List
+from dataclasses import MISSING
 
 import pytest
 from full_match import match
 
-from skelet import TOMLSource
+from skelet import TOMLSource, Storage, Field
 
 
 @pytest.mark.parametrize(
@@ -207,6 +208,10 @@ def test_defaults_for_libraries():
     assert sources[2].allow_non_existent_files == True
 
 
+def test_defaults_for_libraries_with_search_in_parents():
+    assert all(not source.search_parents for source in TOMLSource.for_library('library'))
+    assert all(source.search_parents for source in TOMLSource.for_library('library', search_parents=True))
+
 def test_defaults_for_not_allowed_library_name():
     with pytest.raises(ValueError, match=match('The library name can only be a valid Python identifier.')):
         TOMLSource.for_library(':library')
@@ -216,6 +221,8 @@ def test_repr():
     assert repr(TOMLSource('file.toml')) == "TOMLSource('file.toml')"
     assert repr(TOMLSource('file.toml', allow_non_existent_files=False)) == "TOMLSource('file.toml', allow_non_existent_files=False)"
     assert repr(TOMLSource('file.toml', allow_non_existent_files=True)) == "TOMLSource('file.toml')"
+    assert repr(TOMLSource('file.toml', search_parents=True)) == "TOMLSource('file.toml', search_parents=True)"
+    assert repr(TOMLSource('file.toml', search_parents=False)) == "TOMLSource('file.toml')"
     assert repr(TOMLSource('file.toml', table='lol.kek')) == "TOMLSource('file.toml', table=['lol', 'kek'])"
     assert repr(TOMLSource('file.toml', table=['lol', 'kek'])) == "TOMLSource('file.toml', table=['lol', 'kek'])"
     assert repr(TOMLSource('file.toml', table=['lol', 'kek'], allow_non_existent_files=False)) == "TOMLSource('file.toml', table=['lol', 'kek'], allow_non_existent_files=False)"
@@ -253,3 +260,122 @@ def test_type_awared_get(toml_config_path):
 
     assert TOMLSource(toml_config_path).type_awared_get('key2', str) is None
     assert TOMLSource(toml_config_path).type_awared_get('key2', str, default='kek') == 'kek'
+
+
+@pytest.mark.parametrize(
+    ['data'],
+    [
+        ({
+            'value': 1,
+        },),
+    ],
+)
+def test_snapshot_and_reload(toml_config_path):
+    source = TOMLSource(toml_config_path)
+
+    assert source.snapshot() == {'value': 1}
+
+    with open(toml_config_path, 'w') as file:
+        file.write('value = 2')
+
+    assert source.snapshot() == {'value': 1}
+
+    source.reload()
+
+    assert source.snapshot() == {'value': 2}
+
+
+@pytest.mark.parametrize(
+    ['data'],
+    [
+        ({
+            'value': 1,
+        },),
+    ],
+)
+def test_snapshot_of_not_table_content(toml_config_path):
+    assert TOMLSource(toml_config_path, table='value').snapshot() is None
+
+
+@pytest.mark.parametrize(
+    ['data'],
+    [
+        ({
+            'value': 1,
+        },),
+    ],
+)
+def test_overridden_lookup_is_respected_by_storages(toml_config_path):
+    class MultiplyingByGetitemSource(TOMLSource):
+        def __getitem__(self, key):
+            return super().__getitem__(key) * 100
+
+    class MultiplyingByLookupSource(TOMLSource):
+        def lookup(self, key):
+            return super().lookup(key) * 10
+
+    by_getitem = MultiplyingByGetitemSource(toml_config_path)
+    by_lookup = MultiplyingByLookupSource(toml_config_path)
+
+    class FirstStorage(Storage, sources=[by_getitem]):
+        value: int = Field(0)
+
+    class SecondStorage(Storage, sources=[by_lookup]):
+        value: int = Field(0)
+
+    assert by_getitem.snapshot() is None
+    assert by_lookup.snapshot() is None
+    assert TOMLSource(toml_config_path).snapshot() == {'value': 1}
+    assert by_getitem['value'] == 100
+    assert FirstStorage().value == 100
+    assert SecondStorage().value == 10
+
+
+@pytest.mark.parametrize(
+    ['data'],
+    [
+        ({
+            'value': 1,
+        },),
+    ],
+)
+def test_lookup(toml_config_path):
+    source = TOMLSource(toml_config_path)
+
+    assert source.lookup('value') == 1
+    assert source.lookup('other_value') is MISSING
+
+
+@pytest.mark.parametrize(
+    ['data'],
+    [
+        ({
+            'value': 1,
+        },),
+    ],
+)
+def test_fingerprint(toml_config_path):
+    source = TOMLSource(toml_config_path)
+    fingerprint = source.fingerprint(['value'])
+
+    assert fingerprint == source.fingerprint([])
+    assert fingerprint == TOMLSource(toml_config_path).fingerprint(['value'])
+    assert fingerprint != TOMLSource(toml_config_path, allow_non_existent_files=False).fingerprint(['value'])
+
+    source.data
+
+    with open(toml_config_path, 'w') as file:
+        file.write('value = 22')
+
+    assert source.fingerprint(['value']) == fingerprint
+    assert TOMLSource(toml_config_path).fingerprint(['value']) != fingerprint
+
+    source.reload()
+
+    assert source.fingerprint(['value']) == TOMLSource(toml_config_path).fingerprint(['value'])
+    assert source.fingerprint(['value']) != fingerprint
+
+
+def test_fingerprint_of_non_existent_file():
+    assert TOMLSource('kek.toml').fingerprint(['value']) == TOMLSource('kek.toml').fingerprint(['value'])
+    assert TOMLSource('kek.toml').fingerprint(['value']) != TOMLSource('lol.toml').fingerprint(['value'])
@@ -1,9 +1,14 @@
 from typing import List
+from time import sleep
+from threading import Thread, Barrier
+from dataclasses import MISSING
 
 import pytest
 from full_match import match
+from yaml import load
 
-from skelet import YAMLSource
+from skelet import YAMLSource, Storage, Field
+from skelet.sources import yaml as yaml_module
 
 
 @pytest.mark.parametrize(
@@ -76,6 +81,10 @@ def test_defaults_for_libraries():
     assert sources[1].allow_non_existent_files == True
 
 
+def test_defaults_for_libraries_with_search_in_parents():
+    assert all(not source.search_parents for source in YAMLSource.for_library('library'))
+    assert all(source.search_parents for source in YAMLSource.for_library('library', search_parents=True))
+
 def test_defaults_for_not_allowed_library_name():
     with pytest.raises(ValueError, match=match('The library name can only be a valid Python identifier.')):
         YAMLSource.for_library(':library')
@@ -85,6 +94,8 @@ def test_repr():
     assert repr(YAMLSource('file.yaml')) == "YAMLSource('file.yaml')"
     assert repr(YAMLSource('file.yaml', allow_non_existent_files=False)) == "YAMLSource('file.yaml', allow_non_existent_files=False)"
     assert repr(YAMLSource('file.yaml', allow_non_existent_files=True)) == "YAMLSource('file.yaml')"
+    assert repr(YAMLSource('file.yaml', search_parents=True)) == "YAMLSource('file.yaml', search_parents=True)"
+    assert repr(YAMLSource('file.yaml', search_parents=False)) == "YAMLSource('file.yaml')"
 
 
 @pytest.mark.parametrize(
@@ -119,3 +130,169 @@ def test_type_awared_get(yaml_config_path):
 
     assert YAMLSource(yaml_config_path).type_awared_get('key2', str) is None
     assert YAMLSource(yaml_config_path).type_awared_get('key2', str, default='kek') == 'kek'
+
+
+@pytest.mark.parametrize(
+    ['data'],
+    [
+        ({
+            'value': 1,
+        },),
+    ],
+)
+def test_snapshot_and_reload(yaml_config_path):
+    source = YAMLSource(yaml_config_path)
+
+    assert source.snapshot() == {'value': 1}
+
+    with open(yaml_config_path, 'w') as file:
+        file.write('{"value": 2}')
+
+    assert source.snapshot() == {'value': 1}
+
+    source.reload()
+
+    assert source.snapshot() == {'value': 2}
+
+
+@pytest.mark.parametrize(
+    ['data'],
+    [
+        ([1, 2, 3],),
+    ],
+)
+def test_snapshot_of_not_dict_content(yaml_config_path):
+    assert YAMLSource(yaml_config_path).snapshot() is None
+
+
+@pytest.mark.parametrize(
+    ['data'],
+    [
+        ({
+            'value': 1,
+        },),
+    ],
+)
+def test_overridden_lookup_is_respected_by_storages(yaml_config_path):
+    class MultiplyingByGetitemSource(YAMLSource):
+        def __getitem__(self, key):
+            return super().__getitem__(key) * 100
+
+    class MultiplyingByLookupSource(YAMLSource):
+        def lookup(self, key):
+            return super().lookup(key) * 10
+
+    by_getitem = MultiplyingByGetitemSource(yaml_config_path)
+    by_lookup = MultiplyingByLookupSource(yaml_config_path)
+
+    class FirstStorage(Storage, sources=[by_getitem]):
+        value: int = Field(0)
+
+    class SecondStorage(Storage, sources=[by_lookup]):
+        value: int = Field(0)
+
+    assert by_getitem.snapshot() is None
+    assert by_lookup.snapshot() is None
+    assert YAMLSource(yaml_config_path).snapshot() == {'value': 1}
+    assert by_getitem['value'] == 100
+    assert FirstStorage().value == 100
+    assert SecondStorage().value == 10
+
+
+@pytest.mark.parametrize(
+    ['data'],
+    [
+        ({
+            'value': 1,
+        },),
+    ],
+)
+def test_lookup(yaml_config_path):
+    source = YAMLSource(yaml_config_path)
+
+    assert source.lookup('value') == 1
+    assert source.lookup('other_value') is MISSING
+
+
+@pytest.mark.parametrize(
+    ['data'],
+    [
+        ({
+            'value': 1,
+        },),
+    ],
+)
+def test_file_is_parsed_once_under_concurrency(yaml_config_path, monkeypatch):
+    calls = []
+
+    def slow_load(file, Loader):
+        calls.append(file.name)
+        sleep(0.01)
+        return load(file, Loader=Loader)
+
+    monkeypatch.setattr(yaml_module, 'load', slow_load)
+
+    source = YAMLSource(yaml_config_path)
+    number_of_threads = 20
+    barrier = Barrier(number_of_threads)
+    results = []
+
+    class SomeClass(Storage, sources=[source]):
+        value: int = Field(0)
+
+    def create():
+        barrier.wait()
+        results.append(SomeClass().value)
+
+    threads = [Thread(target=create) for _ in range(number_of_threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == [1] * number_of_threads
+
+    source.reload()
+    threads = [Thread(target=lambda: results.append(source['value'])) for _ in range(number_of_threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 2
+
+
+@pytest.mark.parametrize(
+    ['data'],
+    [
+        ({
+            'value': 1,
+        },),
+    ],
+)
+def test_fingerprint(yaml_config_path):
+    source = YAMLSource(yaml_config_path)
+    fingerprint = source.fingerprint(['value'])
+
+    assert fingerprint == source.fingerprint([])
+    assert fingerprint == YAMLSource(yaml_config_path).fingerprint(['value'])
+    assert fingerprint != YAMLSource(yaml_config_path, allow_non_existent_files=False).fingerprint(['value'])
+
+    source.data
+
+    with open(yaml_config_path, 'w') as file:
+        file.write('value: 22')
+
+    assert source.fingerprint(['value']) == fingerprint
+    assert YAMLSource(yaml_config_path).fingerprint(['value']) != fingerprint
+
+    source.reload()
+
+    assert source.fingerprint(['value']) == YAMLSource(yaml_config_path).fingerprint(['value'])
+    assert source.fingerprint(['value']) != fingerprint
+
+
+def test_fingerprint_of_non_existent_file():
+    assert YAMLSource('kek.yaml').fingerprint(['value']) == YAMLSource('kek.yaml').fingerprint(['value'])
+    assert YAMLSource('kek.yaml').fingerprint(['value']) != YAMLSource('lol.yaml').fingerprint(['value'])
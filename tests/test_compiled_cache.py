@@ -0,0 +1,431 @@
+from os import listdir
+from os.path import join
+from threading import Lock
+from typing import List
+
+import pytest
+from yaml import load
+
+from skelet import Storage, Field, YAMLSource, EnvSource, MemorySource
+from skelet.sources import yaml as yaml_module
+from skelet.compiled_cache import CompiledCache, CacheEntry
+
+
+LIMIT = 10
+
+
+def normalize(value):
+    return value
+
+
+def recursive_helper(value):
+    return recursive_helper(value - 1) if value else value
+
+
+@pytest.fixture
+def parsing_calls(monkeypatch):
+    calls = []
+
+    def counting_load(file, Loader):
+        calls.append(file.name)
+        return load(file, Loader=Loader)
+
+    monkeypatch.setattr(yaml_module, 'load', counting_load)
+
+    return calls
+
+
+def write_file(path, content):
+    with open(path, 'w') as file:
+        file.write(content)
+
+
+def test_cold_start_writes_cache_and_warm_start_does_not_parse(temporary_dir_path, parsing_calls):
+    path = join(temporary_dir_path, 'file.yaml')
+    cache_dir = join(temporary_dir_path, 'cache')
+    write_file(path, 'number: 1\nstrings: ["lol", "kek"]\n')
+
+    validations: List[int] = []
+    record = validations.append
+
+    def make_class():
+        class SomeClass(Storage, sources=[YAMLSource(path)], cache_dir=cache_dir):
+            number: int = Field(0, validation=lambda x: record(x) is None)
+            strings: List[str] = Field(default_factory=list)
+            default_field: str = Field('kek')
+
+        return SomeClass
+
+    instance = make_class()()
+
+    assert instance.number == 1
+    assert instance.strings == ['lol', 'kek']
+    assert instance.default_field == 'kek'
+    assert len(parsing_calls) == 1
+    assert validations.count(1) == 1
+    assert len(listdir(cache_dir)) == 1
+
+    instance = make_class()()
+
+    assert instance.number == 1
+    assert instance.strings == ['lol', 'kek']
+    assert instance.default_field == 'kek'
+    assert len(parsing_calls) == 1
+    assert validations.count(1) == 1
+
+
+def test_cache_entry_content(temporary_dir_path):
+    path = join(temporary_dir_path, 'file.yaml')
+    write_file(path, 'number: 1\n')
+
+    class SomeClass(Storage, sources=[YAMLSource(path)], cache_dir=temporary_dir_path):
+        number: int = Field(0)
+        strings: List[str] = Field(default_factory=list)
+        default_field: str = Field('kek')
+
+    instance = SomeClass()
+    cache = SomeClass.__compiled_cache__
+
+    entry = cache.load(cache.get_key(instance))
+
+    assert entry.values == {'number': 1}
+    assert entry.absent == frozenset({'strings', 'default_field'})
+
+
+def test_changed_file_invalidates_cache(temporary_dir_path, parsing_calls):
+    path = join(temporary_dir_path, 'file.yaml')
+    write_file(path, 'number: 1\n')
+
+    def make_class():
+        class SomeClass(Storage, sources=[YAMLSource(path)], cache_dir=temporary_dir_path):
+            number: int = Field(0)
+
+        return SomeClass
+
+    assert make_class()().number == 1
+
+    write_file(path, 'number: 22\n')
+
+    assert make_class()().number == 22
+    assert len(parsing_calls) == 2
+
+    assert make_class()().number == 22
+    assert len(parsing_calls) == 2
+
+
+def test_reloaded_source_invalidates_cache(temporary_dir_path):
+    path = join(temporary_dir_path, 'file.yaml')
+    write_file(path, 'number: 1\n')
+
+    class SomeClass(Storage, sources=[YAMLSource(path)], cache_dir=temporary_dir_path):
+        number: int = Field(0)
+
+    assert SomeClass().number == 1
+
+    write_file(path, 'number: 22\n')
+
+    assert SomeClass().number == 1
+
+    SomeClass.__sources__.sources[0].reload()
+
+    assert SomeClass().number == 22
+
+
+def test_changed_environment_invalidates_cache(temporary_dir_path, monkeypatch):
+    monkeypatch.setenv('SKELET_CACHE_NUMBER', '1')
+
+    def make_env_class():
+        class SomeClass(Storage, sources=[EnvSource(prefix='skelet_cache_')], cache_dir=temporary_dir_path):
+            number: int = Field(0)
+
+        return SomeClass
+
+    assert make_env_class()().number == 1
+
+    monkeypatch.setenv('SKELET_CACHE_NUMBER', '2')
+
+    assert make_env_class()().number == 2
+
+    monkeypatch.setenv('SKELET_CACHE_OTHER_VALUE', '3')
+    SomeClass = make_env_class()
+    instance = SomeClass()
+
+    assert instance.number == 2
+    assert SomeClass.__compiled_cache__.entry is not None
+
+
+def test_changed_schema_invalidates_cache(temporary_dir_path):
+    path = join(temporary_dir_path, 'file.yaml')
+    write_file(path, 'number: 10\n')
+
+    def make_class_with_validation(validation):
+        class SomeClass(Storage, sources=[YAMLSource(path)], cache_dir=temporary_dir_path):
+            number: int = Field(5, validation=validation)
+
+        return SomeClass
+
+    first_class = make_class_with_validation(lambda x: x > 0)
+    second_class = make_class_with_validation(lambda x: x > 1)
+    third_class = make_class_with_validation({'The number must be positive.': lambda x: x > 0})
+
+    assert first_class.__compiled_cache__.get_key(first_class()) != second_class.__compiled_cache__.get_key(second_class())
+    assert first_class.__compiled_cache__.get_key(first_class()) != third_class.__compiled_cache__.get_key(third_class())
+    assert first_class.__compiled_cache__.get_key(first_class()) == make_class_with_validation(lambda x: x > 0).__compiled_cache__.get_key(first_class())
+
+
+def test_memory_sources_are_not_cached(temporary_dir_path):
+    class SomeClass(Storage, sources=[MemorySource({'number': 1})], cache_dir=temporary_dir_path):
+        number: int = Field(0)
+
+    assert SomeClass().number == 1
+    assert SomeClass.__compiled_cache__.get_key(SomeClass()) is None
+    assert listdir(temporary_dir_path) == []
+
+
+def test_secret_fields_are_not_cached(temporary_dir_path):
+    path = join(temporary_dir_path, 'file.yaml')
+    cache_dir = join(temporary_dir_path, 'cache')
+    write_file(path, 'number: 1\npassword: "top secret"\n')
+
+    def make_secret_class():
+        class SomeClass(Storage, sources=[YAMLSource(path)], cache_dir=cache_dir):
+            number: int = Field(0)
+            password: str = Field('', secret=True)
+
+        return SomeClass
+
+    make_secret_class()()
+
+    with open(join(cache_dir, listdir(cache_dir)[0]), 'rb') as file:
+        assert b'top secret' not in file.read()
+
+    instance = make_secret_class()()
+
+    assert instance.number == 1
+    assert instance.password == 'top secret'
+
+
+def test_kwargs_are_not_cached_and_missing_values_are_added_later(temporary_dir_path):
+    path = join(temporary_dir_path, 'file.yaml')
+    write_file(path, 'number: 1\nstrings: ["lol"]\n')
+
+    class SomeClass(Storage, sources=[YAMLSource(path)], cache_dir=temporary_dir_path):
+        number: int = Field(0)
+        strings: List[str] = Field(default_factory=list)
+
+    cache = SomeClass.__compiled_cache__
+
+    assert SomeClass(number=5).number == 5
+    assert cache.entry.values == {'strings': ['lol']}
+
+    assert SomeClass().number == 1
+    assert cache.entry.values == {'strings': ['lol'], 'number': 1}
+
+    assert SomeClass(number=5).number == 5
+    assert SomeClass().number == 1
+
+
+def test_converted_values_are_cached(temporary_dir_path):
+    path = join(temporary_dir_path, 'file.yaml')
+    write_file(path, 'number: 1\n')
+
+    def make_converting_class():
+        class SomeClass(Storage, sources=[YAMLSource(path)], cache_dir=temporary_dir_path):
+            number: int = Field(0, conversion=lambda x: x * 10)
+
+        return SomeClass
+
+    assert make_converting_class()().number == 10
+
+    SomeClass = make_converting_class()
+
+    assert SomeClass.__compiled_cache__.load(SomeClass.__compiled_cache__.get_key(SomeClass())).values == {'number': 10}
+    assert SomeClass().number == 10
+
+
+def test_field_sources_are_taken_into_account(temporary_dir_path):
+    path = join(temporary_dir_path, 'file.yaml')
+    other_path = join(temporary_dir_path, 'other_file.yaml')
+    write_file(path, 'number: 1\n')
+    write_file(other_path, 'other_number: 2\n')
+
+    def make_class_with_field_sources():
+        class SomeClass(Storage, sources=[YAMLSource(path)], cache_dir=temporary_dir_path):
+            number: int = Field(0)
+            other_number: int = Field(0, sources=[YAMLSource(other_path), ...])
+
+        return SomeClass
+
+    instance = make_class_with_field_sources()()
+
+    assert instance.number == 1
+    assert instance.other_number == 2
+
+    write_file(other_path, 'other_number: 33\n')
+
+    instance = make_class_with_field_sources()()
+
+    assert instance.number == 1
+    assert instance.other_number == 33
+
+
+def test_broken_cache_file_is_ignored(temporary_dir_path):
+    path = join(temporary_dir_path, 'file.yaml')
+    cache_dir = join(temporary_dir_path, 'cache')
+    write_file(path, 'number: 1\n')
+
+    def make_class():
+        class SomeClass(Storage, sources=[YAMLSource(path)], cache_dir=cache_dir):
+            number: int = Field(0)
+
+        return SomeClass
+
+    SomeClass = make_class()
+    SomeClass()
+    write_file(SomeClass.__compiled_cache__.path, 'kek')
+
+    SomeClass = make_class()
+
+    assert SomeClass().number == 1
+    assert SomeClass.__compiled_cache__.load(SomeClass.__compiled_cache__.get_key(SomeClass())) is not None
+
+
+def test_cache_file_with_other_content_is_ignored(temporary_dir_path):
+    path = join(temporary_dir_path, 'file.yaml')
+    write_file(path, 'number: 1\n')
+
+    class SomeClass(Storage, sources=[YAMLSource(path)], cache_dir=temporary_dir_path):
+        number: int = Field(0)
+
+    cache = SomeClass.__compiled_cache__
+    key = cache.get_key(SomeClass())
+
+    cache.save(CacheEntry('kek', {'number': 5}, {'number': 0}, frozenset()))
+    cache.entry = None
+
+    assert cache.load(key) is None
+
+
+def test_not_picklable_values_are_not_saved(temporary_dir_path):
+    path = join(temporary_dir_path, 'file.yaml')
+    cache_dir = join(temporary_dir_path, 'cache')
+    write_file(path, 'number: 1\n')
+
+    class SomeClass(Storage, sources=[YAMLSource(path)], cache_dir=cache_dir):
+        number: object = Field(0, conversion=lambda x: Lock())
+
+    assert SomeClass().number is SomeClass().number
+    assert listdir(temporary_dir_path) == ['file.yaml']
+
+
+def test_not_writable_cache_dir_is_ignored(temporary_dir_path):
+    path = join(temporary_dir_path, 'file.yaml')
+    write_file(path, 'number: 1\n')
+
+    class SomeClass(Storage, sources=[YAMLSource(path)], cache_dir=path):
+        number: int = Field(0)
+
+    assert SomeClass().number == 1
+
+
+def test_cache_is_not_inherited(temporary_dir_path):
+    path = join(temporary_dir_path, 'file.yaml')
+    write_file(path, 'number: 1\n')
+
+    class SomeClass(Storage, sources=[YAMLSource(path)], cache_dir=temporary_dir_path):
+        number: int = Field(0)
+
+    class ChildClass(SomeClass):
+        pass
+
+    assert ChildClass.__compiled_cache__ is None
+
+
+def test_function_fingerprint():
+    def function(x):
+        return x
+
+    assert CompiledCache.get_function_fingerprint(None) == 'None'
+    assert CompiledCache.get_function_fingerprint(int) == repr(int)
+    assert CompiledCache.get_function_fingerprint(function) == CompiledCache.get_function_fingerprint(lambda x: x)
+    assert CompiledCache.get_function_fingerprint(function) != CompiledCache.get_function_fingerprint(lambda x: x + 1)
+    assert CompiledCache.get_function_fingerprint(lambda x: x in {'lol', 'kek'}) == CompiledCache.get_function_fingerprint(lambda x: x in {'kek', 'lol'})
+    assert CompiledCache.get_function_fingerprint(lambda x: [y for y in x]) == CompiledCache.get_function_fingerprint(lambda x: [y for y in x])
+    assert CompiledCache.get_function_fingerprint(lambda x: [y for y in x]) != CompiledCache.get_function_fingerprint(lambda x: [y + 1 for y in x])
+
+
+def test_function_fingerprint_includes_closures_and_globals(monkeypatch):
+    import tests.test_compiled_cache as this_module
+
+    def make_validation(limit):
+        return lambda x: x > limit
+
+    def make_not_yet_defined_reference():
+        function = lambda: value  # noqa: E731
+        fingerprint = CompiledCache.get_function_fingerprint(function)
+        value = 1
+        return fingerprint, value
+
+    def validation(x):
+        return normalize(x) < LIMIT and recursive_helper(x) == 0 and this_module is not None
+
+    fingerprint = CompiledCache.get_function_fingerprint(validation)
+
+    assert CompiledCache.get_function_fingerprint(make_validation(1)) == CompiledCache.get_function_fingerprint(make_validation(1))
+    assert CompiledCache.get_function_fingerprint(make_validation(1)) != CompiledCache.get_function_fingerprint(make_validation(2))
+    assert make_not_yet_defined_reference()[0] == make_not_yet_defined_reference()[0]
+    assert CompiledCache.get_function_fingerprint(validation) == fingerprint
+
+    monkeypatch.setattr(this_module, 'LIMIT', 20)
+
+    assert CompiledCache.get_function_fingerprint(validation) != fingerprint
+
+    monkeypatch.setattr(this_module, 'LIMIT', 10)
+    monkeypatch.setattr(this_module, 'normalize', lambda value: abs(value))
+
+    assert CompiledCache.get_function_fingerprint(validation) != fingerprint
+
+
+def test_preload_with_warm_cache_does_not_parse(temporary_dir_path, parsing_calls):
+    path = join(temporary_dir_path, 'file.yaml')
+    write_file(path, 'number: 1\n')
+
+    def make_preloaded_class():
+        class SomeClass(Storage, sources=[YAMLSource(path)], cache_dir=temporary_dir_path, preload=True):
+            number: int = Field(0)
+
+        return SomeClass
+
+    assert make_preloaded_class()().number == 1
+    assert len(parsing_calls) == 1
+
+    SomeClass = make_preloaded_class()
+    SomeClass.__preloading__.join()
+
+    assert SomeClass.__compiled_cache__.entry is not None
+    assert len(parsing_calls) == 1
+    assert SomeClass().number == 1
+    assert len(parsing_calls) == 1
+
+
+def test_sources_that_resolved_fields_are_recorded_for_cached_values(temporary_dir_path):
+    path = join(temporary_dir_path, 'file.yaml')
+    write_file(path, 'number: 1\n')
+
+    def make_class():
+        class SomeClass(Storage, sources=[YAMLSource(path)], cache_dir=temporary_dir_path):
+            number: int = Field(0)
+
+        return SomeClass
+
+    SomeClass = make_class()
+    source = SomeClass.__sources__.sources[0]
+
+    assert SomeClass().__resolved_from__ == {'number': source}
+
+    SomeClass = make_class()
+    source = SomeClass.__sources__.sources[0]
+    instance = SomeClass()
+
+    assert 'data' not in source.__dict__
+    assert instance.__resolved_from__ == {'number': source}
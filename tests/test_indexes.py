@@ -0,0 +1,240 @@
+import gc
+
+import pytest
+from full_match import match
+
+from skelet import Storage, Field, MemorySource, query, AnyOf, overlay
+from skelet.storage import refresh_storage
+from skelet import indexes as indexes_module
+
+
+def names(instances):
+    return sorted(instance.name for instance in instances)
+
+
+def test_wrong_field_definition():
+    with pytest.raises(ValueError, match=match('The lazy mode cannot be used together with indexing.')):
+        Field(default_factory=list, lazy=True, indexed=True)
+
+
+def test_wrong_queries():
+    class TenantSettings(Storage):
+        name: str = Field('')
+        region: str = Field('us', indexed=True)
+        beta_enabled: bool = Field(False, indexed=True)
+        tags: list = Field(default_factory=list, indexed=True)
+        limit: int = Field(10)
+
+    with pytest.raises(ValueError, match=match('You must specify at least one condition.')):
+        query(TenantSettings)
+
+    with pytest.raises(KeyError, match=match('\'The "kek" field is not defined.\'')):
+        query(TenantSettings, kek=1)
+
+    with pytest.raises(ValueError, match=match('The "limit" field is not indexed.')):
+        query(TenantSettings, region='eu', limit=10)
+
+
+def test_query_by_equality_and_membership():
+    class TenantSettings(Storage):
+        name: str = Field('')
+        region: str = Field('us', indexed=True)
+        beta_enabled: bool = Field(False, indexed=True)
+        tags: list = Field(default_factory=list, indexed=True)
+        limit: int = Field(10)
+
+    instances = [
+        TenantSettings(name='first', region='eu', beta_enabled=True),
+        TenantSettings(name='second', region='eu'),
+        TenantSettings(name='third', region='asia', beta_enabled=True),
+        TenantSettings(name='fourth'),
+    ]
+
+    assert len(query(TenantSettings, region=AnyOf('eu', 'asia', 'us'))) == len(instances)
+    assert names(query(TenantSettings, region='eu')) == ['first', 'second']
+    assert names(query(TenantSettings, region='eu', beta_enabled=True)) == ['first']
+    assert names(query(TenantSettings, beta_enabled=True)) == ['first', 'third']
+    assert names(query(TenantSettings, region=AnyOf('eu', 'asia'), beta_enabled=True)) == ['first', 'third']
+    assert names(query(TenantSettings, region=AnyOf('us', 'kek'))) == ['fourth']
+    assert query(TenantSettings, region='kek') == []
+    assert query(TenantSettings, region='us', beta_enabled=True) == []
+    assert repr(AnyOf('eu', 'asia')) == "AnyOf('eu', 'asia')"
+
+
+def test_index_follows_assignments():
+    class TenantSettings(Storage):
+        name: str = Field('')
+        region: str = Field('us', indexed=True)
+        beta_enabled: bool = Field(False, indexed=True)
+        tags: list = Field(default_factory=list, indexed=True)
+        limit: int = Field(10)
+
+    first = TenantSettings(name='first', region='eu')
+    second = TenantSettings(name='second', region='eu')
+
+    first.region = 'asia'
+    first.region = 'asia'
+    second.limit = 5
+
+    assert query(TenantSettings, region='eu') == [second]
+    assert query(TenantSettings, region='asia') == [first]
+    assert 'eu' in TenantSettings.region.index.buckets
+
+    second.region = 'asia'
+
+    assert 'eu' not in TenantSettings.region.index.buckets
+    assert names(query(TenantSettings, region='asia')) == ['first', 'second']
+
+    with pytest.raises(TypeError):
+        second.region = 1
+
+    assert names(query(TenantSettings, region='asia')) == ['first', 'second']
+
+
+def test_index_follows_refreshes():
+    data = {'region': 'eu'}
+
+    class TenantSettings(Storage, sources=[MemorySource(data)]):
+        name: str = Field('')
+        region: str = Field('us', indexed=True)
+        beta_enabled: bool = Field(False, indexed=True)
+        tags: list = Field(default_factory=list, indexed=True)
+        limit: int = Field(10)
+
+    instance = TenantSettings(name='first')
+    explicit_instance = TenantSettings(name='second', region='eu')
+
+    data['region'] = 'asia'
+    refresh_storage(instance, ['region', 'beta_enabled'])
+
+    assert query(TenantSettings, region='asia') == [instance]
+    assert query(TenantSettings, region='eu') == [explicit_instance]
+
+
+def test_unhashable_values():
+    class TenantSettings(Storage):
+        name: str = Field('')
+        region: str = Field('us', indexed=True)
+        beta_enabled: bool = Field(False, indexed=True)
+        tags: list = Field(default_factory=list, indexed=True)
+        limit: int = Field(10)
+
+    first = TenantSettings(name='first', tags=['lol'])
+    second = TenantSettings(name='second')
+    third = TenantSettings(name='third', tags=['lol'])
+
+    assert names(query(TenantSettings, tags=['lol'])) == ['first', 'third']
+    assert query(TenantSettings, tags=[]) == [second]
+    assert query(TenantSettings, tags=AnyOf(['kek'])) == []
+
+    first.tags = ['kek']
+
+    assert query(TenantSettings, tags=['kek']) == [first]
+    assert query(TenantSettings, tags=['lol']) == [third]
+    assert query(TenantSettings, tags=AnyOf(['kek'], ['lol'], 'kek'), region='us') in ([first, third], [third, first])
+
+
+def test_deleted_instances_are_not_found():
+    class TenantSettings(Storage):
+        name: str = Field('')
+        region: str = Field('us', indexed=True)
+        beta_enabled: bool = Field(False, indexed=True)
+        tags: list = Field(default_factory=list, indexed=True)
+        limit: int = Field(10)
+
+    instance = TenantSettings(name='first', region='eu')
+    TenantSettings(name='second', region='eu')
+    gc.collect()
+
+    assert query(TenantSettings, region='eu') == [instance]
+
+
+def test_subclasses_share_indexes_of_parents():
+    class TenantSettings(Storage):
+        name: str = Field('')
+        region: str = Field('us', indexed=True)
+        beta_enabled: bool = Field(False, indexed=True)
+        tags: list = Field(default_factory=list, indexed=True)
+        limit: int = Field(10)
+
+    class ChildClass(TenantSettings):  # type: ignore[misc, valid-type]
+        pass
+
+    parent_instance = TenantSettings(name='parent', region='eu')
+    child_instance = ChildClass(name='child', region='eu')
+
+    assert names(query(TenantSettings, region='eu')) == ['child', 'parent']
+    assert query(ChildClass, region='eu') == [child_instance]
+    assert parent_instance.region == 'eu'
+
+
+def test_overlays_are_not_indexed():
+    class TenantSettings(Storage):
+        name: str = Field('')
+        region: str = Field('us', indexed=True)
+        beta_enabled: bool = Field(False, indexed=True)
+        tags: list = Field(default_factory=list, indexed=True)
+        limit: int = Field(10)
+
+    base = TenantSettings(name='base', region='eu')
+    tenant = overlay(base, beta_enabled=True)
+    tenant.region = 'asia'
+
+    assert query(TenantSettings, region='eu') == [base]
+    assert query(TenantSettings, region='asia') == []
+    assert query(TenantSettings, beta_enabled=True) == []
+
+    base.region = 'us'
+
+    assert query(TenantSettings, region='us') == [base]
+    assert query(TenantSettings, region='eu') == []
+
+
+def test_only_constructed_objects_are_indexed():
+    class TenantSettings(Storage):
+        name: str = Field('')
+        region: str = Field('us', indexed=True)
+        limit: int = Field(10)
+
+    base = TenantSettings(name='base', region='eu')
+
+    with pytest.raises(TypeError):
+        TenantSettings(name='wrong', region='eu', limit='kek')
+
+    assert query(TenantSettings, region='eu') == [base]
+
+
+def test_empty_buckets_are_pruned_on_lookup():
+    class TenantSettings(Storage):
+        region: str = Field('us', indexed=True)
+
+    instance = TenantSettings(region='eu')
+    buckets = TenantSettings.region.index.buckets
+
+    assert 'eu' in buckets
+
+    del instance
+    gc.collect()
+
+    assert query(TenantSettings, region='eu') == []
+    assert 'eu' not in buckets
+
+
+def test_empty_buckets_are_pruned_when_the_index_grows(monkeypatch):
+    monkeypatch.setattr(indexes_module, 'MIN_PRUNING_THRESHOLD', 4)
+
+    class TenantSettings(Storage):
+        region: str = Field('us', indexed=True)
+
+    index = TenantSettings.region.index
+
+    for number in range(20):
+        TenantSettings(region=str(number))
+        gc.collect()
+
+    assert len(index.buckets) <= 5
+
+    instances = [TenantSettings(region=str(number)) for number in range(20)]
+
+    assert len(index.buckets) == 20
+    assert set(query(TenantSettings, region=AnyOf(*(str(number) for number in range(20))))) == set(instances)
@@ -0,0 +1,186 @@
+import gc
+
+import pytest
+from full_match import match
+
+from skelet import Storage, Field, MemorySource, overlay, watch, Change
+from skelet.overlays import OverlayValues, get_values_owner
+from skelet.storage import refresh_storage
+
+
+def test_overlay_stores_only_overrides():
+    class SomeClass(Storage):
+        region: str = Field('us')
+        beta: bool = Field(False)
+        limit: int = Field(10, validation=lambda x: x > 0)
+
+    base = SomeClass(limit=20)
+    instance = overlay(base, beta=True)
+
+    assert type(instance) is type(base)
+    assert isinstance(instance.__values__, OverlayValues)
+    assert dict(instance.__values__) == {'beta': True}
+    assert instance.__locks__ is base.__locks__
+    assert instance.region == 'us'
+    assert instance.beta is True
+    assert instance.limit == 20
+    assert instance.__values__.get('kek', 'default') == 'default'
+    assert repr(instance) == "SomeClass(region='us', beta=True, limit=20)"
+
+
+def test_wrong_overrides():
+    class SomeClass(Storage):
+        field: int = Field(0, read_only=True)
+        other_field: int = Field(1, validation=lambda x: x > 0)
+
+    base = SomeClass()
+
+    with pytest.raises(KeyError, match=match('\'The "kek" field is not defined.\'')):
+        overlay(base, kek=1)
+
+    with pytest.raises(AttributeError, match=match('"field" field is read-only.')):
+        overlay(base, field=1)
+
+    with pytest.raises(TypeError, match=match('The value \'kek\' (str) of the "other_field" field does not match the type int.')):
+        overlay(base, other_field='kek')
+
+    with pytest.raises(ValueError, match=match('The value -1 (int) of the "other_field" field does not match the validation.')):
+        overlay(base, other_field=-1)
+
+    assert base.__overlays__ is None
+
+
+def test_base_changes_propagate_to_overlays():
+    class SomeClass(Storage):
+        region: str = Field('us')
+        beta: bool = Field(False)
+        limit: int = Field(10, validation=lambda x: x > 0)
+
+    base = SomeClass()
+    instance = overlay(base, region='eu')
+    nested_instance = overlay(instance, beta=True)
+
+    base.region = 'asia'
+    base.beta = True
+    base.limit = 30
+
+    assert instance.region == 'eu'
+    assert instance.beta is True
+    assert instance.limit == 30
+    assert nested_instance.region == 'eu'
+    assert nested_instance.limit == 30
+
+    instance.limit = 40
+    base.limit = 50
+
+    assert dict(instance.__values__) == {'region': 'eu', 'limit': 40}
+    assert instance.limit == 40
+    assert nested_instance.limit == 40
+    assert base.limit == 50
+
+
+def test_changes_of_overlay_are_reported_for_overlay():
+    changes = []
+
+    class SomeClass(Storage, on_change=lambda changes_list, storage: changes.extend((storage, change) for change in changes_list)):
+        field: int = Field(0)
+
+    base = SomeClass()
+    changes.clear()
+    instance = overlay(base)
+
+    with watch(instance) as subscription:
+        instance.field = 1
+
+    assert list(subscription) == [Change('field', 0, 1)]
+    assert changes == [(instance, Change('field', 0, 1))]
+    assert base.field == 0
+
+
+def test_conflicts_span_base_and_overlay():
+    class SomeClass(Storage):
+        minimum: int = Field(0, conflicts={'maximum': lambda old, new, other_old, other_new: new > other_new})
+        maximum: int = Field(10)
+
+    base = SomeClass()
+
+    with pytest.raises(ValueError, match=match('The new 11 (int) value of the "minimum" field conflicts with the 10 (int) value of the "maximum" field.')):
+        overlay(base, minimum=11)
+
+    instance = overlay(base, minimum=5)
+    nested_instance = overlay(instance)
+
+    with pytest.raises(ValueError, match=match('The new 4 (int) value of the "maximum" field conflicts with the 5 (int) value of the "minimum" field.')):
+        base.maximum = 4
+
+    with pytest.raises(ValueError, match=match('The new 11 (int) value of the "minimum" field conflicts with the 10 (int) value of the "maximum" field.')):
+        nested_instance.minimum = 11
+
+    assert base.maximum == 10
+    base.maximum = 6
+    base.minimum = 6
+
+    assert instance.maximum == 6
+    assert instance.minimum == 5
+
+    instance.maximum = 100
+
+    with pytest.raises(ValueError, match=match('The new 4 (int) value of the "maximum" field conflicts with the 6 (int) value of the "minimum" field.')):
+        base.maximum = 4
+
+    base.minimum = 0
+    base.maximum = 4
+
+    assert nested_instance.maximum == 100
+
+
+def test_refreshed_base_checks_conflicts_of_overlays():
+    data = {'minimum': 0, 'maximum': 10}
+
+    class SomeClass(Storage, sources=[MemorySource(data)]):
+        minimum: int = Field(0, conflicts={'maximum': lambda old, new, other_old, other_new: new > other_new})
+        maximum: int = Field(10)
+
+    base = SomeClass()
+    instance = overlay(base, minimum=5)
+
+    data['maximum'] = 4
+
+    with pytest.raises(ValueError, match=match('The new 4 (int) value of the "maximum" field conflicts with the 5 (int) value of the "minimum" field.')):
+        refresh_storage(base, ['minimum', 'maximum'])
+
+    assert base.maximum == 10
+    assert instance.maximum == 10
+
+
+def test_lazy_defaults_are_computed_in_base():
+    calls = []
+
+    class SomeClass(Storage):
+        field: list = Field(default_factory=lambda: calls.append(1) or [], lazy=True)
+
+    base = SomeClass()
+    instance = overlay(base)
+    nested_instance = overlay(instance)
+
+    assert nested_instance.field is base.field
+    assert instance.field is base.field
+    assert calls == [1]
+    assert dict(instance.__values__) == {}
+    assert get_values_owner(nested_instance, 'field') is base
+
+
+def test_overlays_are_not_kept_alive():
+    class SomeClass(Storage):
+        region: str = Field('us')
+        beta: bool = Field(False)
+        limit: int = Field(10, validation=lambda x: x > 0)
+
+    base = SomeClass()
+    instance = overlay(base)
+    overlay(base)
+
+    gc.collect()
+
+    assert list(base.__overlays__) == [instance]
+
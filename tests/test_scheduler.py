@@ -0,0 +1,99 @@
+from time import sleep, monotonic
+from threading import Event
+
+from skelet.scheduler import Scheduler
+
+
+def wait_for(condition, timeout=5):
+    deadline = monotonic() + timeout
+    while not condition():
+        if monotonic() > deadline:
+            raise TimeoutError
+        sleep(0.001)
+
+
+def test_tasks_are_run_in_order_of_due_time():
+    scheduler = Scheduler()
+    calls = []
+    started = Event()
+    released = Event()
+
+    def blocking_task():
+        started.set()
+        released.wait()
+
+    scheduler.schedule(0, blocking_task)
+    started.wait()
+
+    scheduler.schedule(0.03, lambda: calls.append(3))
+    scheduler.schedule(0.01, lambda: calls.append(1))
+    scheduler.schedule(0.02, lambda: calls.append(2))
+
+    assert calls == []
+
+    released.set()
+    wait_for(lambda: len(calls) == 3)
+
+    assert calls == [1, 2, 3]
+
+
+def test_one_thread_serves_all_tasks():
+    scheduler = Scheduler()
+    finished = Event()
+
+    scheduler.schedule(0.01, lambda: None)
+    thread = scheduler.thread
+    scheduler.schedule(0.01, finished.set)
+
+    assert thread is not None
+    assert scheduler.thread is thread
+
+    finished.wait()
+
+
+def test_task_is_rescheduled_with_returned_delay():
+    scheduler = Scheduler()
+    calls = []
+
+    def task():
+        calls.append(monotonic())
+        if len(calls) < 3:
+            return 0.01
+        return None
+
+    scheduler.schedule(0, task)
+
+    wait_for(lambda: len(calls) == 3)
+    sleep(0.05)
+
+    assert len(calls) == 3
+    assert scheduler.heap == []
+
+
+def test_failed_task_is_dropped():
+    scheduler = Scheduler()
+    calls = []
+    finished = Event()
+
+    def broken_task():
+        calls.append(1)
+        raise ValueError('kek')
+
+    scheduler.schedule(0, broken_task)
+    scheduler.schedule(0.02, finished.set)
+
+    finished.wait()
+
+    assert calls == [1]
+    assert scheduler.heap == []
+
+
+def test_earlier_task_wakes_up_scheduler():
+    scheduler = Scheduler()
+    finished = Event()
+
+    scheduler.schedule(100, lambda: None)
+    sleep(0.01)
+    scheduler.schedule(0, finished.set)
+
+    assert finished.wait(5)
@@ -1,11 +1,17 @@
+import gc
 import sys
+from time import sleep
+from threading import Thread, Event
 from typing import List, Any, Union, Optional
+from dataclasses import MISSING
 
 import pytest
 from full_match import match
 from locklib import LockTraceWrapper
 
-from skelet import Storage, Field, TOMLSource, JSONSource, YAMLSource, EnvSource, MemorySource, NaturalNumber, NonNegativeInt
+from skelet import Storage, Field, TOMLSource, JSONSource, YAMLSource, EnvSource, MemorySource, NaturalNumber, NonNegativeInt, Change
+from skelet.scheduler import scheduler
+from skelet.storage import refresh_storage, refresh_all
 
 
 def test_try_to_get_descriptor_object_from_class_inherited_from_storage():
@@ -2550,3 +2556,1202 @@ def test_default_value_is_not_set_but_there_are_per_field_sources():
 
     assert instance.first_field == 4
     assert instance.second_field == 5
+
+
+def test_per_field_sources_collection_is_reused_between_instances():
+    class SomeClass(Storage, sources=[MemorySource({'second_field': 5})]):
+        first_field: int = Field(sources=[MemorySource({'first_field': 4}), ...])
+        second_field: int = Field()
+
+    first_instance = SomeClass()
+    second_instance = SomeClass()
+
+    assert SomeClass.first_field.get_sources(first_instance) is SomeClass.first_field.get_sources(second_instance)
+    assert second_instance.first_field == 4
+    assert second_instance.second_field == 5
+
+
+def test_value_from_source_is_type_checked_once():
+    checked_values = []
+
+    class CountingMeta(type):
+        def __instancecheck__(cls, instance):
+            checked_values.append(instance)
+            return True
+
+    class CountingType(metaclass=CountingMeta):
+        pass
+
+    class SomeClass(Storage, sources=[MemorySource({'field': 1, 'converted_field': 2})]):
+        field: CountingType = Field()
+        converted_field: CountingType = Field(conversion=lambda x: x)
+
+    instance = SomeClass()
+
+    assert instance.field == 1
+    assert instance.converted_field == 2
+    assert checked_values == [1, 2]
+
+    instance.converted_field = 3
+
+    assert checked_values == [1, 2, 3]
+
+
+def test_value_from_source_is_type_checked_after_not_identical_conversion():
+    checked_values = []
+
+    class CountingMeta(type):
+        def __instancecheck__(cls, instance):
+            checked_values.append(instance)
+            return True
+
+    class CountingType(metaclass=CountingMeta):
+        pass
+
+    class SomeClass(Storage, sources=[MemorySource({'field': 1})]):
+        field: CountingType = Field(conversion=lambda x: x + 1)
+
+    instance = SomeClass()
+
+    assert instance.field == 2
+    assert checked_values == [1, 2]
+
+
+def test_tuple_from_env_is_type_checked_by_storage(monkeypatch):
+    monkeypatch.setenv('SKELET_FIELD', '[1, 2]')
+
+    class SomeClass(Storage, sources=EnvSource.for_library('skelet')):
+        field: tuple = Field((1, 2))
+
+    with pytest.raises(TypeError, match=match('The value [1, 2] (list) of the "field" field does not match the type tuple.')):
+        SomeClass()
+
+
+def test_checks_cache_skips_repeated_checks_of_immutable_values():
+    checked_values = []
+    validated_values = []
+
+    class CountingMeta(type):
+        def __instancecheck__(cls, instance):
+            checked_values.append(instance)
+            return isinstance(instance, tuple)
+
+    class CountingType(metaclass=CountingMeta):
+        pass
+
+    class SomeClass(Storage):
+        field: CountingType = Field(('localhost',), validation=lambda x: validated_values.append(x) or True, checks_cache_size=10)
+
+    assert checked_values == [('localhost',)]
+    assert validated_values == [('localhost',)]
+
+    instance = SomeClass()
+
+    instance.field = ('localhost', 'example.com')
+    instance.field = ('localhost', 'example.com')
+    instance.field = ('localhost',)
+
+    assert checked_values == [('localhost',), ('localhost', 'example.com')]
+    assert validated_values == [('localhost',), ('localhost', 'example.com')]
+
+    with pytest.raises(TypeError):
+        instance.field = ['localhost']
+
+    with pytest.raises(TypeError):
+        instance.field = ['localhost']
+
+    assert checked_values == [('localhost',), ('localhost', 'example.com'), ['localhost'], ['localhost']]
+
+
+def test_checks_cache_doesnt_remember_values_that_failed_validation():
+    validated_values = []
+
+    def validation(value):
+        validated_values.append(value)
+        return value != 'bad'
+
+    class SomeClass(Storage):
+        field: str = Field('good', validation={'The value is bad.': validation}, checks_cache_size=10)
+
+    instance = SomeClass()
+
+    for _ in range(2):
+        with pytest.raises(ValueError, match=match('The value is bad.')):
+            instance.field = 'bad'
+
+    instance.field = 'good'
+
+    assert validated_values == ['good', 'bad', 'bad']
+
+
+def test_checks_cache_is_off_by_default():
+    class SomeClass(Storage):
+        field: int = Field(1)
+
+    assert SomeClass.field.checks_cache is None
+
+
+def test_type_hints_are_resolved_once_per_class(monkeypatch):
+    from skelet.fields import base
+
+    calls = []
+    original_get_type_hints = base.get_type_hints
+
+    def get_type_hints(owner):
+        calls.append(owner)
+        return original_get_type_hints(owner)
+
+    monkeypatch.setattr(base, 'get_type_hints', get_type_hints)
+
+    class FirstClass(Storage):
+        field_1: int = Field(1)
+        field_2: 'List[int]' = Field(default_factory=list)
+        field_3: str = Field('kek')
+
+    class SecondClass(FirstClass):
+        field_4: int = Field(4)
+        field_5: 'Optional[int]' = Field(None)
+
+    assert calls == [FirstClass, SecondClass]
+    assert FirstClass.field_2.type_hint == List[int]
+    assert SecondClass.field_5.type_hint == Optional[int]
+
+
+def test_inheritance_of_fields_from_several_classes():
+    class FirstClass(Storage):
+        field_1 = Field(1)
+        field_2 = Field(2)
+
+    class SecondClass(FirstClass):
+        field_3 = Field(3)
+
+    class ThirdClass(FirstClass):
+        field_4 = Field(4)
+
+    class ClassWithoutOwnFields(SecondClass, ThirdClass):
+        ...
+
+    class Mixin:
+        ...
+
+    class FinalClass(Mixin, ClassWithoutOwnFields):
+        field_5 = Field(5)
+
+    assert FinalClass.__field_names__ == ['field_1', 'field_2', 'field_3', 'field_4', 'field_5']
+
+    instance = FinalClass()
+
+    assert [instance.field_1, instance.field_2, instance.field_3, instance.field_4, instance.field_5] == [1, 2, 3, 4, 5]
+
+
+def test_deep_inheritance_chain():
+    base = Storage
+    for level in range(50):
+        base = type(f'Level{level}', (base,), {f'field_{level}': Field(level)})
+
+    assert base.__field_names__ == [f'field_{level}' for level in range(50)]
+    assert base().field_49 == 49
+
+
+def test_fields_passed_to_init_are_not_looked_up_in_sources():
+    looked_up_keys = []
+
+    class PseudoDict:
+        def __getitem__(self, key):
+            looked_up_keys.append(key)
+            return 1
+
+    factory_calls = []
+
+    class SomeClass(Storage, sources=[MemorySource(PseudoDict())]):
+        field: int = Field(10)
+        other_field: int = Field(default_factory=lambda: factory_calls.append(True) or 20)
+
+    instance = SomeClass(field=5, other_field=6)
+
+    assert instance.field == 5
+    assert instance.other_field == 6
+    assert looked_up_keys == []
+    assert factory_calls == []
+
+    instance = SomeClass(field=5)
+
+    assert instance.field == 5
+    assert instance.other_field == 1
+    assert looked_up_keys == ['other_field']
+
+
+def test_fields_passed_to_init_are_checked_once():
+    checked_values = []
+    validated_values = []
+
+    class CountingMeta(type):
+        def __instancecheck__(cls, instance):
+            checked_values.append(instance)
+            return True
+
+    class CountingType(metaclass=CountingMeta):
+        pass
+
+    class SomeClass(Storage):
+        field: CountingType = Field(validation=lambda x: validated_values.append(x) or True)
+
+    SomeClass(field=5)
+
+    assert checked_values == [5]
+    assert validated_values == [5]
+
+
+def test_fields_passed_to_init_are_converted():
+    class SomeClass(Storage):
+        field: int = Field(0, conversion=lambda x: x * 2)
+
+    assert SomeClass(field=5).field == 10
+
+
+def test_read_only_field_cant_be_passed_to_init():
+    class SomeClass(Storage):
+        field: int = Field(0, read_only=True, doc='some doc')
+
+    with pytest.raises(AttributeError, match=match('"field" field (some doc) is read-only.')):
+        SomeClass(field=5)
+
+
+def test_conflicts_of_fields_passed_to_init_are_checked_against_final_state():
+    breadcrumbs = []
+
+    def checker(old, new, other_old, other_new):
+        breadcrumbs.append((old, new, other_old, other_new))
+        return new > other_new
+
+    class SomeClass(Storage):
+        field: int = Field(10, conflicts={'other_field': checker})
+        other_field: int = Field(20)
+
+    breadcrumbs.clear()
+
+    instance = SomeClass(field=25, other_field=30)
+
+    assert instance.field == 25
+    assert instance.other_field == 30
+    assert breadcrumbs == [(25, 25, 30, 30), (25, 25, 30, 30)]
+
+    with pytest.raises(ValueError, match=match('The new 30 (int) value of the "field" field conflicts with the 25 (int) value of the "other_field" field.')):
+        SomeClass(field=30, other_field=25)
+
+
+def test_factory_of_field_passed_to_init_is_not_checked_for_conflicts():
+    class SomeClass(Storage):
+        field: int = Field(default_factory=lambda: 100, conflicts={'other_field': lambda old, new, other_old, other_new: new > other_new})
+        other_field: int = Field(20)
+
+    with pytest.raises(ValueError):
+        SomeClass()
+
+    assert SomeClass(field=5).field == 5
+
+
+def test_lazy_mode_without_factory():
+    with pytest.raises(ValueError, match=match('The lazy mode can only be used together with a factory for default values.')):
+        Field(lazy=True)
+
+    with pytest.raises(ValueError, match=match('The lazy mode can only be used together with a factory for default values.')):
+        Field(1, lazy=True)
+
+
+def test_lazy_factory_is_called_on_first_read():
+    calls = []
+
+    class SomeClass(Storage):
+        field: List[int] = Field(default_factory=lambda: calls.append(True) or [1, 2, 3], lazy=True)
+
+    instance = SomeClass()
+
+    assert calls == []
+
+    assert instance.field == [1, 2, 3]
+    assert instance.field is instance.field
+    assert calls == [True]
+
+
+def test_lazy_factory_is_not_called_if_there_is_value_in_sources():
+    calls = []
+
+    class SomeClass(Storage, sources=[MemorySource({'field': [4]})]):
+        field: List[int] = Field(default_factory=lambda: calls.append(True) or [1, 2, 3], lazy=True)
+
+    assert SomeClass().field == [4]
+    assert SomeClass(field=[5]).field == [5]
+    assert calls == []
+
+
+@pytest.mark.parametrize(
+    ['read_lock'],
+    [
+        (True,),
+        (False,),
+    ],
+)
+def test_lazy_factory_is_called_once_for_concurrent_readers(read_lock):
+    calls = []
+
+    def factory():
+        calls.append(True)
+        sleep(0.05)
+        return 5
+
+    class SomeClass(Storage):
+        field: int = Field(default_factory=factory, lazy=True, read_lock=read_lock)
+
+    instance = SomeClass()
+    results = []
+    threads = [Thread(target=lambda: results.append(instance.field)) for _ in range(10)]
+
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [5] * 10
+    assert calls == [True]
+
+
+def test_lazy_default_is_checked_on_first_read():
+    values = iter([-1, 'kek', 5])
+
+    class SomeClass(Storage):
+        field: int = Field(default_factory=lambda: next(values), lazy=True, validation=lambda x: x > 0)
+
+    instance = SomeClass()
+
+    with pytest.raises(ValueError, match=match('The value -1 (int) of the "field" field does not match the validation.')):
+        instance.field
+
+    with pytest.raises(TypeError, match=match('The value \'kek\' (str) of the "field" field does not match the type int.')):
+        instance.field
+
+    assert instance.field == 5
+
+
+def test_lazy_default_is_converted():
+    class SomeClass(Storage):
+        field: int = Field(default_factory=lambda: 5, lazy=True, conversion=lambda x: x * 2)
+        other_field: int = Field(default_factory=lambda: 5, lazy=True, conversion=lambda x: x)
+        not_validated_field: int = Field(default_factory=lambda: -5, lazy=True, conversion=lambda x: x * 2, validation=lambda x: x > 0, validate_default=False)
+
+    assert SomeClass().field == 10
+    assert SomeClass().other_field == 5
+    assert SomeClass().not_validated_field == -10
+
+
+def test_conflicts_of_lazy_default_are_checked_on_first_read():
+    class SomeClass(Storage):
+        field: int = Field(default_factory=lambda: 100, lazy=True, conflicts={'other_field': lambda old, new, other_old, other_new: new > other_new})
+        other_field: int = Field(20)
+
+    instance = SomeClass()
+
+    with pytest.raises(ValueError, match=match('The 100 (int) deferred default value of the "field" field conflicts with the 20 (int) value of the "other_field" field.')):
+        instance.field
+
+    with pytest.raises(ValueError, match=match('The 100 (int) deferred default value of the "field" field conflicts with the 20 (int) value of the "other_field" field.')):
+        instance.other_field = 200
+
+    assert SomeClass(other_field=200).field == 100
+
+
+def test_reverse_conflicts_of_lazy_default_are_checked_on_first_read():
+    class SomeClass(Storage):
+        field: int = Field(100, conflicts={'other_field': lambda old, new, other_old, other_new: new > other_new})
+        other_field: int = Field(default_factory=lambda: 20, lazy=True)
+
+    instance = SomeClass()
+
+    with pytest.raises(ValueError, match=match('The 100 (int) deferred default value of the "field" field conflicts with the 20 (int) value of the "other_field" field.')):
+        instance.other_field
+
+
+def test_conflicts_between_two_lazy_defaults():
+    class SomeClass(Storage):
+        field: int = Field(default_factory=lambda: 100, lazy=True, conflicts={'other_field': lambda old, new, other_old, other_new: new > other_new})
+        other_field: int = Field(default_factory=lambda: 20, lazy=True)
+        third_field: int = Field(default_factory=lambda: 1, conflicts={'other_field': lambda old, new, other_old, other_new: new > other_new})
+
+    instance = SomeClass()
+
+    assert instance.other_field == 20
+
+    with pytest.raises(ValueError, match=match('The 100 (int) deferred default value of the "field" field conflicts with the 20 (int) value of the "other_field" field.')):
+        instance.field
+
+
+def test_set_value_of_not_computed_lazy_field():
+    changes = []
+
+    class SomeClass(Storage):
+        field: int = Field(default_factory=lambda: 5, lazy=True, change_action=lambda old, new, storage: changes.append((old, new)))
+
+    instance = SomeClass()
+
+    instance.field = 10
+
+    assert instance.field == 10
+    assert changes == [(MISSING, 10)]
+
+
+def test_set_value_of_lazy_field_does_not_call_factory():
+    changes = []
+    data = {}
+
+    def factory():
+        raise ValueError('kek')
+
+    class SomeClass(Storage, sources=[MemorySource(data)], on_change=lambda changes_list, storage: changes.extend(changes_list)):
+        first: int = Field(default_factory=factory, lazy=True)
+        second: int = Field(default_factory=factory, lazy=True)
+        maximum: int = Field(10)
+        third: int = Field(default_factory=factory, lazy=True, conflicts={'maximum': lambda old, new, other_old, other_new: new > other_new})
+
+    instance = SomeClass()
+    instance.first = 10
+
+    assert instance.first == 10
+    assert changes == [Change('maximum', MISSING, 10), Change('first', MISSING, 10)]
+
+    data['second'] = 5
+
+    assert refresh_storage(instance, ['first', 'second']) == {'second': (MISSING, 5)}
+    assert instance.second == 5
+    assert changes[-1] == Change('second', MISSING, 5)
+
+    data['third'] = 100
+
+    with pytest.raises(ValueError, match=match('The new 100 (int) value of the "third" field conflicts with the 10 (int) value of the "maximum" field.')):
+        refresh_storage(instance, ['third'])
+
+    with pytest.raises(ValueError, match=match('kek')):
+        instance.third
+
+
+
+@pytest.mark.parametrize(
+    ['data'],
+    [
+        ({'field': 1, 'other_field': 2},),
+    ],
+)
+def test_preload_sources_in_background(yaml_config_path):
+    source = YAMLSource(yaml_config_path)
+    field_source = YAMLSource(yaml_config_path)
+
+    class SomeClass(Storage, sources=[source], preload=True):
+        field: int = Field(0)
+        other_field: int = Field(0, sources=[field_source])
+
+    assert isinstance(SomeClass.__preloading__, Thread)
+
+    SomeClass.__preloading__.join()
+
+    assert 'data' in source.__dict__
+    assert 'data' in field_source.__dict__
+
+    instance = SomeClass()
+
+    assert instance.field == 1
+    assert instance.other_field == 2
+
+
+def test_sources_are_not_preloaded_by_default():
+    source = YAMLSource('kek.yaml')
+
+    class SomeClass(Storage, sources=[source]):
+        field: int = Field(0)
+
+    class OtherClass(SomeClass, preload=True):
+        pass
+
+    class ThirdClass(OtherClass):
+        pass
+
+    assert SomeClass.__preloading__ is None
+    assert ThirdClass.__preloading__ is None
+    assert 'data' not in source.__dict__
+
+
+def test_first_instance_waits_for_preloading(monkeypatch):
+    calls = []
+
+    def slow_lookup(self, key):
+        sleep(0.05)
+        calls.append(key)
+        return self.data.get(key, MISSING)
+
+    monkeypatch.setattr(MemorySource, 'lookup', slow_lookup)
+
+    class SomeClass(Storage, sources=[MemorySource({'field': 1})], preload=True):
+        field: int = Field(0)
+
+    instance = SomeClass()
+
+    assert not SomeClass.__preloading__.is_alive()
+    assert calls[0] == 'field'
+    assert instance.field == 1
+
+
+def test_preload_errors_are_raised_when_creating_instance():
+    class SomeClass(Storage, sources=[YAMLSource('kek.yaml', allow_non_existent_files=False)], preload=True):
+        field: int = Field(0)
+
+    SomeClass.__preloading__.join()
+
+    with pytest.raises(FileNotFoundError):
+        SomeClass()
+
+
+def test_lower_priority_sources_are_not_opened_when_all_fields_are_resolved():
+    class SomeClass(Storage, sources=[MemorySource({'field': 1}), EnvSource(), YAMLSource('kek.yaml', allow_non_existent_files=False)]):
+        field: int = Field(0)
+        other_field: str = Field('kek', sources=[MemorySource({'other_field': 'lol'}), ...])
+
+    instance = SomeClass()
+
+    assert instance.field == 1
+    assert instance.other_field == 'lol'
+    assert 'data' not in SomeClass.__sources__.sources[1].__dict__
+
+    class OtherClass(Storage, sources=[MemorySource({'field': 1}), YAMLSource('kek.yaml', allow_non_existent_files=False)]):
+        field: int = Field(0)
+        other_field: str = Field('kek')
+
+    with pytest.raises(FileNotFoundError):
+        OtherClass()
+
+
+def test_sources_that_resolved_fields_are_recorded():
+    first_source = MemorySource({'field': 1})
+    second_source = MemorySource({'field': 2, 'other_field': 'lol'})
+    field_source = MemorySource({'third_field': 3})
+
+    class SomeClass(Storage, sources=[first_source, second_source]):
+        field: int = Field(0)
+        other_field: str = Field('kek')
+        third_field: int = Field(0, sources=[field_source, ...])
+        fourth_field: int = Field(4)
+        fifth_field: int = Field(5)
+
+    instance = SomeClass(fifth_field=55)
+
+    assert instance.__resolved_from__ == {'field': first_source, 'other_field': second_source, 'third_field': field_source}
+    assert instance.__resolved_from__['field'] is first_source
+    assert instance.__resolved_from__['other_field'] is second_source
+    assert instance.__resolved_from__['third_field'] is field_source
+
+
+def test_storage_asks_each_source_once_for_all_aliases():
+    class BatchSource(MemorySource):
+        def __init__(self, data):
+            super().__init__(data)
+            self.batches = []
+
+        def lookup(self, key):
+            raise AssertionError('The batch method must be used.')
+
+        def get_many(self, keys):
+            self.batches.append(list(keys))
+            return {key: self.data[key] for key in keys if key in self.data}
+
+    first = BatchSource({'field': 1})
+    second = BatchSource({'another_key': 'lol', 'third_field': 3})
+
+    class SomeClass(Storage, sources=[first, second]):
+        field: int = Field(0)
+        other_field: str = Field('kek', alias='another_key')
+        third_field: int = Field(0)
+        fourth_field: int = Field(4)
+        fifth_field: int = Field(5)
+
+    instance = SomeClass(fifth_field=55)
+
+    assert instance.field == 1
+    assert instance.other_field == 'lol'
+    assert instance.third_field == 3
+    assert instance.fourth_field == 4
+    assert instance.fifth_field == 55
+
+    assert first.batches == [['field', 'another_key', 'third_field', 'fourth_field']]
+    assert second.batches == [['another_key', 'third_field', 'fourth_field']]
+
+
+def test_wrong_refresh_interval():
+    with pytest.raises(ValueError, match=match('The refresh interval must be a positive number.')):
+        Field(0, refresh_every=0)
+
+    with pytest.raises(ValueError, match=match('The refresh interval must be a positive number.')):
+        Field(0, refresh_every=-1)
+
+
+def test_refresh_field_from_sources():
+    changes = []
+    data = {'field': 1}
+
+    class SomeClass(Storage, sources=[MemorySource(data)]):
+        field: int = Field(0, refresh_every=1000, change_action=lambda old, new, storage: changes.append((old, new)))
+
+    instance = SomeClass()
+
+    SomeClass.field.refresh(instance)
+
+    assert instance.field == 1
+    assert changes == []
+
+    data['field'] = 2
+    SomeClass.field.refresh(instance)
+
+    assert instance.field == 2
+    assert changes == [(1, 2)]
+
+    del data['field']
+    SomeClass.field.refresh(instance)
+
+    assert instance.field == 2
+    assert changes == [(1, 2)]
+
+
+def test_refreshed_value_goes_through_checks_and_conversion():
+    data = {'field': 1}
+
+    class SomeClass(Storage, sources=[MemorySource(data)]):
+        field: int = Field(0, refresh_every=1000, validation=lambda x: x < 100, conversion=lambda x: x * 10, conflicts={'other_field': lambda old, new, other_old, other_new: new == 30})
+        other_field: int = Field(0)
+
+    instance = SomeClass()
+
+    assert instance.field == 10
+
+    data['field'] = 'kek'
+    with pytest.raises(TypeError, match=match('The value of the "field" field did not pass the type check.')):
+        SomeClass.field.refresh(instance)
+
+    data['field'] = 200
+    with pytest.raises(ValueError, match=match('The value 200 (int) of the "field" field does not match the validation.')):
+        SomeClass.field.refresh(instance)
+
+    data['field'] = 3
+    with pytest.raises(ValueError, match=match('The new 30 (int) value of the "field" field conflicts with the 0 (int) value of the "other_field" field.')):
+        SomeClass.field.refresh(instance)
+
+    assert instance.field == 10
+
+    data['field'] = 2
+    SomeClass.field.refresh(instance)
+
+    assert instance.field == 20
+
+
+def test_refresh_reloads_sources(temporary_dir_path):
+    path = f'{temporary_dir_path}/file.json'
+    with open(path, 'w') as file:
+        file.write('{"field": 1}')
+
+    class SomeClass(Storage, sources=[JSONSource(path)]):
+        field: int = Field(0, refresh_every=1000)
+
+    instance = SomeClass()
+
+    with open(path, 'w') as file:
+        file.write('{"field": 22}')
+
+    SomeClass.field.refresh(instance)
+
+    assert instance.field == 22
+
+
+def test_fields_are_refreshed_in_background():
+    data = {'field': 1}
+    changed = Event()
+
+    class SomeClass(Storage, sources=[MemorySource(data)]):
+        field: int = Field(0, refresh_every=0.01, change_action=lambda old, new, storage: changed.set())
+        other_field: int = Field(0, refresh_every=0.01)
+        third_field: int = Field(0)
+
+    instance = SomeClass(other_field=5)
+    data['field'] = 2
+    data['other_field'] = 3
+
+    assert changed.wait(5)
+    assert instance.field == 2
+    assert instance.other_field == 5
+
+
+def test_refresh_task_stops_when_storage_is_deleted(monkeypatch):
+    tasks = []
+    monkeypatch.setattr(scheduler, 'schedule', lambda delay, task: tasks.append((delay, task)))
+
+    class SomeClass(Storage, sources=[MemorySource({'field': 1})]):
+        field: int = Field(0, refresh_every=5)
+
+    instance = SomeClass()
+
+    assert len(tasks) == 1
+    delay, task = tasks[0]
+
+    assert delay == 5
+    assert task() == 5
+
+    del instance
+    gc.collect()
+
+    assert task() is None
+
+    SomeClass()
+
+    assert len(tasks) == 2
+    assert tasks[1] == (5, task)
+
+
+def test_errors_in_refresh_task_back_off(monkeypatch):
+    tasks = []
+    monkeypatch.setattr(scheduler, 'schedule', lambda delay, task: tasks.append(task))
+    data = {'field': 1}
+
+    class SomeClass(Storage, sources=[MemorySource(data)]):
+        field: int = Field(0, refresh_every=5)
+
+    instance = SomeClass()
+    data['field'] = 'kek'
+
+    assert [tasks[0]() for _ in range(6)] == [10, 20, 40, 80, 160, 160]
+    assert instance.field == 1
+
+    data['field'] = 2
+
+    assert tasks[0]() == 5
+    assert instance.field == 2
+
+
+def test_failed_reload_in_refresh_task_backs_off(monkeypatch):
+    tasks = []
+    monkeypatch.setattr(scheduler, 'schedule', lambda delay, task: tasks.append(task))
+
+    class BrokenSource(MemorySource):
+        def reload(self):
+            raise OSError('kek')
+
+    class SomeClass(Storage, sources=[BrokenSource({'field': 1})]):
+        field: int = Field(0, refresh_every=5)
+
+    instance = SomeClass()
+
+    assert tasks[0]() == 10
+    assert instance.field == 1
+
+
+def test_field_refresh_is_shared_by_instances(monkeypatch):
+    tasks = []
+    reloads = []
+    monkeypatch.setattr(scheduler, 'schedule', lambda delay, task: tasks.append(task))
+
+    class ReloadCountingSource(MemorySource):
+        def reload(self):
+            reloads.append(self)
+            super().reload()
+
+    data = {'field': 1, 'other_field': 2}
+    source = ReloadCountingSource(data)
+
+    class SomeClass(Storage, sources=[source]):
+        field: int = Field(0, refresh_every=5)
+        other_field: int = Field(0, refresh_every=5)
+
+    class ChildClass(SomeClass, sources=[source]):
+        pass
+
+    instances = [SomeClass(), SomeClass(), ChildClass(), SomeClass(field=5)]
+
+    assert len(tasks) == 2
+
+    data['field'] = 10
+
+    assert tasks[0]() == 5
+    assert len(reloads) == 1
+    assert [instance.field for instance in instances] == [10, 10, 10, 5]
+
+
+def test_wrong_storage_refresh_interval():
+    with pytest.raises(ValueError, match=match('The refresh interval must be a positive number.')):
+        class SomeClass(Storage, refresh_every=0):
+            pass
+
+
+def test_refresh_storage_applies_only_changed_fields():
+    changes = []
+    data = {'first': 1, 'second': 2}
+
+    class SomeClass(Storage, sources=[MemorySource(data)], refresh_every=1000):
+        first: int = Field(0, change_action=lambda old, new, storage: changes.append(('first', old, new)))
+        second: int = Field(0, change_action=lambda old, new, storage: changes.append(('second', old, new)))
+        third: int = Field(3, conversion=lambda x: x * 10)
+        fourth: int = Field(4)
+
+    instance = SomeClass(fourth=5)
+
+    assert refresh_storage(instance, ['first', 'second', 'third']) == {}
+    assert changes == []
+
+    data['first'] = 10
+    data['third'] = 30
+    data['fourth'] = 40
+    del data['second']
+
+    assert refresh_storage(instance, ['first', 'second', 'third']) == {'first': (1, 10), 'third': (30, 300)}
+    assert changes == [('first', 1, 10)]
+    assert instance.__values__ == {'first': 10, 'second': 2, 'third': 300, 'fourth': 5}
+
+
+def test_refresh_storage_is_atomic():
+    data = {'first': 1, 'second': 2}
+
+    class SomeClass(Storage, sources=[MemorySource(data)]):
+        first: int = Field(0, validation=lambda x: x < 100)
+        second: int = Field(0)
+        third: int = Field(1, conflicts={'second': lambda old, new, other_old, other_new: new == other_new})
+
+    instance = SomeClass()
+
+    data['first'] = 5
+    data['second'] = 'kek'
+    with pytest.raises(TypeError, match=match('The value of the "second" field did not pass the type check.')):
+        refresh_storage(instance, ['first', 'second', 'third'])
+
+    data['second'] = 3
+    data['first'] = 200
+    with pytest.raises(ValueError, match=match('The value 200 (int) of the "first" field does not match the validation.')):
+        refresh_storage(instance, ['first', 'second', 'third'])
+
+    assert instance.__values__ == {'first': 1, 'second': 2, 'third': 1}
+
+    data['first'] = 5
+    data['second'] = 1
+    with pytest.raises(ValueError, match=match('The new 1 (int) value of the "second" field conflicts with the 1 (int) value of the "third" field.')):
+        refresh_storage(instance, ['first', 'second', 'third'])
+
+    assert instance.__values__ == {'first': 1, 'second': 2, 'third': 1}
+
+    data['second'] = 3
+    data['third'] = 3
+    with pytest.raises(ValueError, match=match('The new 3 (int) value of the "second" field conflicts with the 3 (int) value of the "third" field.')):
+        refresh_storage(instance, ['first', 'second', 'third'])
+
+    assert instance.__values__ == {'first': 1, 'second': 2, 'third': 1}
+
+    data['third'] = 4
+    assert refresh_storage(instance, ['first', 'second', 'third']) == {'first': (1, 5), 'second': (2, 3), 'third': (1, 4)}
+
+
+def test_rejected_refresh_is_not_visible_to_readers():
+    data = {'first': 1, 'second': 2}
+    seen_values = []
+    instances = []
+
+    def checker(old, new, other_old, other_new):
+        for instance in instances:
+            seen_values.extend((instance.first, instance.second))
+        return new == other_new
+
+    class SomeClass(Storage, sources=[MemorySource(data)]):
+        first: int = Field(5, conflicts={'second': checker})
+        second: int = Field(0)
+
+    instances.append(SomeClass())
+
+    data['first'] = 3
+    data['second'] = 3
+    with pytest.raises(ValueError, match=match('The new 3 (int) value of the "first" field conflicts with the 3 (int) value of the "second" field.')):
+        refresh_storage(instances[0], ['first', 'second'])
+
+    assert set(seen_values) == {1, 2}
+    assert instances[0].__values__ == {'first': 1, 'second': 2}
+
+
+def test_refresh_storage_reloads_each_source_once(temporary_dir_path):
+    reloads = []
+
+    class ReloadCountingSource(MemorySource):
+        def reload(self):
+            reloads.append(self)
+            super().reload()
+
+    source = ReloadCountingSource({'first': 1})
+
+    class SomeClass(Storage, sources=[source]):
+        first: int = Field(0)
+        second: int = Field(0, sources=[ReloadCountingSource({}), ...])
+
+    instance = SomeClass()
+    refresh_storage(instance, ['first', 'second'])
+
+    assert len(reloads) == 2
+    assert reloads.count(source) == 1
+
+
+def test_storage_is_refreshed_in_background():
+    data = {'field': 1}
+    changed = Event()
+
+    class SomeClass(Storage, sources=[MemorySource(data)], refresh_every=0.01):
+        field: int = Field(0, change_action=lambda old, new, storage: changed.set())
+        other_field: int = Field(0)
+
+    instance = SomeClass(other_field=5)
+    data['field'] = 2
+    data['other_field'] = 3
+
+    assert changed.wait(5)
+    assert instance.field == 2
+    assert instance.other_field == 5
+
+
+def test_storage_refresh_task_backs_off_on_failures(monkeypatch):
+    tasks = []
+    monkeypatch.setattr(scheduler, 'schedule', lambda delay, task: tasks.append((delay, task)))
+    data = {'field': 1}
+
+    class SomeClass(Storage, sources=[MemorySource(data)], refresh_every=2):
+        field: int = Field(0)
+
+    instance = SomeClass()
+
+    assert len(tasks) == 1
+    delay, task = tasks[0]
+
+    assert delay == 2
+    assert task() == 2
+
+    data['field'] = 'kek'
+
+    assert [task() for _ in range(7)] == [4, 8, 16, 32, 64, 64, 64]
+    assert instance.field == 1
+
+    data['field'] = 5
+
+    assert task() == 2
+    assert instance.field == 5
+
+    del instance
+    gc.collect()
+
+    assert task() is None
+
+
+def test_storage_refresh_is_shared_by_instances(monkeypatch):
+    tasks = []
+    reloads = []
+    monkeypatch.setattr(scheduler, 'schedule', lambda delay, task: tasks.append(task))
+
+    class ReloadCountingSource(MemorySource):
+        def reload(self):
+            reloads.append(self)
+            super().reload()
+
+    data = {'field': 1, 'other_field': 2}
+    source = ReloadCountingSource(data)
+    field_source = ReloadCountingSource({})
+
+    class SomeClass(Storage, sources=[source], refresh_every=5):
+        field: int = Field(0)
+        other_field: int = Field(0, sources=[field_source, ...])
+
+    instances = [SomeClass(), SomeClass(), SomeClass(field=5)]
+
+    assert len(tasks) == 1
+
+    data['field'] = 10
+    data['other_field'] = 20
+
+    assert tasks[0]() == 5
+    assert len(reloads) == 2
+    assert set(reloads) == {source, field_source}
+    assert [(instance.field, instance.other_field) for instance in instances] == [(10, 20), (10, 20), (5, 20)]
+
+    instances.clear()
+    gc.collect()
+
+    assert tasks[0]() is None
+
+    SomeClass()
+
+    assert len(tasks) == 2
+
+
+def test_refresh_interval_is_not_inherited():
+    class SomeClass(Storage, refresh_every=5):
+        pass
+
+    class ChildClass(SomeClass):
+        pass
+
+    assert SomeClass.__refresh_every__ == 5
+    assert ChildClass.__refresh_every__ is None
+    assert SomeClass.__refresh_group__ is not None
+    assert ChildClass.__refresh_group__ is None
+
+
+def test_on_change_is_called_once_on_construction():
+    calls = []
+
+    class SomeClass(Storage, sources=[MemorySource({'first': 1})], on_change=lambda changes, storage: calls.append((changes, storage))):
+        first: int = Field(0)
+        second: int = Field(0)
+        third: list = Field(default_factory=list, lazy=True)
+
+    instance = SomeClass(second=2)
+
+    assert calls == [([Change('first', MISSING, 1), Change('second', MISSING, 2)], instance)]
+
+
+def test_on_change_is_called_after_assignment():
+    calls = []
+    lock_states = []
+
+    def on_change(changes, storage):
+        lock_states.append(storage.__locks__['first'].locked())
+        calls.append(changes)
+
+    class SomeClass(Storage, on_change=on_change):
+        first: int = Field(0)
+        second: int = Field(0)
+
+    instance = SomeClass()
+    calls.clear()
+
+    instance.first = 1
+    instance.first = 1
+    instance.second = 2
+
+    assert calls == [[Change('first', 0, 1)], [Change('second', 0, 2)]]
+    assert lock_states == [False, False, False]
+
+    with pytest.raises(TypeError):
+        instance.first = 'kek'
+
+    assert len(calls) == 2
+
+
+def test_on_change_is_called_once_for_refresh():
+    calls = []
+    lock_states = []
+    data = {'first': 1, 'second': 2}
+
+    def on_change(changes, storage):
+        lock_states.append(storage.__locks__['first'].locked() or storage.__locks__['second'].locked())
+        calls.append(changes)
+
+    class SomeClass(Storage, sources=[MemorySource(data)], on_change=on_change):
+        first: int = Field(0, change_action=lambda old, new, storage: lock_states.append(storage.__locks__['first'].locked()))
+        second: int = Field(0, refresh_every=1000)
+        third: int = Field(0)
+
+    instance = SomeClass()
+    calls.clear()
+    lock_states.clear()
+
+    refresh_storage(instance, ['first', 'second', 'third'])
+
+    assert calls == []
+
+    data['first'] = 10
+    data['second'] = 20
+
+    refresh_storage(instance, ['first', 'second', 'third'])
+
+    assert calls == [[Change('first', 1, 10), Change('second', 2, 20)]]
+    assert lock_states == [True, False]
+
+    data['second'] = 200
+    SomeClass.second.refresh(instance)
+
+    assert calls[1:] == [[Change('second', 20, 200)]]
+
+
+def test_on_change_is_not_inherited():
+    def on_change(changes, storage):
+        pass  # pragma: no cover
+
+    class SomeClass(Storage, on_change=on_change):
+        pass
+
+    class ChildClass(SomeClass):
+        pass
+
+    assert SomeClass.__on_change__ is on_change
+    assert ChildClass.__on_change__ is None
+
+
+def test_instances_are_not_tracked_by_default():
+    class SomeClass(Storage):
+        field: int = Field(0)
+
+    SomeClass()
+
+    assert SomeClass.__instances__ is None
+
+    with pytest.raises(ValueError, match=match('Instances of the SomeClass class are not tracked.')):
+        refresh_all(SomeClass)
+
+
+def test_tracked_instances_are_not_kept_alive():
+    class SomeClass(Storage, track_instances=True):
+        field: int = Field(0)
+
+    class ChildClass(SomeClass):
+        pass
+
+    first = SomeClass()
+    second = SomeClass(field=1)
+
+    with pytest.raises(TypeError):
+        SomeClass(field='kek')
+
+    assert set(SomeClass.__instances__) == {first, second}
+    assert ChildClass.__instances__ is None
+
+    del first
+    gc.collect()
+
+    assert list(SomeClass.__instances__) == [second]
+
+
+def test_refresh_all_instances():
+    reloads = []
+    data = {'field': 1, 'other_field': 2}
+
+    class ReloadCountingSource(MemorySource):
+        def reload(self):
+            reloads.append(self)
+            super().reload()
+
+    class SomeClass(Storage, sources=[ReloadCountingSource(data)], track_instances=True):
+        field: int = Field(0, validation=lambda x: x < 100)
+        other_field: int = Field(0)
+
+    instances = [SomeClass() for _ in range(10)]
+    explicit_instance = SomeClass(field=5)
+
+    data['field'] = 10
+    data['other_field'] = 20
+
+    assert refresh_all(SomeClass) == []
+    assert len(reloads) == 1
+    assert all(instance.field == 10 and instance.other_field == 20 for instance in instances)
+    assert explicit_instance.field == 5
+    assert explicit_instance.other_field == 20
+
+    data['field'] = 200
+
+    errors = refresh_all(SomeClass)
+
+    assert len(errors) == 10
+    assert {id(instance) for instance, _ in errors} == {id(instance) for instance in instances}
+    assert all(isinstance(error, ValueError) for _, error in errors)
+    assert explicit_instance.field == 5
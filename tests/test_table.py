@@ -0,0 +1,204 @@
+from array import array
+from typing import List, Optional
+
+import pytest
+from full_match import match
+
+from skelet import Storage, Field, StorageTable, Change, watch
+from skelet import table as table_module
+
+
+def test_empty_table():
+    class DeviceConfig(Storage):
+        name: str = Field(doc='the name of the device')
+        port: int = Field(80, validation=lambda x: 0 < x < 65536)
+        ratio: float = Field(0.5)
+        enabled: bool = Field(True)
+        tags: List[str] = Field(default_factory=list)
+        comment: Optional[str] = Field(None, conversion=lambda x: x.strip() if x is not None else x)
+
+    table = StorageTable(DeviceConfig)
+
+    assert len(table) == 0
+    assert list(table) == []
+
+    with pytest.raises(IndexError, match=match('The row index is out of range.')):
+        table[0]
+
+
+def test_values_are_stored_in_columns():
+    class DeviceConfig(Storage):
+        name: str = Field(doc='the name of the device')
+        port: int = Field(80, validation=lambda x: 0 < x < 65536)
+        ratio: float = Field(0.5)
+        enabled: bool = Field(True)
+        tags: List[str] = Field(default_factory=list)
+        comment: Optional[str] = Field(None, conversion=lambda x: x.strip() if x is not None else x)
+
+    table = StorageTable(DeviceConfig, [{'name': 'first'}, {'name': 'second', 'port': 8080, 'ratio': 1.5, 'comment': ' kek '}])
+    table.append(name='third', enabled=False, tags=['lol'])
+
+    assert len(table) == 3
+    assert isinstance(table.columns['port'], array)
+    assert isinstance(table.columns['ratio'], array)
+    assert isinstance(table.columns['name'], list)
+    assert table.columns['port'] == array('q', [80, 8080, 80])
+    assert table.columns['comment'] == [None, 'kek', None]
+    assert table.columns['tags'] == [[], [], ['lol']]
+    assert table.columns['tags'][0] is not table.columns['tags'][1]
+
+    row = table[1]
+
+    assert type(row) is DeviceConfig
+    assert row.name == 'second'
+    assert row.port == 8080
+    assert row.ratio == 1.5
+    assert row.enabled is True
+    assert row.comment == 'kek'
+    assert table[-1].enabled is False
+    assert repr(table[0]) == "DeviceConfig(name='first', port=80, ratio=0.5, enabled=True, tags=[], comment=None)"
+    assert [row.name for row in table] == ['first', 'second', 'third']
+
+
+def test_wrong_records_are_not_added():
+    class DeviceConfig(Storage):
+        name: str = Field(doc='the name of the device')
+        port: int = Field(80, validation=lambda x: 0 < x < 65536)
+        ratio: float = Field(0.5)
+        enabled: bool = Field(True)
+        tags: List[str] = Field(default_factory=list)
+        comment: Optional[str] = Field(None, conversion=lambda x: x.strip() if x is not None else x)
+
+    table = StorageTable(DeviceConfig, [{'name': 'first'}])
+
+    with pytest.raises(KeyError, match=match('\'The "kek" field is not defined.\'')):
+        table.append(name='second', kek=1)
+
+    with pytest.raises(ValueError, match=match('The value for the "name" field is undefined. Set the default value, or specify the value when creating the instance.')):
+        table.append(port=5)
+
+    with pytest.raises(TypeError, match=match('The value \'kek\' (str) of the "port" field does not match the type int.')):
+        table.extend([{'name': 'second'}, {'name': 'third', 'port': 'kek'}])
+
+    with pytest.raises(ValueError, match=match('The value 0 (int) of the "port" field does not match the validation.')):
+        table.extend([{'name': 'second'}, {'name': 'third', 'port': 0}])
+
+    assert len(table) == 1
+    assert all(len(column) == 1 for column in table.columns.values())
+
+
+def test_failed_batch_is_rolled_back_after_chunks(monkeypatch):
+    monkeypatch.setattr(table_module, 'CHUNK_SIZE', 2)
+
+    class DeviceConfig(Storage):
+        name: str = Field(doc='the name of the device')
+        port: int = Field(80, validation=lambda x: 0 < x < 65536)
+        ratio: float = Field(0.5)
+        enabled: bool = Field(True)
+        tags: List[str] = Field(default_factory=list)
+        comment: Optional[str] = Field(None, conversion=lambda x: x.strip() if x is not None else x)
+
+    table = StorageTable(DeviceConfig, [{'name': 'first'}])
+
+    with pytest.raises(ValueError):
+        table.extend([{'name': str(index)} for index in range(5)] + [{'name': 'wrong', 'port': -1}])
+
+    assert len(table) == 1
+    assert all(len(column) == 1 for column in table.columns.values())
+
+    table.extend([{'name': str(index)} for index in range(5)])
+
+    assert [row.name for row in table] == ['first', '0', '1', '2', '3', '4']
+
+
+def test_conflicts_are_checked():
+    class SomeClass(Storage):
+        minimum: int = Field(0, conflicts={'maximum': lambda old, new, other_old, other_new: new > other_new})
+        maximum: int = Field(10, share_mutex_with=['minimum'])
+        values: list = Field(default_factory=lambda: [1, 2], conflicts={'maximum': lambda old, new, other_old, other_new: len(new) > other_new}, reverse_conflicts=False)
+
+    table = StorageTable(SomeClass, [{'minimum': 5}])
+
+    with pytest.raises(ValueError, match=match('The new 11 (int) value of the "minimum" field conflicts with the 10 (int) value of the "maximum" field.')):
+        table.append(minimum=11)
+
+    with pytest.raises(ValueError, match=match('The [1, 2] (list) deferred default value of the "values" field conflicts with the 1 (int) value of the "maximum" field.')):
+        table.append(maximum=1)
+
+    with pytest.raises(ValueError, match=match('The new 4 (int) value of the "maximum" field conflicts with the 5 (int) value of the "minimum" field.')):
+        table[0].maximum = 4
+
+    assert len(table) == 1
+    assert table[0].maximum == 10
+    assert table.locks['values'] is table.locks['maximum']
+
+
+def test_rows_can_be_changed():
+    changes: List[Change] = []
+
+    class DeviceConfig(Storage, on_change=lambda changes_list, storage: changes.extend(changes_list)):
+        name: str = Field(doc='the name of the device')
+        port: int = Field(80, validation=lambda x: 0 < x < 65536)
+        ratio: float = Field(0.5)
+        enabled: bool = Field(True)
+        tags: List[str] = Field(default_factory=list)
+        comment: Optional[str] = Field(None, conversion=lambda x: x.strip() if x is not None else x)
+
+    table = StorageTable(DeviceConfig, [{'name': 'first'}, {'name': 'second'}])
+
+    row = table[1]
+    with watch(row) as subscription:
+        row.port = 443
+        row.comment = '  lol '
+
+    assert table[1].port == 443
+    assert table[0].port == 80
+    assert table[1].comment == 'lol'
+    assert list(subscription) == [Change('port', 80, 443), Change('comment', None, 'lol')]
+    assert changes == [Change('port', 80, 443), Change('comment', None, 'lol')]
+
+    with pytest.raises(ValueError, match=match('The value 0 (int) of the "port" field does not match the validation.')):
+        row.port = 0
+
+    assert table[1].port == 443
+
+
+def test_columns_that_do_not_fit_into_arrays_become_lists():
+    class SomeClass(Storage):
+        number: int = Field(0)
+        other_number: int = Field(0)
+        ratio: float = Field(0.0)
+
+    table = StorageTable(SomeClass, [{'number': 1, 'ratio': 1.0}])
+
+    table.append(number=2 ** 70)
+    table[0].other_number = True
+    table[0].ratio = 2.0
+
+    assert table.columns['number'] == [1, 2 ** 70]
+    assert table.columns['other_number'] == [True, 0]
+    assert table[0].other_number is True
+    assert table.columns['ratio'] == array('d', [2.0, 0.0])
+    assert table.array_types == {'ratio': float}
+
+    table[0].number = -2 ** 70
+
+    assert table[0].number == -2 ** 70
+
+
+def test_row_values_mapping():
+    class DeviceConfig(Storage):
+        name: str = Field(doc='the name of the device')
+        port: int = Field(80, validation=lambda x: 0 < x < 65536)
+        ratio: float = Field(0.5)
+        enabled: bool = Field(True)
+        tags: List[str] = Field(default_factory=list)
+        comment: Optional[str] = Field(None, conversion=lambda x: x.strip() if x is not None else x)
+
+    table = StorageTable(DeviceConfig, [{'name': 'first'}])
+    values = table[0].__values__
+
+    assert 'name' in values
+    assert 'kek' not in values
+    assert values.get('kek', 'default') == 'default'
+    assert values['name'] == 'first'
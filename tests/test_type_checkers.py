@@ -0,0 +1,137 @@
+import sys
+from typing import List, Dict, Tuple, Union, Optional, Literal, Any, TypeVar
+
+import pytest
+from full_match import match
+from simtypes import check
+
+from skelet import Storage, Field, NaturalNumber, NonNegativeInt
+from skelet.type_checkers import compile_type_checker, get_type_checker
+
+
+T = TypeVar('T')
+
+HINTS: List[Any] = [
+    Any,
+    None,
+    int,
+    str,
+    float,
+    bool,
+    list,
+    dict,
+    tuple,
+    NaturalNumber,
+    NonNegativeInt,
+    List,
+    List[int],
+    List[Any],
+    List[List[str]],
+    Dict,
+    Dict[str, int],
+    Dict[str, List[int]],
+    Tuple,
+    Tuple[int, ...],
+    Tuple[int, str],
+    Tuple[int, List[str]],
+    Union[int, str],
+    Union[int, None],
+    Optional[str],
+    Optional[List[int]],
+    Union[NaturalNumber, str],
+    Union[List[int], Dict[str, int]],
+]
+
+if sys.version_info >= (3, 10):
+    HINTS.extend([int | str, int | None, list[int], dict[str, int], tuple[int, ...]])
+
+VALUES = [
+    None,
+    0,
+    1,
+    -1,
+    True,
+    1.5,
+    'kek',
+    b'kek',
+    [],
+    [1, 2],
+    ['1', '2'],
+    [[1], ['2']],
+    [['1'], ['2']],
+    {},
+    {'lol': 1},
+    {'lol': 'kek'},
+    {'lol': [1, 2]},
+    {1: 1},
+    (),
+    (1, 2),
+    (1, '2'),
+    (1, ['2']),
+    (1, 2, 3),
+]
+
+
+@pytest.mark.parametrize('strict', [True, False])
+@pytest.mark.parametrize('hint', HINTS)
+def test_compiled_checkers_are_equivalent_to_generic_check(hint, strict):
+    checker = compile_type_checker(hint, strict=strict)
+
+    for value in VALUES:
+        assert checker(value) == check(value, hint, strict=strict), (hint, value)
+
+
+def test_compiled_checker_for_literal():
+    checker = compile_type_checker(Literal[1, 'kek', None])
+
+    assert checker(1)
+    assert checker('kek')
+    assert checker(None)
+
+    assert not checker(2)
+    assert not checker(True)
+    assert not checker(1.0)
+    assert not checker('lol')
+    assert not checker([1])
+
+
+def test_fallback_to_generic_check():
+    checker = compile_type_checker(T)
+
+    with pytest.raises(ValueError, match=match('Type must be a valid type object.')):
+        checker(1)
+
+
+def test_checkers_are_cached():
+    assert get_type_checker(List[int], strict=True) is get_type_checker(List[int], strict=True)
+    assert get_type_checker(List[int], strict=True) is not get_type_checker(List[int])
+
+
+def test_checkers_for_unhashable_hints_are_not_cached():
+    class UnhashableMeta(type):
+        __hash__ = None
+
+    class UnhashableType(metaclass=UnhashableMeta):
+        pass
+
+    assert get_type_checker(UnhashableType) is not get_type_checker(UnhashableType)
+    assert get_type_checker(UnhashableType)(UnhashableType())
+
+
+def test_literal_field():
+    class SomeClass(Storage):
+        field: Literal['debug', 'info'] = Field('info')
+
+    instance = SomeClass()
+
+    instance.field = 'debug'
+
+    assert instance.field == 'debug'
+
+    if sys.version_info < (3, 10):
+        type_representation = 'typing.Literal'
+    else:
+        type_representation = 'Literal'
+
+    with pytest.raises(TypeError, match=match(f'The value \'warning\' (str) of the "field" field does not match the type {type_representation}.')):
+        instance.field = 'warning'
@@ -0,0 +1,96 @@
+from typing import List
+
+import pytest
+from full_match import match
+
+from skelet import Storage, Field, EnvSource, validate_many, ValidationResult
+from skelet.validation import check_record, validate_chunk
+
+
+class Record(Storage, sources=[EnvSource()]):
+    name: str = Field()  # type: ignore[assignment]
+    port: int = Field(80, validation=lambda x: 0 < x < 65536)  # type: ignore[assignment]
+    tags: List[str] = Field(default_factory=list, conversion=lambda x: [tag.lower() for tag in x])  # type: ignore[assignment]
+    minimum: int = Field(0, conflicts={'port': lambda old, new, other_old, other_new: new > other_new})  # type: ignore[assignment]
+
+
+RECORDS = [
+    {'name': 'first'},
+    {'name': 'second', 'port': 8080, 'tags': ['LOL', 'Kek']},
+    {'port': 5},
+    {'name': 'third', 'port': 'kek'},
+    {'name': 'fourth', 'port': 0},
+    {'name': 'fifth', 'kek': 1},
+    {'name': 'sixth', 'port': 10, 'minimum': 11},
+]
+
+
+def check_results(results):
+    assert results[0] == ValidationResult({'name': 'first', 'port': 80, 'tags': [], 'minimum': 0}, None)
+    assert results[1] == ValidationResult({'name': 'second', 'port': 8080, 'tags': ['lol', 'kek'], 'minimum': 0}, None)
+
+    errors = [result.error for result in results[2:]]
+
+    assert all(result.values is None for result in results[2:])
+    assert [type(error) for error in errors] == [ValueError, TypeError, ValueError, KeyError, ValueError]
+    assert [str(error) for error in errors] == [
+        'The value for the "name" field is undefined. Set the default value, or specify the value when creating the instance.',
+        'The value \'kek\' (str) of the "port" field does not match the type int.',
+        'The value 0 (int) of the "port" field does not match the validation.',
+        '\'The "kek" field is not defined.\'',
+        'The new 10 (int) value of the "port" field conflicts with the 11 (int) value of the "minimum" field.',
+    ]
+
+
+def test_validate_many_in_place(monkeypatch):
+    monkeypatch.setenv('NAME', 'from_environment')
+
+    results = validate_many(Record, iter(RECORDS))
+
+    assert next(results) == ValidationResult({'name': 'first', 'port': 80, 'tags': [], 'minimum': 0}, None)
+    check_results([ValidationResult({'name': 'first', 'port': 80, 'tags': [], 'minimum': 0}, None), *results])
+
+
+@pytest.mark.parametrize(
+    ['chunk_size'],
+    [
+        (1,),
+        (3,),
+        (1000,),
+    ],
+)
+def test_validate_many_in_processes(chunk_size):
+    check_results(list(validate_many(Record, RECORDS * 3, processes=2, chunk_size=chunk_size))[:len(RECORDS)])
+    assert len(list(validate_many(Record, RECORDS * 3, processes=1, chunk_size=chunk_size))) == len(RECORDS) * 3
+
+
+def test_validate_many_with_empty_input():
+    assert list(validate_many(Record, [])) == []
+    assert list(validate_many(Record, [], processes=2)) == []
+
+
+def test_validate_chunk():
+    check_results(validate_chunk(Record, RECORDS))
+
+
+def test_wrong_arguments():
+    with pytest.raises(ValueError, match=match('The number of processes must be a positive number.')):
+        validate_many(Record, RECORDS, processes=0)
+
+    with pytest.raises(ValueError, match=match('The chunk size must be a positive number.')):
+        validate_many(Record, RECORDS, chunk_size=0)
+
+
+def test_check_record_without_conflicts():
+    assert check_record(Record, {'name': 'kek', 'port': 10, 'minimum': 11}, with_conflicts=False) == {'name': 'kek', 'port': 10, 'tags': [], 'minimum': 11}
+
+
+def test_deferred_default_conflicts():
+    class SomeClass(Storage):
+        maximum: int = Field(10)
+        values: list = Field(default_factory=lambda: [1, 2], conflicts={'maximum': lambda old, new, other_old, other_new: len(new) > other_new}, reverse_conflicts=False)
+
+    with pytest.raises(ValueError, match=match('The [1, 2] (list) deferred default value of the "values" field conflicts with the 1 (int) value of the "maximum" field.')):
+        check_record(SomeClass, {'maximum': 1})
+
+    assert check_record(SomeClass, {'values': [1, 2, 3]}) == {'maximum': 10, 'values': [1, 2, 3]}
@@ -0,0 +1,323 @@
+import asyncio
+from threading import Thread
+
+import pytest
+from full_match import match
+
+from skelet import Storage, Field, MemorySource, watch, Change
+from skelet.storage import refresh_storage
+
+
+def test_wrong_arguments():
+    class SomeClass(Storage):
+        first: int = Field(0)
+        second: int = Field(0)
+        third: str = Field('')
+
+    instance = SomeClass()
+
+    with pytest.raises(ValueError, match=match('The maximum size of the queue must be a positive number.')):
+        watch(instance, max_size=0)
+
+    with pytest.raises(KeyError, match=match('\'The "kek" field is not defined.\'')):
+        watch(instance, 'first', 'kek')
+
+    assert instance.__subscriptions__ == ()
+
+
+def test_watch_all_fields():
+    class SomeClass(Storage):
+        first: int = Field(0)
+        second: int = Field(0)
+        third: str = Field('')
+
+    instance = SomeClass()
+    subscription = watch(instance)
+
+    instance.first = 1
+    instance.first = 1
+    instance.third = 'kek'
+    subscription.close()
+
+    assert list(subscription) == [Change('first', 0, 1), Change('third', '', 'kek')]
+
+
+def test_watch_selected_fields():
+    class SomeClass(Storage):
+        first: int = Field(0)
+        second: int = Field(0)
+        third: str = Field('')
+
+    instance = SomeClass()
+
+    with watch(instance, 'second') as subscription:
+        instance.first = 1
+        instance.second = 2
+
+    assert list(subscription) == [Change('second', 0, 2)]
+
+
+def test_closed_subscription_is_forgotten():
+    class SomeClass(Storage):
+        first: int = Field(0)
+        second: int = Field(0)
+        third: str = Field('')
+
+    instance = SomeClass()
+    subscription = watch(instance)
+    other_subscription = watch(instance)
+
+    assert instance.__subscriptions__ == (subscription, other_subscription)
+
+    subscription.close()
+    instance.first = 1
+
+    assert instance.__subscriptions__ == (other_subscription,)
+    assert list(subscription) == []
+
+    other_subscription.close()
+
+    assert list(other_subscription) == [Change('first', 0, 1)]
+    assert type(instance)().__subscriptions__ == ()
+
+
+def test_overflow_coalesces_changes_of_the_same_field():
+    class SomeClass(Storage):
+        first: int = Field(0)
+        second: int = Field(0)
+        third: str = Field('')
+
+    instance = SomeClass()
+    subscription = watch(instance, max_size=2)
+
+    instance.first = 1
+    instance.second = 1
+    instance.first = 2
+    instance.first = 3
+    subscription.close()
+
+    assert list(subscription) == [Change('second', 0, 1), Change('first', 0, 3)]
+
+
+def test_overflow_drops_oldest_changes():
+    class SomeClass(Storage):
+        first: int = Field(0)
+        second: int = Field(0)
+        third: str = Field('')
+
+    instance = SomeClass()
+    subscription = watch(instance, max_size=2)
+
+    instance.first = 1
+    instance.second = 1
+    instance.third = 'kek'
+    subscription.close()
+
+    assert list(subscription) == [Change('second', 0, 1), Change('third', '', 'kek')]
+
+
+def test_changes_are_not_queued_after_closing():
+    class SomeClass(Storage):
+        first: int = Field(0)
+        second: int = Field(0)
+        third: str = Field('')
+
+    subscription = watch(SomeClass())
+    subscription.close()
+    subscription.put(Change('first', 0, 1))
+
+    assert list(subscription) == []
+
+
+def test_iterator_waits_for_changes():
+    class SomeClass(Storage):
+        first: int = Field(0)
+        second: int = Field(0)
+        third: str = Field('')
+
+    instance = SomeClass()
+    subscription = watch(instance)
+    changes = []
+
+    def consume():
+        for change in subscription:
+            changes.append(change)
+            if len(changes) == 2:
+                subscription.close()
+
+    thread = Thread(target=consume)
+    thread.start()
+
+    instance.first = 1
+    instance.second = 2
+    thread.join(5)
+
+    assert not thread.is_alive()
+    assert changes == [Change('first', 0, 1), Change('second', 0, 2)]
+
+
+def test_async_iterator():
+    class SomeClass(Storage):
+        first: int = Field(0)
+        second: int = Field(0)
+        third: str = Field('')
+
+    instance = SomeClass()
+    subscription = watch(instance)
+
+    async def consume():
+        changes = []
+        async for change in subscription:
+            changes.append(change)
+        return changes
+
+    async def main():
+        task = asyncio.ensure_future(consume())
+        await asyncio.sleep(0)
+        instance.first = 1
+        await asyncio.sleep(0)
+        thread = Thread(target=lambda: setattr(instance, 'second', 2))
+        thread.start()
+        thread.join()
+        await asyncio.sleep(0)
+        subscription.close()
+        return await task
+
+    assert asyncio.run(main()) == [Change('first', 0, 1), Change('second', 0, 2)]
+
+
+def test_cancelled_async_waiter_is_ignored():
+    class SomeClass(Storage):
+        first: int = Field(0)
+        second: int = Field(0)
+        third: str = Field('')
+
+    instance = SomeClass()
+    subscription = watch(instance)
+
+    async def main():
+        task = asyncio.ensure_future(subscription.__anext__())
+        await asyncio.sleep(0)
+        task.cancel()
+        await asyncio.sleep(0)
+        instance.first = 1
+        await asyncio.sleep(0)
+        return await subscription.__anext__()
+
+    assert asyncio.run(main()) == Change('first', 0, 1)
+
+
+def test_waiter_cancelled_after_wake_up():
+    class SomeClass(Storage):
+        first: int = Field(0)
+        second: int = Field(0)
+        third: str = Field('')
+
+    instance = SomeClass()
+    subscription = watch(instance)
+
+    async def main():
+        task = asyncio.ensure_future(subscription.__anext__())
+        await asyncio.sleep(0)
+        instance.first = 1
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        return await subscription.__anext__()
+
+    assert asyncio.run(main()) == Change('first', 0, 1)
+    assert subscription.waiters == []
+
+
+def test_timed_out_async_waiter_is_forgotten():
+    class SomeClass(Storage):
+        first: int = Field(0)
+        second: int = Field(0)
+        third: str = Field('')
+
+    instance = SomeClass()
+    subscription = watch(instance)
+
+    async def main():
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(subscription.__anext__(), 0.01)
+
+    asyncio.run(main())
+
+    assert subscription.waiters == []
+
+    instance.first = 2
+    instance.first = 3
+
+    assert list(subscription.queue) == [Change('first', 0, 2), Change('first', 2, 3)]
+
+
+def test_waiters_of_closed_loops_do_not_break_assignments():
+    class SomeClass(Storage):
+        first: int = Field(0)
+        second: int = Field(0)
+        third: str = Field('')
+
+    instance = SomeClass()
+    subscription = watch(instance)
+
+    for cancel in (True, False):
+        loop = asyncio.new_event_loop()
+        future = loop.create_future()
+        if cancel:
+            future.cancel()
+        loop.close()
+        subscription.waiters.append((loop, future))
+
+    instance.first = 1
+
+    assert subscription.waiters == []
+    assert next(subscription) == Change('first', 0, 1)
+
+
+def test_delivery_errors_do_not_break_assignments():
+    class BrokenLoop:
+        def is_closed(self):
+            return False
+
+        def call_soon_threadsafe(self, *args):
+            raise RuntimeError('Event loop is closed')
+
+    class SomeClass(Storage):
+        first: int = Field(0)
+        second: int = Field(0)
+        third: str = Field('')
+
+    instance = SomeClass()
+    subscription = watch(instance)
+    loop = asyncio.new_event_loop()
+    subscription.waiters.append((BrokenLoop(), loop.create_future()))
+    loop.close()
+
+    instance.first = 1
+    instance.first = 2
+
+    assert subscription.waiters == []
+    subscription.close()
+
+    assert list(subscription) == [Change('first', 0, 1), Change('first', 1, 2)]
+
+
+def test_refreshed_values_are_published():
+    data = {'first': 1}
+
+    class SourcedClass(Storage, sources=[MemorySource(data)]):
+        first: int = Field(0, refresh_every=1000)
+        second: int = Field(0)
+
+    instance = SourcedClass()
+    subscription = watch(instance)
+
+    data['first'] = 2
+    SourcedClass.first.refresh(instance)
+    data['first'] = 3
+    data['second'] = 4
+    refresh_storage(instance, ['first', 'second'])
+    subscription.close()
+
+    assert list(subscription) == [Change('first', 1, 2), Change('first', 2, 3), Change('second', 0, 4)]